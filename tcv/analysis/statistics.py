@@ -0,0 +1,279 @@
+import numpy as np
+
+from tcv.calculation.result.GridResultTable import GridResultTable, table_from_records
+
+DEFAULT_PERCENTILES = (5.0, 50.0, 95.0)
+
+
+def _as_table(results) -> GridResultTable:
+    """
+    Bring the results into columnar form
+
+    Parameters:
+        results: Either a GridResultTable or records, i.e. dictionaries with the operating point and the result object
+
+    Returns:
+        GridResultTable: The table
+    """
+    return results if isinstance(results, GridResultTable) else table_from_records(list(results))
+
+
+def _group(table: GridResultTable, by: tuple, bands: dict) -> tuple:
+    """
+    Assign each row of the table to a group
+
+    Parameters:
+        table (GridResultTable): The table
+        by (tuple): Key names to group by, e.g. ('tap_pos',). An empty tuple puts all rows into one group.
+        bands (dict): Mapping from key name to the width of it's bands. The value of those keys is replaced by the lower
+            bound of it's band, e.g. -150.0 for p_mv = -142.0 MW and a width of 50.0 MW.
+
+    Returns:
+        tuple: The labels of the groups and the index of the group of each row
+    """
+    if len(by) == 0:
+        return [()], np.zeros(len(table), dtype=np.int64)
+    values, codes = [], []
+    for name in by:
+        if name not in table.KEY_NAMES:
+            raise ValueError("'%s' is not a key of the operating point. Choose one of %s." % (name, table.KEY_NAMES))
+        column = table[name]
+        if name in bands:
+            column = np.floor(column / bands[name]) * bands[name]
+        unique, inverse = np.unique(column, return_inverse=True)
+        values.append(unique.tolist())
+        codes.append(inverse.reshape(-1))
+    packed = np.ravel_multi_index(tuple(codes), tuple(len(unique) for unique in values))
+    groups, ids = np.unique(packed, return_inverse=True)
+    labels = [tuple(values[idx][code] for idx, code in enumerate(entry)) for entry in
+              zip(*np.unravel_index(groups, tuple(len(unique) for unique in values)))]
+    return labels, ids.reshape(-1)
+
+
+def _label(label: tuple):
+    """
+    Key of a group within the handed back statistics
+
+    Parameters:
+        label (tuple): Values of the key names, the rows are grouped by
+
+    Returns:
+        The only value, if the rows are grouped by one key name, otherwise the tuple itself
+    """
+    return label[0] if len(label) == 1 else label
+
+
+def _operating_point(table: GridResultTable, row: int) -> dict:
+    """
+    Operating point of one row of the table
+
+    Parameters:
+        table (GridResultTable): The table
+        row (int): Index of the row
+
+    Returns:
+        dict: Mapping from key name to plain value, e.g. {'tap_pos': 2, 'p_lv': -0.5}
+    """
+    return {name: table[name][row].item() for name in table.KEY_NAMES}
+
+
+def _reduce(table: GridResultTable, ids: np.ndarray, amount: int, fields: tuple):
+    """
+    Reduce each field within all groups at once. The rows are sorted by group once, so that each group occupies one
+    segment, and the segments are reduced with numpy's reduceat.
+
+    Parameters:
+        table (GridResultTable): The table
+        ids (np.ndarray): Index of the group of each row (cf. _group)
+        amount (int): Amount of groups
+        fields (tuple): Result fields to reduce
+
+    Returns:
+        generator: Pairs of field name and a dictionary with the field's 'values' and their 'groups' sorted by group,
+            the 'starts' of the segments and per group the 'count', 'mean', sum of squared deviations from the mean
+            ('m2'), 'max', 'min' and the row of the maximum absolute value ('largest'). Of equal magnitudes, the first
+            row is taken.
+    """
+    order = np.argsort(ids, kind='stable')
+    counts = np.bincount(ids, minlength=amount)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    sorted_ids = ids[order]
+    for field in fields:
+        values = table[field][order]
+        means = np.add.reduceat(values, starts) / counts
+        by_magnitude = np.lexsort((-np.abs(values), sorted_ids))
+        yield field, {
+            'values': values,
+            'groups': sorted_ids,
+            'starts': starts,
+            'count': counts,
+            'mean': means,
+            'm2': np.add.reduceat((values - means[sorted_ids]) ** 2, starts),
+            'max': np.maximum.reduceat(values, starts),
+            'min': np.minimum.reduceat(values, starts),
+            'largest': order[by_magnitude[starts]]
+        }
+
+
+def summarize(results, fields: tuple = None, by: tuple = ('tap_pos',), bands: dict = None,
+              percentiles: tuple = DEFAULT_PERCENTILES) -> dict:
+    """
+    Compute error measures of all fields within each group of operating points, e.g. of the differences between two
+    result sets (cf. diff_results). All groups are reduced at once on the rows sorted by group.
+
+    Parameters:
+        results: Either a GridResultTable or records, i.e. dictionaries with the operating point and the result object
+        fields (tuple): Result fields to assess. None assesses all fields of the result class.
+        by (tuple): Key names to group by, e.g. ('tap_pos',) or ('tap_pos', 'p_mv'). An empty tuple assesses all rows
+            as one group.
+        bands (dict): Mapping from key name to the width of it's bands, e.g. {'p_mv': 50.0}. The rows are grouped by
+            the lower bound of the band instead of the exact value.
+        percentiles (tuple): Percentiles to determine, in the range from 0 to 100
+
+    Returns:
+        dict: Mapping from group label (the key's value or a tuple of them) to field name to a dictionary with the
+            amount of values, 'max', 'min', 'mean', 'std', 'rmse', 'max_abs', the operating point of the maximum
+            absolute value ('argmax') and the 'percentiles'
+    """
+    table = _as_table(results)
+    fields = table.RESULT_CLASS.FIELDS if fields is None else tuple(fields)
+    labels, ids = _group(table, tuple(by), bands if bands is not None else {})
+    if len(table) == 0:
+        return {}
+    out = {_label(label): {} for label in labels}
+    for field, reduced in _reduce(table, ids, len(labels), fields):
+        values, starts, counts, largest = reduced['values'], reduced['starts'], reduced['count'], reduced['largest']
+        squares = np.add.reduceat(values * values, starts) / counts
+        # Sort by group and value within the group, so that order statistics are taken from the segments
+        ascending = values[np.lexsort((values, reduced['groups']))]
+        quantiles = {}
+        for percentile in percentiles:
+            position = starts + percentile / 100.0 * (counts - 1)
+            lower = np.floor(position).astype(np.int64)
+            upper = np.minimum(lower + 1, starts + counts - 1)
+            quantiles[percentile] = ascending[lower] + (position - lower) * (ascending[upper] - ascending[lower])
+
+        for idx, label in enumerate(labels):
+            out[_label(label)][field] = {
+                'count': int(counts[idx]),
+                'max': float(reduced['max'][idx]),
+                'min': float(reduced['min'][idx]),
+                'mean': float(reduced['mean'][idx]),
+                'std': float(np.sqrt(reduced['m2'][idx] / counts[idx])),
+                'rmse': float(np.sqrt(squares[idx])),
+                'max_abs': float(abs(table[field][largest[idx]])),
+                'argmax': _operating_point(table, largest[idx]),
+                'percentiles': {percentile: float(quantiles[percentile][idx]) for percentile in percentiles}
+            }
+    return out
+
+
+class StreamingStatistics:
+    """
+    Error measures of all fields within each group of operating points, that are updated chunk by chunk, so that
+    result sets larger than the memory can be assessed, e.g. while reading them lazily with read_json_lines. The
+    means and variances are updated with Welford's algorithm in it's parallel form (Chan et al.), i.e. each chunk is
+    reduced group wise and merged into the running values. Percentiles require all values and are not available.
+    """
+
+    def __init__(self, fields: tuple = None, by: tuple = ('tap_pos',), bands: dict = None):
+        """
+        Constructor for the class
+
+        Parameters:
+            fields (tuple): Result fields to assess. None assesses all fields of the result class.
+            by (tuple): Key names to group by (cf. summarize)
+            bands (dict): Mapping from key name to the width of it's bands (cf. summarize)
+        """
+        self.fields = None if fields is None else tuple(fields)
+        self.by = tuple(by)
+        self.bands = bands if bands is not None else {}
+        # Mapping from group label to mapping from field to running values
+        self.groups = {}
+
+    def update(self, results):
+        """
+        Merge a chunk of results into the running values
+
+        Parameters:
+            results: Either a GridResultTable or records, i.e. dictionaries with the operating point and the result
+                object
+        """
+        table = _as_table(results)
+        if len(table) == 0:
+            return
+        if self.fields is None:
+            self.fields = table.RESULT_CLASS.FIELDS
+        labels, ids = _group(table, self.by, self.bands)
+        for field, reduced in _reduce(table, ids, len(labels), self.fields):
+            largest = reduced['largest']
+            for idx, label in enumerate(labels):
+                self.__merge(_label(label), field, int(reduced['count'][idx]), float(reduced['mean'][idx]),
+                             float(reduced['m2'][idx]), float(reduced['max'][idx]), float(reduced['min'][idx]),
+                             float(abs(table[field][largest[idx]])), _operating_point(table, largest[idx]))
+
+    def consume(self, records, chunk_size: int = 65536) -> int:
+        """
+        Merge all records of an iterable, e.g. a lazily read result file, chunk by chunk
+
+        Parameters:
+            records (iterable): Dictionaries with the operating point and the result object
+            chunk_size (int): Amount of records to reduce at once
+
+        Returns:
+            int: Amount of consumed records
+        """
+        amount = 0
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                self.update(chunk)
+                amount += len(chunk)
+                chunk = []
+        self.update(chunk)
+        return amount + len(chunk)
+
+    def result(self) -> dict:
+        """
+        The current error measures
+
+        Returns:
+            dict: Mapping from group label to field name to a dictionary with the amount of values, 'max', 'min',
+                'mean', 'std', 'rmse', 'max_abs' and the operating point of the maximum absolute value ('argmax'), as
+                summarize hands them back apart from the percentiles
+        """
+        out = {}
+        for label in sorted(self.groups.keys()):
+            out[label] = {}
+            for field, state in self.groups[label].items():
+                count, mean, m2 = state['count'], state['mean'], state['m2']
+                out[label][field] = {
+                    'count': count,
+                    'max': state['max'],
+                    'min': state['min'],
+                    'mean': mean,
+                    'std': float(np.sqrt(m2 / count)),
+                    'rmse': float(np.sqrt(mean * mean + m2 / count)),
+                    'max_abs': state['max_abs'],
+                    'argmax': state['argmax']
+                }
+        return out
+
+    def __merge(self, label, field: str, count: int, mean: float, m2: float, maximum: float, minimum: float,
+                max_abs: float, argmax: dict):
+        state = self.groups.setdefault(label, {}).get(field)
+        if state is None:
+            self.groups[label][field] = {'count': count, 'mean': mean, 'm2': m2, 'max': maximum, 'min': minimum,
+                                         'max_abs': max_abs, 'argmax': argmax}
+            return
+        total = state['count'] + count
+        delta = mean - state['mean']
+        state['mean'] += delta * count / total
+        state['m2'] += m2 + delta * delta * state['count'] * count / total
+        state['count'] = total
+        state['max'] = max(state['max'], maximum)
+        state['min'] = min(state['min'], minimum)
+        if max_abs > state['max_abs']:
+            state['max_abs'] = max_abs
+            state['argmax'] = argmax
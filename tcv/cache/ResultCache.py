@@ -0,0 +1,354 @@
+import hashlib
+import inspect
+import json
+import logging
+import os
+import shutil
+import time
+from importlib.metadata import version, PackageNotFoundError
+
+from tcv.calculation.powersystemdatamodel.model.TimeSeriesResult import SIDECAR_DIRECTORY_NAME
+from tcv.calculation.result.GridResultThreeWinding import GridResultThreeWinding
+from tcv.calculation.result.GridResultTwoWinding import GridResultTwoWinding
+from tcv.calculation.sink.Checkpoint import parameter_hash, json_default
+from tcv.calculation.sink.ColumnarSink import ColumnarSink, read_columnar, records_from_columns
+from tcv.calculation.sink.ResultSink import consume
+
+META_FILE_NAME = "meta.json"
+DATA_DIRECTORY_NAME = "data"
+RESULT_CLASSES = {result_class.__name__: result_class for result_class in
+                  (GridResultTwoWinding, GridResultThreeWinding)}
+
+# Arguments of the test benches, that change how a sweep is calculated, but not it's results
+SOLVER_ARGUMENTS = ('warm_start', 'workers', 'cache_admittances', 'fast_extraction', 'checkpoint_directory', 'resume',
+                    'checkpoint_every')
+
+
+def default_directory() -> str:
+    """
+    Directory of the result cache, if none is given explicitly. It may be set with the environment variable
+    'TCV_CACHE_DIR' and defaults to '~/.cache/tcv'.
+
+    Returns:
+        str: Path to the cache directory
+    """
+    return os.environ.get("TCV_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "tcv"))
+
+
+def pandapower_fingerprint() -> dict:
+    """
+    Fingerprint of the pandapower engine
+
+    Returns:
+        dict: Engine name and installed version
+    """
+    try:
+        pandapower_version = version("pandapower")
+    except PackageNotFoundError:
+        pandapower_version = None
+    return {'engine': 'pandapower', 'version': pandapower_version}
+
+
+def simona_fingerprint(output_directory: str) -> dict:
+    """
+    Fingerprint of a SIMONA output directory. It covers relative path, size and modification time of every file
+    within the directory, so that it changes as soon as a file is added, removed or rewritten, without reading all
+    of the files' content.
+
+    Parameters:
+        output_directory (str): Directory with SIMONA's csv output (e.g. the base directory of all tap positions)
+
+    Returns:
+        dict: Engine name and digest of the directory's content
+    """
+    digest = hashlib.sha256()
+    for root, directories, files in os.walk(output_directory):
+        # The parsed tables, that TimeSeriesResult stores next to the result files, aren't part of the output
+        directories[:] = sorted(directory for directory in directories if
+                                not directory.startswith(SIDECAR_DIRECTORY_NAME))
+        for file_name in sorted(files):
+            path = os.path.join(root, file_name)
+            stat = os.stat(path)
+            digest.update(("%s|%i|%i\n" % (os.path.relpath(path, output_directory), stat.st_size,
+                                           stat.st_mtime_ns)).encode("utf-8"))
+    return {'engine': 'simona', 'directory': digest.hexdigest()}
+
+
+def powerfactory_fingerprint(export_file: str) -> dict:
+    """
+    Fingerprint of a PowerFactory export (e.g. the project export or the results written by the PowerFactory
+    scripts). The file is hashed as a whole.
+
+    Parameters:
+        export_file (str): Path to the exported file
+
+    Returns:
+        dict: Engine name and digest of the file's content
+    """
+    digest = hashlib.sha256()
+    with open(export_file, "rb") as file_to_read:
+        for block in iter(lambda: file_to_read.read(1 << 20), b""):
+            digest.update(block)
+    return {'engine': 'powerfactory', 'export': digest.hexdigest()}
+
+
+def _size_of(directory: str) -> int:
+    """
+    Total size of all files within a directory and it's subdirectories
+
+    Parameters:
+        directory (str): The directory
+
+    Returns:
+        int: Size in bytes
+    """
+    return sum(os.path.getsize(os.path.join(root, file_name)) for root, _, files in os.walk(directory) for file_name
+               in files)
+
+
+class ResultCache:
+    """
+    Content addressed on-disk cache of complete sweep results. An entry is addressed by the hash of the engine's
+    fingerprint (cf. pandapower_fingerprint, simona_fingerprint and powerfactory_fingerprint), the grid parameters
+    (e.g. TestGrid.TWO_WINDING_TRANSFORMER) and the arguments of the sweep. Hence, an entry never has to be invalidated
+    manually: As soon as anything changes, another entry is addressed.
+
+    Each entry is stored column by column (cf. ColumnarSink), so that it can be mapped into memory within
+    milliseconds. The total size of the cache is capped. If it is exceeded, the least recently used entries are
+    evicted.
+    """
+
+    logger = logging.getLogger()
+
+    def __init__(self, directory: str = None, max_size_bytes: int = 1 << 30):
+        """
+        Constructor for the class
+
+        Parameters:
+            directory (str): Directory of the cache (cf. default_directory)
+            max_size_bytes (int): Maximum total size of all entries in bytes
+        """
+        self.directory = directory if directory is not None else default_directory()
+        self.max_size_bytes = max_size_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(engine: dict, grid: dict, sweep: dict) -> str:
+        """
+        Address of the results of a sweep
+
+        Parameters:
+            engine (dict): Fingerprint of the engine, that calculates the results
+            grid (dict): Parameters of the test grid
+            sweep (dict): Arguments of the sweep
+
+        Returns:
+            str: Hexadecimal SHA-256 digest
+        """
+        return parameter_hash({'engine': engine, 'grid': grid, 'sweep': sweep})
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(os.path.join(self.directory, key, META_FILE_NAME))
+
+    def get(self, key: str) -> list:
+        """
+        Load the records of a cached sweep
+
+        Parameters:
+            key (str): Address of the entry
+
+        Returns:
+            list: The records or None, if the entry doesn't exist
+        """
+        meta = self.inspect(key)
+        if meta is None:
+            return None
+        columns = self.get_columns(key)
+        if meta['records'] == 0:
+            return []
+        return records_from_columns(columns, RESULT_CLASSES[meta['result_class']])
+
+    def get_columns(self, key: str) -> dict:
+        """
+        Map the columns of a cached sweep into memory
+
+        Parameters:
+            key (str): Address of the entry
+
+        Returns:
+            dict: Mapping from column name to array or None, if the entry doesn't exist
+        """
+        meta = self.inspect(key)
+        if meta is None:
+            return None
+        meta['last_access'] = time.time()
+        self.__write_meta(os.path.join(self.directory, key), meta)
+        if meta['records'] == 0:
+            return {}
+        return read_columnar(os.path.join(self.directory, key, DATA_DIRECTORY_NAME))
+
+    def put(self, key: str, records, description: dict = None) -> dict:
+        """
+        Store the records of a sweep. The records are written to a temporary directory first, so that an entry is
+        either complete or not present at all. Afterwards, the least recently used entries are evicted, if the cache
+        exceeds it's maximum size.
+
+        Parameters:
+            key (str): Address of the entry
+            records (iterable): Records of the sweep
+            description (dict): Human readable description of the entry (e.g. engine, grid and sweep)
+
+        Returns:
+            dict: Meta information of the entry
+        """
+        temporary = os.path.join(self.directory, ".%s.%i" % (key, os.getpid()))
+        shutil.rmtree(temporary, ignore_errors=True)
+        first = {}
+
+        def _remember_first(iterable):
+            for record in iterable:
+                if not first:
+                    first['result_class'] = type(record['result']).__name__
+                yield record
+
+        amount = consume(_remember_first(records), ColumnarSink(os.path.join(temporary, DATA_DIRECTORY_NAME)))
+        now = time.time()
+        meta = {
+            'key': key,
+            'result_class': first.get('result_class'),
+            'records': amount,
+            'size_bytes': _size_of(temporary),
+            'created': now,
+            'last_access': now,
+            'description': description if description is not None else {}
+        }
+        self.__write_meta(temporary, meta)
+        self.remove(key)
+        os.replace(temporary, os.path.join(self.directory, key))
+        self.prune(max_size_bytes=self.max_size_bytes, keep=key)
+        return meta
+
+    def get_or_calculate(self, engine: dict, grid: dict, sweep: dict, calculate) -> list:
+        """
+        Hand back the cached records of a sweep or calculate and store them, if they aren't cached, yet
+
+        Parameters:
+            engine (dict): Fingerprint of the engine, that calculates the results
+            grid (dict): Parameters of the test grid
+            sweep (dict): Arguments of the sweep
+            calculate (callable): Function without arguments, that calculates the records of the sweep
+
+        Returns:
+            list: The records of the sweep
+        """
+        key = self.key(engine, grid, sweep)
+        records = self.get(key)
+        if records is not None:
+            self.logger.info("Loaded %i records from result cache entry '%s'" % (len(records), key))
+            return records
+        records = calculate()
+        self.put(key, records, description={'engine': engine, 'grid': grid, 'sweep': sweep})
+        self.logger.info("Stored %i records as result cache entry '%s'" % (len(records), key))
+        return records
+
+    def calculate(self, bench, **kwargs) -> list:
+        """
+        Perform a sweep with a pandapower test bench, unless it's results are already cached. The sweep is addressed by
+        all arguments of the bench's calculate method including their defaults, so that omitting an argument and
+        passing it's default value address the same entry.
+
+        Parameters:
+            bench (TestBench): The test bench
+            kwargs: Arguments of the bench's calculate method
+
+        Returns:
+            list: The records of the sweep
+        """
+        # Solver arguments don't address the sweep. Not every bench takes all of them.
+        arguments = inspect.signature(bench.calculate).bind(
+            **{name: value for name, value in kwargs.items() if name not in SOLVER_ARGUMENTS})
+        arguments.apply_defaults()
+        sweep = {name: value for name, value in arguments.arguments.items() if name not in SOLVER_ARGUMENTS}
+        sweep['bench'] = type(bench).__name__
+        return self.get_or_calculate(engine=pandapower_fingerprint(), grid=bench.GRID_PARAMETERS, sweep=sweep,
+                                     calculate=lambda: bench.calculate(**kwargs))
+
+    def inspect(self, key: str) -> dict:
+        """
+        Meta information of an entry
+
+        Parameters:
+            key (str): Address of the entry
+
+        Returns:
+            dict: Meta information or None, if the entry doesn't exist
+        """
+        meta_file = os.path.join(self.directory, key, META_FILE_NAME)
+        if not os.path.exists(meta_file):
+            return None
+        with open(meta_file, "r") as file_to_read:
+            return json.load(file_to_read)
+
+    def entries(self) -> list:
+        """
+        Meta information of all entries, least recently used first
+
+        Returns:
+            list: Meta information per entry
+        """
+        metas = [self.inspect(key) for key in os.listdir(self.directory) if not key.startswith(".")]
+        return sorted([meta for meta in metas if meta is not None], key=lambda meta: meta['last_access'])
+
+    def remove(self, key: str):
+        """
+        Remove an entry, if it exists
+
+        Parameters:
+            key (str): Address of the entry
+        """
+        shutil.rmtree(os.path.join(self.directory, key), ignore_errors=True)
+
+    def prune(self, max_size_bytes: int = None, older_than_seconds: float = None, keep: str = None) -> list:
+        """
+        Evict entries, that haven't been used for the given time, and further the least recently used ones, until the
+        cache fits into the given size
+
+        Parameters:
+            max_size_bytes (int): Maximum total size of the remaining entries
+            older_than_seconds (float): Maximum time since the last use of the remaining entries
+            keep (str): Address of an entry, that must not be evicted
+
+        Returns:
+            list: Addresses of the evicted entries
+        """
+        entries = self.entries()
+        evicted = []
+        if older_than_seconds is not None:
+            threshold = time.time() - older_than_seconds
+            evicted.extend(meta['key'] for meta in entries if meta['last_access'] < threshold and meta['key'] != keep)
+        if max_size_bytes is not None:
+            total = sum(meta['size_bytes'] for meta in entries if meta['key'] not in evicted)
+            for meta in entries:
+                if total <= max_size_bytes:
+                    break
+                if meta['key'] in evicted or meta['key'] == keep:
+                    continue
+                evicted.append(meta['key'])
+                total -= meta['size_bytes']
+        for key in evicted:
+            self.logger.info("Evicting result cache entry '%s'" % key)
+            self.remove(key)
+        return evicted
+
+    @staticmethod
+    def __write_meta(entry_directory: str, meta: dict):
+        """
+        Write the meta information of an entry into it's directory, replacing the previous one
+
+        Parameters:
+            entry_directory (str): Directory of the entry
+            meta (dict): Meta information of the entry (cf. put)
+        """
+        with open(os.path.join(entry_directory, META_FILE_NAME), "w") as meta_file:
+            json.dump(meta, meta_file, indent=2, sort_keys=True, default=json_default)
+
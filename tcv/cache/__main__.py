@@ -0,0 +1,75 @@
+"""
+Command line interface to the result cache:
+
+    python -m tcv.cache list
+    python -m tcv.cache inspect <key>
+    python -m tcv.cache prune [--max-size-mb 512] [--older-than-days 30] [--all]
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from tcv.cache.ResultCache import ResultCache, default_directory
+
+
+def _format_size(size_bytes: int) -> str:
+    return "%.1f MiB" % (size_bytes / (1 << 20))
+
+
+def _format_time(timestamp: float) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+
+
+def main(argv: list = None) -> int:
+    """
+    Entry point of the command line interface
+
+    Parameters:
+        argv (list): Command line arguments without the program's name
+
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(prog="python -m tcv.cache", description="Manage the on-disk result cache")
+    parser.add_argument("--directory", default=default_directory(), help="Directory of the result cache")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List all entries, least recently used first")
+    inspect_parser = commands.add_parser("inspect", help="Show the meta information of an entry")
+    inspect_parser.add_argument("key", help="Address of the entry (a unique prefix suffices)")
+    prune_parser = commands.add_parser("prune", help="Evict entries")
+    prune_parser.add_argument("--max-size-mb", type=float, help="Evict least recently used entries beyond this size")
+    prune_parser.add_argument("--older-than-days", type=float, help="Evict entries, that haven't been used since")
+    prune_parser.add_argument("--all", action="store_true", help="Evict all entries")
+    arguments = parser.parse_args(argv)
+
+    cache = ResultCache(directory=arguments.directory)
+    if arguments.command == "list":
+        entries = cache.entries()
+        for meta in entries:
+            print("%s  %10s  %8i records  %-22s  last used %s" % (
+                meta['key'], _format_size(meta['size_bytes']), meta['records'], meta['result_class'],
+                _format_time(meta['last_access'])))
+        print("%i entries, %s in total" % (len(entries), _format_size(sum(meta['size_bytes'] for meta in entries))))
+    elif arguments.command == "inspect":
+        keys = [meta['key'] for meta in cache.entries() if meta['key'].startswith(arguments.key)]
+        if len(keys) != 1:
+            print("%s entry matches '%s'" % ("No" if len(keys) == 0 else "More than one", arguments.key),
+                  file=sys.stderr)
+            return 1
+        print(json.dumps(cache.inspect(keys[0]), indent=2, sort_keys=True))
+    elif arguments.command == "prune":
+        if arguments.all:
+            evicted = cache.prune(max_size_bytes=0)
+        else:
+            evicted = cache.prune(
+                max_size_bytes=int(arguments.max_size_mb * (1 << 20)) if arguments.max_size_mb is not None else None,
+                older_than_seconds=arguments.older_than_days * 86400.0 if arguments.older_than_days is not None
+                else None)
+        print("Evicted %i entries" % len(evicted))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,3 +1,4 @@
+from itertools import groupby
 from math import ceil, floor
 
 from numpy import ndarray, arange
@@ -25,3 +26,76 @@ def permissible_power_range_lv(s_nom_hv_mva: float = 0.0, s_nom_lv_mva: float =
     p_max_mw = floor(p_max_mw / p_step_mw) * p_step_mw
 
     return arange(p_min_mw, p_max_mw + p_step_mw, p_step_mw)
+
+
+def operating_points_two_winding(tap_range: range, p_range_mw: list) -> list:
+    """
+    Build the list of operating points of a two winding sweep in canonical order, that is tap position by tap position
+    and ascending power within each tap position.
+
+    Parameters:
+        tap_range (range): Range of tap positions to sweep
+        p_range_mw (list): Active power consumptions of the load to sweep
+
+    Returns:
+        operating_points (list): Tuples of (tap position, active power in MW)
+    """
+    return [(tap_pos, p_mw) for tap_pos in tap_range for p_mw in p_range_mw]
+
+
+def operating_points_three_winding(tap_range: range, p_mv_range_mw: list, s_nom_hv_mva: float, s_nom_lv_mva: float,
+                                   p_step_lv_mw: float) -> list:
+    """
+    Build the list of operating points of a three winding sweep in canonical order, that is tap position by tap
+    position, ascending medium voltage power and ascending permissible low voltage power (cf.
+    permissible_power_range_lv).
+
+    Parameters:
+        tap_range (range): Range of tap positions to sweep
+        p_mv_range_mw (list): Active power consumptions at the medium voltage port to sweep
+        s_nom_hv_mva (float): Rated power of the high voltage port
+        s_nom_lv_mva (float): Rated power of the low voltage port
+        p_step_lv_mw (float): Step size to use, when sweeping over the low voltage power range
+
+    Returns:
+        operating_points (list): Tuples of (tap position, medium voltage power in MW, low voltage power in MW)
+    """
+    p_lv_ranges_mw = {p_mv_mw: permissible_power_range_lv(s_nom_hv_mva, s_nom_lv_mva, p_mv_mw, p_step_lv_mw) for
+                      p_mv_mw in p_mv_range_mw}
+    return [(tap_pos, p_mv_mw, p_lv_mw) for tap_pos in tap_range for p_mv_mw in p_mv_range_mw for p_lv_mw in
+            p_lv_ranges_mw[p_mv_mw]]
+
+
+def serpentine_order(operating_points: list, forward: list = None) -> list:
+    """
+    Determine an order to walk through the operating points as a serpentine, so that consecutive power flow
+    calculations only differ by one step in one dimension. The operating points have to be given in canonical order
+    (cf. operating_points_two_winding and operating_points_three_winding). Each nesting level reverses its direction
+    every time it is entered, e.g. the power sweep of every odd tap position is walked downwards.
+
+    If a sweep is walked in chunks (e.g. tap position by tap position), the same list of directions has to be handed
+    to every call. It is updated in place, so that the concatenated chunks form the same serpentine as the whole sweep.
+
+    Parameters:
+        operating_points (list): Tuples describing the operating points in canonical order
+        forward (list): Current direction of each nesting level, that is carried over between consecutive calls
+
+    Returns:
+        order (list): Indices into the given operating points in the order to walk them
+    """
+    if len(operating_points) == 0:
+        return []
+    depth = len(operating_points[0])
+    if forward is None:
+        forward = [True] * depth
+
+    def _walk(indices: list, level: int) -> list:
+        groups = [list(group) for _, group in groupby(indices, key=lambda idx: operating_points[idx][level])]
+        if not forward[level]:
+            groups.reverse()
+        forward[level] = not forward[level]
+        if level == depth - 1:
+            return [idx for group in groups for idx in group]
+        return [idx for group in groups for idx in _walk(group, level + 1)]
+
+    return _walk(list(range(len(operating_points))), 0)
@@ -1,4 +1,3 @@
-import json
 import logging
 import math
 import os
@@ -9,7 +8,8 @@ from numpy import arange
 
 from tcv.calculation.TestHelper import permissible_power_range_lv
 from tcv.calculation.result.GridResultThreeWinding import GridResultThreeWinding
-from tcv.encoder.DictEncoder import DictEncoder
+from tcv.calculation.sink.Checkpoint import Checkpoint
+from tcv.calculation.sink.JsonLinesSink import JsonLinesSink, json_lines_to_json
 from tcv.util.SeverityLevel import SeverityLevel
 
 """
@@ -61,6 +61,11 @@ logger.addHandler(file_handler)
 # Prepare information about output file
 result_directory = os.path.join("..", "..", "..", "results", "three_winding")
 result_file = os.path.join(result_directory, "dpf_withMainFieldLosses.json")
+# The results are streamed into a JSON Lines file, so that an aborted sweep keeps everything calculated so far
+result_lines_file = os.path.join(result_directory, "dpf_withMainFieldLosses.jsonl")
+checkpoint_directory = os.path.join(result_directory, "checkpoints")
+# Amount of operating points, after which the calculated ones are persisted in the checkpoint
+checkpoint_every = 100
 
 # Get the PowerFactory object
 dpf = {'app': powerfactory.GetApplication()}
@@ -74,6 +79,8 @@ err, p_step_in = dpf['script'].GetInputParameterDouble('p_step')
 if err == 1:
     raise ValueError('Unable to load input parameter \"p_step\"')
 p_step = int(p_step_in)
+err, resume_in = dpf['script'].GetInputParameterInt('resume')
+resume = err == 0 and resume_in == 1  # Reuse the operating points of an aborted run, if the parameter is set to 1
 log(SeverityLevel.INFO, "Your test bench configuration:\n\tMedium voltage is varied with %i steps" % p_step)
 
 # Get needed information from grid structure
@@ -106,7 +113,15 @@ p_step_lv_mw = 2 * sr_lv_mva / (p_step - 1)  # Bin width at the lv side
 
 # Performing the calculations
 log(SeverityLevel.INFO, "Starting the power flow calculations")
-results = []
+results = JsonLinesSink(result_lines_file, flush_every=1)
+amount_of_results = 0
+checkpoint = Checkpoint(checkpoint_directory,
+                        parameters={'script': 'PowerFactoryThreeWindingControl',
+                                    'transformer_type': str(transformer_type), 's_rated_hv_mva': sr_hv_mva,
+                                    's_rated_mv_mva': sr_mv_mva, 's_rated_lv_mva': sr_lv_mva, 'p_step': p_step},
+                        key_names=('tap_pos', 'p_mv', 'p_lv'), result_class=GridResultThreeWinding)
+if resume:
+    log(SeverityLevel.INFO, "Resuming from checkpoint '%s'" % checkpoint.path)
 
 
 def _calculate_angle(y: float, x: float) -> float:
@@ -120,6 +135,10 @@ def _calculate_angle(y: float, x: float) -> float:
 for tap_pos in tap_range:
     log(SeverityLevel.INFO, "Sweeping through power consumption for tap position %i." % tap_pos)
     transformer.SetAttribute('n3tap_h', tap_pos)
+    completed = checkpoint.load(tap_pos) if resume else {}
+    if not resume:
+        checkpoint.clear(tap_pos)
+    calculated = []
 
     # Sweep through medium voltage power
     for p_mv_mw in p_mv_range_mw:
@@ -131,6 +150,11 @@ for tap_pos in tap_range:
 
         # Sweep through low voltage power
         for p_lv_mw in p_lv_range:
+            if (tap_pos, p_mv_mw, p_lv_mw) in completed:
+                # This operating point has already been calculated before the last run has been aborted
+                results.write(completed[(tap_pos, p_mv_mw, p_lv_mw)])
+                amount_of_results += 1
+                continue
             log(SeverityLevel.DEBUG, "Setting low voltage load to %.1f MW" % p_lv_mw)
             load_lv.SetAttribute('plini', p_lv_mw)
 
@@ -174,16 +198,21 @@ for tap_pos in tap_range:
                                             i_mag_mv_a=i_mag_mv_a, i_ang_mv_degree=i_ang_mv_degree, p_lv_kw=p_lv_kw,
                                             q_lv_kvar=q_lv_kvar, s_lv_kva=s_lv_kva, i_mag_lv_a=i_mag_lv_a,
                                             i_ang_lv_degree=i_ang_lv_degree)
-            results.append({
+            record = {
                 'tap_pos': tap_pos,
                 'p_mv': p_mv_mw,
                 'p_lv': p_lv_mw,
                 'result': result
-            })
-
+            }
+            results.write(record)
+            calculated.append(record)
+            if len(calculated) >= checkpoint_every:
+                checkpoint.store(tap_pos, calculated)
+                calculated = []
+            amount_of_results += 1
+    checkpoint.store(tap_pos, calculated)
+
+results.shutdown()
 log(SeverityLevel.INFO,
-    "Successfully performed %i power flow calculations. Dum results into '%s'." % (len(results), str(result_file)))
-if not os.path.exists(result_directory):
-    os.makedirs(result_directory)
-with open(result_file, "w") as file_to_write_to:
-    json.dump(results, file_to_write_to, cls=DictEncoder, indent=2)
+    "Successfully performed %i power flow calculations. Dum results into '%s'." % (amount_of_results, str(result_file)))
+json_lines_to_json(result_lines_file, result_file)
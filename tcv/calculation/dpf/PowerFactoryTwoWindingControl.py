@@ -1,4 +1,3 @@
-import json
 import logging
 import math
 import os
@@ -7,7 +6,8 @@ import numpy as np
 import powerfactory
 
 from tcv.calculation.result.GridResultTwoWinding import GridResultTwoWinding
-from tcv.encoder.DictEncoder import DictEncoder
+from tcv.calculation.sink.Checkpoint import Checkpoint
+from tcv.calculation.sink.JsonLinesSink import JsonLinesSink, json_lines_to_json
 from tcv.util.SeverityLevel import SeverityLevel
 
 """
@@ -59,6 +59,11 @@ logger.addHandler(file_handler)
 # Prepare information about output file
 result_directory = os.path.join("..", "..", "..", "results", "two_winding")
 result_file = os.path.join(result_directory, "dpf_tapLv.json")
+# The results are streamed into a JSON Lines file, so that an aborted sweep keeps everything calculated so far
+result_lines_file = os.path.join(result_directory, "dpf_tapLv.jsonl")
+checkpoint_directory = os.path.join(result_directory, "checkpoints")
+# Amount of operating points, after which the calculated ones are persisted in the checkpoint
+checkpoint_every = 100
 
 # Get the PowerFactory object
 dpf = {'app': powerfactory.GetApplication()}
@@ -72,6 +77,8 @@ err, p_step_in = dpf['script'].GetInputParameterDouble('p_step')
 if err == 1:
     raise ValueError('Unable to load input parameter \"p_step\"')
 p_step = int(p_step_in)
+err, resume_in = dpf['script'].GetInputParameterInt('resume')
+resume = err == 0 and resume_in == 1  # Reuse the operating points of an aborted run, if the parameter is set to 1
 log(SeverityLevel.INFO, "Your test bench configuration:\n\tLow voltage load is varied with %i steps" % p_step)
 
 # Get needed information from grid structure
@@ -96,7 +103,14 @@ p_range_mw = [round(p_pu * sr_mva * 1e3) / 1e3 for p_pu in np.linspace(-1.0, 1.0
 
 # Performing the calculations
 log(SeverityLevel.INFO, "Starting the power flow calculations")
-results = []
+results = JsonLinesSink(result_lines_file, flush_every=1)
+amount_of_results = 0
+checkpoint = Checkpoint(checkpoint_directory,
+                        parameters={'script': 'PowerFactoryTwoWindingControl',
+                                    'transformer_type': str(transformer_type), 's_rated_mva': sr_mva, 'p_step': p_step},
+                        key_names=('tap_pos', 'p_lv'), result_class=GridResultTwoWinding)
+if resume:
+    log(SeverityLevel.INFO, "Resuming from checkpoint '%s'" % checkpoint.path)
 
 
 def _calculate_angle(y: float, x: float) -> float:
@@ -110,9 +124,18 @@ def _calculate_angle(y: float, x: float) -> float:
 for tap_pos in tap_range:
     log(SeverityLevel.INFO, "Sweeping through power consumption for tap position %i." % tap_pos)
     transformer.SetAttribute('nntap', tap_pos)
+    completed = checkpoint.load(tap_pos) if resume else {}
+    if not resume:
+        checkpoint.clear(tap_pos)
+    calculated = []
 
     # Sweep through medium voltage power
     for p_mw in p_range_mw:
+        if (tap_pos, p_mw) in completed:
+            # This operating point has already been calculated before the last run has been aborted
+            results.write(completed[(tap_pos, p_mw)])
+            amount_of_results += 1
+            continue
         log(SeverityLevel.DEBUG, "Setting low voltage load to %.3f MW" % p_mw)
         load_lv.SetAttribute('plini', p_mw)
 
@@ -143,15 +166,20 @@ for tap_pos in tap_range:
                                       q_hv_kvar=q_hv_kvar, s_hv_kva=s_hv_kva, i_mag_hv_a=i_mag_hv_a,
                                       i_ang_hv_degree=i_ang_hv_degree, p_lv_kw=p_lv_kw, q_lv_kvar=q_lv_kvar,
                                       s_lv_kva=s_lv_kva, i_mag_lv_a=i_mag_lv_a, i_ang_lv_degree=i_ang_lv_degree)
-        results.append({
+        record = {
             'tap_pos': tap_pos,
             'p_lv': p_mw,
             'result': result
-        })
-
+        }
+        results.write(record)
+        calculated.append(record)
+        if len(calculated) >= checkpoint_every:
+            checkpoint.store(tap_pos, calculated)
+            calculated = []
+        amount_of_results += 1
+    checkpoint.store(tap_pos, calculated)
+
+results.shutdown()
 log(SeverityLevel.INFO,
-    "Successfully performed %i power flow calculations. Dum results into '%s'." % (len(results), str(result_file)))
-if not os.path.exists(result_directory):
-    os.makedirs(result_directory)
-with open(result_file, "w") as file_to_write_to:
-    json.dump(results, file_to_write_to, cls=DictEncoder, indent=2)
+    "Successfully performed %i power flow calculations. Dum results into '%s'." % (amount_of_results, str(result_file)))
+json_lines_to_json(result_lines_file, result_file)
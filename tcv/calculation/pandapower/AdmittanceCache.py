@@ -0,0 +1,235 @@
+import logging
+import re
+from collections import OrderedDict
+from copy import deepcopy
+from time import perf_counter
+
+import numpy as np
+import pandapower as pp
+from pandapower.pypower.idx_bus import PD, QD
+from pandapower.pypower.makeSbus import makeSbus
+
+# The cache calls pandapower's private power flow internals, as they are shaped since this version (e.g. newtonpf
+# handing back eight values and the admittances of SVC, TCSC, SSC and VSC). With older versions, every power flow is
+# run by pandapower.runpp instead.
+MIN_PANDAPOWER_VERSION = (3, 5)
+
+
+def _version(version: str) -> tuple:
+    """
+    Turn a version string into a tuple of it's leading numbers, e.g. (3, 5, 6) for '3.5.6'
+
+    Parameters:
+        version (str): The version string
+
+    Returns:
+        tuple: The numbers of the version
+    """
+    return tuple(int(number) for number in re.findall('\\d+', version.split('+')[0])[:3])
+
+
+try:
+    from pandapower.pd2ppc import _pd2ppc
+    from pandapower.pf.ppci_variables import _get_pf_variables_from_ppci, _store_results_from_pf_in_ppci
+    from pandapower.pf.run_newton_raphson_pf import _get_numba_functions, ppci_to_pfsoln
+    from pandapower.powerflow import _ppci_to_net
+    from pandapower.pypower.newtonpf import newtonpf
+
+    AVAILABLE = _version(pp.__version__) >= MIN_PANDAPOWER_VERSION
+except ImportError:
+    AVAILABLE = False
+
+
+def _load_contribution(net: pp.pandapowerNet, bus_lookup: np.ndarray, n_bus: int) -> (np.ndarray, np.ndarray):
+    """
+    Determine the active and reactive power of all loads per bus of the internal power flow representation
+
+    Parameters:
+        net (pandapowerNet): The grid model
+        bus_lookup (ndarray): Mapping from pandapower's bus index to the internal bus index
+        n_bus (int): Amount of internal buses
+
+    Returns:
+        tuple: Active power in MW and reactive power in MVAr per internal bus
+    """
+    factor = (net.load.scaling * net.load.in_service).values
+    internal_bus = bus_lookup[net.load.bus.values]
+    p_mw = np.zeros(n_bus)
+    q_mvar = np.zeros(n_bus)
+    np.add.at(p_mw, internal_bus, net.load.p_mw.values * factor)
+    np.add.at(q_mvar, internal_bus, net.load.q_mvar.values * factor)
+    return p_mw, q_mvar
+
+
+class AdmittanceCache:
+    """
+    Cache of the internal power flow representation of a pandapower test grid. Within a sweep, the admittance matrix
+    only depends on the transformer's configuration and tap position, whereas the loads are the only thing changing
+    between operating points. Hence, the conversion to the internal representation and the admittance matrix are only
+    built once per distinct configuration. All further power flows with the same configuration only update the nodal
+    power and call pandapower's Newton-Raphson solver directly. If the power flow is requested with 'only_v_results',
+    the result tables aren't written on cache hits at all (cf. TestBench.extract_solution).
+
+    The caller is responsible for a key, that covers everything the admittance matrix depends on. Only the active and
+    reactive power of loads may differ between power flows with the same key. The cached representations are bound to
+    the net, they have been built from. As soon as another net is handed in, all of them are dropped.
+
+    If the installed pandapower doesn't provide the needed internals (cf. AVAILABLE), the cache is disabled and each
+    power flow is run by pandapower.runpp.
+    """
+
+    logger = logging.getLogger()
+
+    def __init__(self, max_size: int = 32):
+        """
+        Constructor for the class
+
+        Parameters:
+            max_size (int): Maximum amount of cached configurations. If exceeded, the least recently used one is evicted
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+        self.__net = None
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def clear(self):
+        """
+        Remove all cached configurations and reset the counters
+        """
+        self.__entries.clear()
+        self.__net = None
+        self.hits = 0
+        self.misses = 0
+
+    def runpp(self, net: pp.pandapowerNet, key: tuple, init: str = "auto", **kwargs):
+        """
+        Run a power flow for the current state of the given net. If the key is unknown, pandapower's ordinary power
+        flow is run and the internal representation is cached. Otherwise, the cached representation is reused. In
+        both cases, the results are written to the net's result tables.
+
+        Parameters:
+            net (pandapowerNet): The grid model
+            key (tuple): Key, that identifies the configuration of the admittance matrix
+            init (str): Initialization of the power flow ("auto" or "flat" for flat start, "results" for warm start)
+            kwargs: Further keyword arguments to pass to pandapower.runpp on cache misses
+        """
+        if not AVAILABLE:
+            if self.hits + self.misses == 0:
+                self.logger.warning("pandapower %s doesn't provide the internals, the admittance cache relies on. It "
+                                    "is disabled." % pp.__version__)
+            self.misses += 1
+            pp.runpp(net, init=init, **kwargs)
+            return
+        if net is not self.__net:
+            self.__entries.clear()
+            self.__net = net
+        entry = self.__entries.get(key)
+        if entry is None:
+            self.misses += 1
+            pp.runpp(net, init=init, **kwargs)
+            self.__entries[key] = self.__build_entry(net)
+            if len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+            return
+
+        self.hits += 1
+        self.__entries.move_to_end(key)
+        self.__run_cached(net, entry, init)
+
+    @staticmethod
+    def __build_entry(net: pp.pandapowerNet) -> dict:
+        """
+        Convert the net into pandapower's internal representation and build the admittance matrices
+
+        Parameters:
+            net (pandapowerNet): The grid model, that has been calculated with pandapower before
+
+        Returns:
+            dict: The cached configuration
+        """
+        results, options_of_results = net._ppc, net._options
+        options = deepcopy(net._options)
+        options["init_vm_pu"] = "flat"
+        options["init_va_degree"] = "flat"
+        net._options = options
+        ppc, ppci = _pd2ppc(net)
+        net._ppc, net._options = results, options_of_results
+        make_y_bus, _ = _get_numba_functions(ppci, options)
+        base_mva, bus, _, branch, _, _, _, _, ref, pv, pq, _, _, v_init, _ = _get_pf_variables_from_ppci(ppci, True)
+        y_bus, y_f, y_t = make_y_bus(base_mva, bus, branch)
+        bus_lookup = net._pd2ppc_lookups["bus"]
+        p_load_mw, q_load_mvar = _load_contribution(net, bus_lookup, bus.shape[0])
+        return {
+            'ppc': ppc,
+            'ppci': ppci,
+            'options': options,
+            'lookups': deepcopy(net._pd2ppc_lookups),
+            'y_bus': y_bus,
+            'y_f': y_f,
+            'y_t': y_t,
+            'make_y_bus': make_y_bus,
+            'ref': ref,
+            'pv': pv,
+            'pq': pq,
+            'v_init': v_init.copy(),
+            'pd_base_mw': bus[:, PD] - p_load_mw,
+            'qd_base_mvar': bus[:, QD] - q_load_mvar
+        }
+
+    @staticmethod
+    def __run_cached(net: pp.pandapowerNet, entry: dict, init: str):
+        """
+        Run a power flow with a cached configuration and write the results to the net
+
+        Parameters:
+            net (pandapowerNet): The grid model
+            entry (dict): The cached configuration
+            init (str): Initialization of the power flow
+        """
+        t0 = perf_counter()
+        ppc, ppci, options = entry['ppc'], entry['ppci'], entry['options']
+        bus, gen = ppci["bus"], ppci["gen"]
+        p_load_mw, q_load_mvar = _load_contribution(net, entry['lookups']["bus"], bus.shape[0])
+        bus[:, PD] = entry['pd_base_mw'] + p_load_mw
+        bus[:, QD] = entry['qd_base_mvar'] + q_load_mvar
+        s_bus = makeSbus(ppci["baseMVA"], bus, gen)
+
+        v_previous = net._ppc["internal"]["V"] if init == "results" and net.get("_ppc") else None
+        v_init = v_previous.copy() if v_previous is not None and v_previous.shape == entry['v_init'].shape else \
+            entry['v_init'].copy()
+        ref, pv, pq = entry['ref'], entry['pv'], entry['pq']
+        v, success, iterations, jacobian, vm_it, va_it, r_theta_kelvin_per_mw, temperature = newtonpf(
+            entry['y_bus'], s_bus, v_init, ref, pv, pq, ppci, options, entry['make_y_bus'])
+
+        # Hand back the solution in the same way as pandapower's own power flow does
+        internal = ppci["internal"]
+        y_bus = entry['y_bus'] + internal["Ybus_svc"] + internal["Ybus_tcsc"] + internal["Ybus_ssc"] + \
+            internal["Ybus_vsc"]
+        internal.update(
+            {"J": jacobian, "Vm_it": vm_it, "Va_it": va_it, "bus": bus, "gen": gen, "branch": ppci["branch"],
+             "svc": ppci["svc"], "tcsc": ppci["tcsc"], "ssc": ppci["ssc"], "vsc": ppci["vsc"],
+             "baseMVA": ppci["baseMVA"], "V": v, "pv": pv, "pq": pq, "ref": ref, "Sbus": s_bus, "Ybus": y_bus,
+             "Yf": entry['y_f'], "Yt": entry['y_t'], "r_theta_kelvin_per_mw": r_theta_kelvin_per_mw,
+             "T": temperature})
+        if options["only_v_results"]:
+            # Skip pandapower's result tables. The solution is only available within the internal arrays.
+            if not success:
+                raise pp.LoadflowNotConverged("Power Flow %s did not converge after %i iterations!" % (
+                    options["algorithm"], options["max_iteration"]))
+            ppc.update({"internal": internal, "success": True, "iterations": iterations,
+                        "et": perf_counter() - t0})
+            net._options = options
+            net._pd2ppc_lookups = entry['lookups']
+            net._ppc = ppc
+            return
+
+        bus, gen, branch = ppci_to_pfsoln(ppci, options)
+        ppci = _store_results_from_pf_in_ppci(ppci, bus, gen, branch, success, iterations, perf_counter() - t0)
+        net._options = options
+        net._pd2ppc_lookups = entry['lookups']
+        net._ppc = ppc
+        _ppci_to_net(ppci, net)
@@ -1,18 +1,19 @@
 import csv
-import logging
 import os
+from math import cos, radians, sin
 
-from tcv.calculation.result import GridResultTwoWinding
+from tcv.calculation.result.GridResultTwoWinding import GridResultTwoWinding
+from tcv.calculation.sink.ResultSink import ResultSink
 
 
-class ResultWriter:
+class ResultWriter(ResultSink):
     """
     This class serves as a result writer for pandapower's power flow results to a csv file. As the pandapower results
     are given in a different format then what we need, this class also takes care of converting the results into the
-    correct form
+    correct form. As a result sink, it consumes the records of a two winding sweep one by one (cf.
+    TwoWindingTestBench.iter_calculate).
     """
 
-    logger = logging.getLogger()
     file = None
     csv_writer = None
     header = [
@@ -33,7 +34,17 @@ class ResultWriter:
         's_lv_kva',
     ]
 
-    def __init__(self, rel_path="", file_name=""):
+    def __init__(self, rel_path="", file_name="", p_nom_mw: float = 1.0):
+        """
+        Constructor for the class
+
+        Parameters:
+            rel_path (str): Directory of the output file
+            file_name (str): Name of the output file
+            p_nom_mw (float): Nominal active power, that relates the records' active power to p.u.
+        """
+        self.p_nom_mw = p_nom_mw
+
         # Prepare the output file by setting up all directories
         os.makedirs(os.path.relpath(rel_path), exist_ok=True)
         self.file = open(rel_path + file_name, 'wt', newline='')
@@ -58,9 +69,9 @@ class ResultWriter:
         row = [
             tap_pos,  # Current tap position
             "%0.1f" % p_pu,  # Chosen loading in p.u.
-            "%0.12f" % result.e_pu,  # Low voltage nodal voltage - real part
-            "%0.12f" % result.f_pu,  # Low voltage nodal voltage - imaginary part
-            "%0.12f" % result.v_pu,  # Low voltage nodal voltage - magnitude
+            "%0.12f" % (result.v_lv_pu * cos(radians(result.v_ang_lv_degree))),  # Low voltage nodal voltage - real
+            "%0.12f" % (result.v_lv_pu * sin(radians(result.v_ang_lv_degree))),  # Low voltage nodal voltage - imaginary
+            "%0.12f" % result.v_lv_pu,  # Low voltage nodal voltage - magnitude
             "%0.12f" % result.i_mag_hv_a,  # High voltage port current - magnitude
             "%0.12f" % result.i_ang_hv_degree,  # High voltage port current - angle
             "%0.12f" % result.i_mag_lv_a,  # Low voltage port current - magnitude
@@ -79,8 +90,18 @@ class ResultWriter:
             self.file.close()
             raise e
 
+    def write(self, record: dict):
+        """
+        Write a record of a two winding sweep to the file
+
+        Parameters:
+            record (dict): Record with tap position, active power in MW and the result
+        """
+        self.write_result(tap_pos=record['tap_pos'], p_pu=record['p_lv'] / self.p_nom_mw, result=record['result'])
+
     def shutdown(self):
         """
         Shuts down the writer (closing the result file)
         """
-        self.file.close()
+        if not self.file.closed:
+            self.file.close()
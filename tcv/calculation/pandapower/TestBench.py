@@ -1,7 +1,17 @@
 import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from math import copysign, atan, pi
 
+import numpy as np
+import pandapower as pp
+from numpy import ndarray
+from pandapower.pypower.idx_brch import F_BUS, T_BUS
+
+from tcv.calculation.pandapower.AdmittanceCache import AdmittanceCache
+from tcv.calculation.sink.Checkpoint import Checkpoint
+
 
 def __calc_current_angle(p: float = 0.0, q: float = 0.0, phi_v_degree: float = 0.0):
     """
@@ -35,27 +45,231 @@ def __calc_current_angle(p: float = 0.0, q: float = 0.0, phi_v_degree: float = 0
     return phi_v_degree - phi_s_degree
 
 
-class TestBench:
+def calc_current_angles(p: ndarray, q: ndarray, phi_v_degree: ndarray) -> ndarray:
+    """
+    Vectorized counterpart to __calc_current_angle, that determines the current angles of a whole batch of operating
+    points at once. The same conventions apply.
 
-    def __init__(self):
-        # --- Set up the util ---
-        self.logger = logging.getLogger()
-        self.logger.setLevel(level=logging.DEBUG)
-
-        formatter = logging.Formatter('%(asctime)s,%(msecs)d %(name)s %(levelname)s - %(message)s')
-
-        # Create a file handler
-        log_directory = os.path.join("..", "..", "..", "log")
-        if not os.path.exists(log_directory):
-            os.makedirs(log_directory)
-        log_file = os.path.join(log_directory, "test_bench.log")
-        file_handler = logging.FileHandler(log_file, 'w')
-        file_handler.setLevel(level=logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
-
-        # Create console handler
+    Parameters:
+        p (ndarray): Active power
+        q (ndarray): Reactive power
+        phi_v_degree (ndarray): Nodal voltage angle in degrees
+
+    Returns:
+        ndarray: Current angle in degrees
+    """
+    p = np.asarray(p, dtype=float)
+    q = np.asarray(q, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        phi_s_degree = np.degrees(np.arctan(q / p)) + np.where(p < 0.0, 180.0, 0.0)
+    phi_s_degree = np.where(p == 0.0, np.where(q == 0.0, 0.0, np.copysign(180.0, q)), phi_s_degree)
+    return phi_v_degree - phi_s_degree
+
+
+def extract_solution(net: pp.pandapowerNet, buses: list, branch_ends: list) -> ndarray:
+    """
+    Read the complex nodal voltages and branch power flows of the last power flow straight from pandapower's internal
+    result arrays instead of the result tables. Thereby, the power flow may have been run with 'only_v_results'.
+
+    Parameters:
+        net (pandapowerNet): pandapower's net model, additionally carrying results of last simulation
+        buses (list): Indices of the buses, whose voltage is of interest
+        branch_ends (list): Tuples of element type (e.g. "trafo"), index of the branch within the element's internal
+            branches and the end of the branch ("from" or "to"), whose power is of interest
+
+    Returns:
+        ndarray: Complex nodal voltages in p.u. followed by the complex power flowing into the branches in MVA
+    """
+    internal = net._ppc["internal"]
+    v = internal["V"]
+    branch = internal["branch"]
+    bus_lookup = net._pd2ppc_lookups["bus"]
+    branch_lookup = net._pd2ppc_lookups["branch"]
+    solution = [v[bus_lookup[bus]] for bus in buses]
+    for element, offset, end in branch_ends:
+        idx = branch_lookup[element][0] + offset
+        if end == "from":
+            node, admittance = int(branch[idx, F_BUS].real), internal["Yf"]
+        else:
+            node, admittance = int(branch[idx, T_BUS].real), internal["Yt"]
+        solution.append(v[node] * np.conj(admittance[idx].dot(v)[0]) * internal["baseMVA"])
+    return np.array(solution, dtype=complex)
+
+
+def setup_logger(log_file_name: str = "test_bench.log", log_to_console: bool = True) -> logging.Logger:
+    """
+    Set up the root logger with a file handler and optionally a console handler
+
+    Parameters:
+        log_file_name (str): Name of the log file within the log directory
+        log_to_console (bool): True, if INFO messages shall additionally be printed to the console
+
+    Returns:
+        Logger: The configured root logger
+    """
+    logger = logging.getLogger()
+    logger.setLevel(level=logging.DEBUG)
+
+    formatter = logging.Formatter('%(asctime)s,%(msecs)d %(name)s %(levelname)s - %(message)s')
+
+    # Create a file handler
+    log_directory = os.path.join("..", "..", "..", "log")
+    if not os.path.exists(log_directory):
+        os.makedirs(log_directory, exist_ok=True)
+    log_file = os.path.join(log_directory, log_file_name)
+    file_handler = logging.FileHandler(log_file, 'w')
+    file_handler.setLevel(level=logging.DEBUG)
+    file_handler.setFormatter(formatter)
+    logger.addHandler(file_handler)
+
+    # Create console handler
+    if log_to_console:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level=logging.INFO)
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        logger.addHandler(console_handler)
+
+    return logger
+
+
+def _setup_worker_logger():
+    """
+    Initializer of worker processes, that equips each worker with it's own log file. Forked workers inherit the
+    handlers of the parent process, which are removed beforehand, so that the workers neither write to the parent's
+    log file nor to the console.
+    """
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    setup_logger(log_file_name="test_bench_worker_%i.log" % os.getpid(), log_to_console=False)
+
+
+def _calculate_in_worker(bench_class, kwargs: dict) -> tuple:
+    """
+    Perform a part of a sweep within a worker process. The logging has already been set up by the worker's
+    initializer.
+
+    Parameters:
+        bench_class (type): Test bench class to instantiate
+        kwargs (dict): Keyword arguments to hand over to the test bench's calculate method
+
+    Returns:
+        tuple: The results of the partial sweep and the Newton-Raphson iterations per operating point
+    """
+    bench = bench_class(setup_logging=False)
+    out = bench.calculate(**kwargs)
+    return out, bench.iterations
+
+
+class TestBench:
+    # Parameters of the test grid, that the bench calculates (cf. TestGrid)
+    GRID_PARAMETERS: dict = {}
+
+    def __init__(self, setup_logging: bool = True):
+        # --- Set up the util ---
+        self.logger = setup_logger() if setup_logging else logging.getLogger()
+        self.iterations = []
+        self.admittance_cache = AdmittanceCache()
+
+    def _log_admittance_cache(self):
+        """
+        Report the efficiency of the admittance cache after a sweep
+        """
+        cache = self.admittance_cache
+        self.logger.info("Admittance cache: %i hits, %i misses, %i cached configurations." % (
+            cache.hits, cache.misses, len(cache)))
+
+    def _open_checkpoint(self, checkpoint_directory: str, resume: bool, parameters: dict, key_names: tuple,
+                         result_class: type):
+        """
+        Set up the checkpoint of a sweep, if requested
+
+        Parameters:
+            checkpoint_directory (str): Base directory of the checkpoints or None, if no checkpoint shall be written
+            resume (bool): True, if the operating points of a previous, aborted sweep shall be reused
+            parameters (dict): Parameters, that determine the results of the sweep
+            key_names (tuple): Entries of a record, that identify the operating point
+            result_class (type): Class of the results
+
+        Returns:
+            Checkpoint: The checkpoint or None, if no checkpoint shall be written
+        """
+        if checkpoint_directory is None:
+            if resume:
+                raise ValueError("Resuming a sweep requires a checkpoint directory")
+            return None
+        checkpoint = Checkpoint(checkpoint_directory, parameters, key_names, result_class)
+        self.logger.info("%s checkpoint '%s'" % ("Resuming from" if resume else "Writing", checkpoint.path))
+        return checkpoint
+
+    @staticmethod
+    def _completed_records(checkpoint: Checkpoint, resume: bool, tap_pos: int, operating_points: list) -> list:
+        """
+        Look up the operating points of one tap position, that have already been calculated in a previous sweep. If
+        the sweep isn't resumed, the tap position's checkpoint is reset instead.
+
+        Parameters:
+            checkpoint (Checkpoint): The sweep's checkpoint or None
+            resume (bool): True, if the sweep is resumed
+            tap_pos (int): Current tap position
+            operating_points (list): Operating points of the tap position in canonical order
+
+        Returns:
+            list: Completed record or None per operating point
+        """
+        if checkpoint is None:
+            return [None] * len(operating_points)
+        if not resume:
+            checkpoint.clear(tap_pos)
+            return [None] * len(operating_points)
+        completed = checkpoint.load(tap_pos)
+        return [completed.get(operating_point) for operating_point in operating_points]
+
+    @staticmethod
+    def _complete_records(checkpoint: Checkpoint, key_names: tuple, operating_points: list, indices: list, out: list,
+                          solutions: np.ndarray, results_from_solutions):
+        """
+        Build the records of calculated operating points, if only their solutions have been extracted so far, and
+        persist them in the checkpoint
+
+        Parameters:
+            checkpoint (Checkpoint): The sweep's checkpoint or None
+            key_names (tuple): Entries of a record, that identify the operating point, e.g. ('tap_pos', 'p_lv'). They
+                follow the order of the operating points' entries.
+            operating_points (list): Operating points of the tap position in canonical order
+            indices (list): Indices of the calculated operating points, that aren't completed yet
+            out (list): Records of the tap position in canonical order, that are completed in place
+            solutions (np.ndarray): Extracted solutions per operating point or None without fast extraction
+            results_from_solutions: Function, that turns a batch of extracted solutions into result objects
+        """
+        if len(indices) == 0:
+            return
+        if solutions is not None:
+            for idx, result in zip(indices, results_from_solutions(solutions[indices])):
+                out[idx] = dict(zip(key_names, operating_points[idx]), result=result)
+        if checkpoint is not None:
+            checkpoint.store(operating_points[indices[0]][0], [out[idx] for idx in indices])
+
+    def _calculate_parallel(self, tap_min: int, tap_max: int, workers: int, **kwargs) -> list:
+        """
+        Split the sweep into one chunk per tap position and calculate the chunks within a pool of worker processes.
+        The partial results are merged in ascending tap position, so that the outcome is identical to a serial sweep.
+
+        Parameters:
+            tap_min (int): Minimum tap position of the sweep
+            tap_max (int): Maximum tap position of the sweep
+            workers (int): Amount of worker processes
+            kwargs: All further keyword arguments of the calculate method
+
+        Returns:
+            list: The merged results of all chunks
+        """
+        self.logger.info("Distributing tap positions %i...%i among %i worker processes" % (tap_min, tap_max, workers))
+        chunks = [dict(kwargs, tap_min=tap_pos, tap_max=tap_pos) for tap_pos in range(tap_min, tap_max + 1)]
+        out = []
+        self.iterations = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_setup_worker_logger) as executor:
+            for partial_out, partial_iterations in executor.map(_calculate_in_worker, repeat(type(self)), chunks):
+                out.extend(partial_out)
+                self.iterations.extend(partial_iterations)
+        return out
@@ -19,6 +19,52 @@ class TransformerModel(Enum):
     T = "t"
 
 
+# Parameters of the transformer within the two winding test grid (cf. test_grid_two_winding)
+TWO_WINDING_TRANSFORMER = {
+    'sn_mva': .63,
+    'vn_hv_kv': 10.0,
+    'vn_lv_kv': .4,
+    'vkr_percent': 1.15873,
+    'vk_percent': 4.0,
+    'pfe_kw': 0.0,
+    'i0_percent': 0.23810,
+    'tap_neutral': 0,
+    'tap_max': 10,
+    'tap_min': -10,
+    'tap_step_percent': 2.5,
+    'tap_step_degree': 0.,
+    'tap_changer_type': 'Ratio'
+}
+
+# Parameters of the transformer within the three winding test grid (cf. test_grid_three_winding). The main field
+# parameters are only applied, if main field losses shall be considered.
+THREE_WINDING_TRANSFORMER = {
+    'vn_hv_kv': 380.0,
+    'vn_mv_kv': 110.0,
+    'vn_lv_kv': 30.0,
+    'sn_hv_mva': 300.0,
+    'sn_mv_mva': 300.0,
+    'sn_lv_mva': 100.0,
+    'vk_hv_percent': 17.5,
+    'vk_mv_percent': 18.0,
+    'vk_lv_percent': 15.5,
+    'vkr_hv_percent': 0.15,
+    'vkr_mv_percent': 0.12,
+    'vkr_lv_percent': 0.09,
+    'pfe_kw': 1.875,
+    'i0_percent': 0.25,
+    'shift_mv_degree': 0.0,
+    'shift_lv_degree': 0.0,
+    'tap_side': 'hv',
+    'tap_neutral': 0,
+    'tap_max': 10,
+    'tap_min': -10,
+    'tap_step_percent': 1.5,
+    'tap_step_degree': 0.0,
+    'tap_changer_type': 'Ratio'
+}
+
+
 def test_grid_two_winding(tap_pos=0, p_mw=0.0, sn_mva=0.0, tap_side=TapSide.HV) -> pp.pandapowerNet:
     """
     This methods generates a test grid consisting of a transformer loaded with a only active power load. The
@@ -36,13 +82,11 @@ def test_grid_two_winding(tap_pos=0, p_mw=0.0, sn_mva=0.0, tap_side=TapSide.HV)
         pandapowerNet: A test grid with one transformer and one load
     """
     net = pp.create_empty_network(sn_mva=sn_mva)
-    a = pp.create_bus(net, vn_kv=10.)
-    b = pp.create_bus(net, vn_kv=.4)
+    a = pp.create_bus(net, vn_kv=TWO_WINDING_TRANSFORMER['vn_hv_kv'])
+    b = pp.create_bus(net, vn_kv=TWO_WINDING_TRANSFORMER['vn_lv_kv'])
     pp.create_ext_grid(net, bus=a)
-    pp.create_transformer_from_parameters(net=net, hv_bus=a, lv_bus=b, sn_mva=.63, vn_hv_kv=10.0, vn_lv_kv=.4,
-                                          vkr_percent=1.15873, vk_percent=4.0, pfe_kw=0.0, i0_percent=0.23810,
-                                          tap_side=tap_side.value, tap_neutral=0, tap_max=10, tap_min=-10,
-                                          tap_step_percent=2.5, tap_step_degree=0., tap_pos=tap_pos, numba=True)
+    pp.create_transformer_from_parameters(net=net, hv_bus=a, lv_bus=b, tap_side=tap_side.value, tap_pos=tap_pos,
+                                          numba=True, **TWO_WINDING_TRANSFORMER)
     pp.create_load(net, bus=b, p_mw=p_mw)
     return net
 
@@ -64,20 +108,47 @@ def test_grid_three_winding(tap_pos: int = 0, p_mv_mw: float = 0.0, p_lv_mw: flo
         pandapowerNet: A test grid with one transformer and two loads
     """
     net = pp.create_empty_network(sn_mva=sn_mva)
-    node_a = pp.create_bus(net=net, vn_kv=380.0, name="node_a")
-    node_b = pp.create_bus(net=net, vn_kv=110.0, name="node_b")
-    node_c = pp.create_bus(net=net, vn_kv=30.0, name="node_c")
+    node_a = pp.create_bus(net=net, vn_kv=THREE_WINDING_TRANSFORMER['vn_hv_kv'], name="node_a")
+    node_b = pp.create_bus(net=net, vn_kv=THREE_WINDING_TRANSFORMER['vn_mv_kv'], name="node_b")
+    node_c = pp.create_bus(net=net, vn_kv=THREE_WINDING_TRANSFORMER['vn_lv_kv'], name="node_c")
     pp.create_ext_grid(net, bus=node_a)
-    iron_losses_kw = 0.0 if not with_main_field_losses else 1.875
-    i0_percent = 0.0 if not with_main_field_losses else 0.25
-    pp.create_transformer3w_from_parameters(net=net, hv_bus=node_a, mv_bus=node_b, lv_bus=node_c, vn_hv_kv=380.0,
-                                            vn_mv_kv=110.0, vn_lv_kv=30.0, sn_hv_mva=300.0, sn_mv_mva=300.0,
-                                            sn_lv_mva=100.0, vk_hv_percent=17.5, vk_mv_percent=18.0, vk_lv_percent=15.5,
-                                            vkr_hv_percent=0.15, vkr_mv_percent=0.12, vkr_lv_percent=0.09,
-                                            pfe_kw=iron_losses_kw, i0_percent=i0_percent, shift_mv_degree=0.0,
-                                            shift_lv_degree=0.0, tap_step_percent=1.5, tap_pos=tap_pos, tap_neutral=0,
-                                            tap_min=-10, tap_max=10, name="three_winding_transformer",
-                                            tap_at_star_point=tap_at_star_point, tap_side='hv')
+    parameters = dict(THREE_WINDING_TRANSFORMER)
+    if not with_main_field_losses:
+        parameters.update(pfe_kw=0.0, i0_percent=0.0)
+    pp.create_transformer3w_from_parameters(net=net, hv_bus=node_a, mv_bus=node_b, lv_bus=node_c, tap_pos=tap_pos,
+                                            name="three_winding_transformer", tap_at_star_point=tap_at_star_point,
+                                            **parameters)
     pp.create_load(net, bus=node_b, p_mw=p_mv_mw, name="load_mv")
     pp.create_load(net, bus=node_c, p_mw=p_lv_mw, name="load_lv")
     return net
+
+
+def set_operating_point_two_winding(net: pp.pandapowerNet, tap_pos: int = 0, p_mw: float = 0.0):
+    """
+    Moves an existing two winding test grid (cf. test_grid_two_winding) to another operating point. Only the tap
+    position and the load's active power are altered, so that the very same net can be reused throughout a sweep.
+
+    Parameters:
+        net (pandapowerNet): Test grid, that has been created by test_grid_two_winding
+        tap_pos (int): Current position of the tap changer
+        p_mw (float): Current active power consumption of the load
+    """
+    net.trafo.at[0, 'tap_pos'] = tap_pos
+    net.load.at[0, 'p_mw'] = p_mw
+
+
+def set_operating_point_three_winding(net: pp.pandapowerNet, tap_pos: int = 0, p_mv_mw: float = 0.0,
+                                      p_lv_mw: float = 0.0):
+    """
+    Moves an existing three winding test grid (cf. test_grid_three_winding) to another operating point. Only the tap
+    position and the loads' active power are altered, so that the very same net can be reused throughout a sweep.
+
+    Parameters:
+        net (pandapowerNet): Test grid, that has been created by test_grid_three_winding
+        tap_pos (int): Current position of the tap changer
+        p_mv_mw (float): Active power loading of the medium voltage port
+        p_lv_mw (float): Active power loading of the low voltage port
+    """
+    net.trafo3w.at[0, 'tap_pos'] = tap_pos
+    net.load.at[0, 'p_mw'] = p_mv_mw
+    net.load.at[1, 'p_mw'] = p_lv_mw
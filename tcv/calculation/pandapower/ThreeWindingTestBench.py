@@ -2,13 +2,17 @@ from math import sqrt
 
 import numpy as np
 import pandapower as pp
-from numpy import ndarray
 
 from tcv.calculation import TestHelper
-from tcv.calculation.pandapower.TestBench import TestBench, __calc_current_angle
-from tcv.calculation.pandapower.TestGrid import test_grid_three_winding
+from tcv.calculation.pandapower.TestBench import TestBench, __calc_current_angle, calc_current_angles, \
+    extract_solution
+from tcv.calculation.pandapower.TestGrid import THREE_WINDING_TRANSFORMER, test_grid_three_winding, \
+    set_operating_point_three_winding
 from tcv.calculation.result.GridResultThreeWinding import GridResultThreeWinding
 
+# Entries of a record, that identify the operating point, in the order of TestHelper's operating points
+KEY_NAMES = ('tap_pos', 'p_mv', 'p_lv')
+
 
 def extract_results(net: pp.pandapowerNet = None) -> GridResultThreeWinding:
     """
@@ -27,7 +31,7 @@ def extract_results(net: pp.pandapowerNet = None) -> GridResultThreeWinding:
 
     # Power
     p_mv_kw = net.res_trafo3w.p_mv_mw[0] * 1000.0
-    q_mv_kvar = net.res_trafo3w.q_lv_mvar[0] * 1000.0
+    q_mv_kvar = net.res_trafo3w.q_mv_mvar[0] * 1000.0
     s_mv_kva = sqrt(pow(p_mv_kw, 2) + pow(q_mv_kvar, 2))
 
     # Current at high voltage node
@@ -45,7 +49,7 @@ def extract_results(net: pp.pandapowerNet = None) -> GridResultThreeWinding:
     s_lv_kva = sqrt(pow(p_lv_kw, 2) + pow(q_lv_kvar, 2))
 
     # Current
-    i_mag_lv_a = net.res_trafo3w.i_mv_ka[0] * 1000.0
+    i_mag_lv_a = net.res_trafo3w.i_lv_ka[0] * 1000.0
     i_ang_lv_degree = __calc_current_angle(p_lv_kw, q_lv_kvar, v_ang_lv_degree)
 
     # --- High voltage node ---
@@ -66,17 +70,141 @@ def extract_results(net: pp.pandapowerNet = None) -> GridResultThreeWinding:
                                   s_lv_kva=s_lv_kva, i_mag_lv_a=i_mag_lv_a, i_ang_lv_degree=i_ang_lv_degree)
 
 
+def extract_solution_three_winding(net: pp.pandapowerNet) -> np.ndarray:
+    """
+    Read the solution of interest from pandapower's internal result arrays (cf. TestBench.extract_solution). The
+    three winding transformer is represented by the branches high voltage node to star point, star point to medium
+    and star point to low voltage node.
+
+    Parameters:
+        net (pandapowerNet): pandapower's net model, additionally carrying results of last simulation
+
+    Returns:
+        ndarray: Complex voltages at the high, medium and low voltage node in p.u. as well as complex power at the
+        high, medium and low voltage port in MVA
+    """
+    return extract_solution(net, buses=[0, 1, 2],
+                            branch_ends=[("trafo3w", 0, "from"), ("trafo3w", 1, "to"), ("trafo3w", 2, "to")])
+
+
+def results_from_solutions(solutions: np.ndarray) -> list:
+    """
+    Derive the results of interest for a whole batch of operating points at once
+
+    Parameters:
+        solutions (ndarray): One row per operating point as given by extract_solution_three_winding
+
+    Returns:
+        list: GridResultThreeWinding per operating point
+    """
+    columns = {}
+    v_ang_degree = {'hv': np.zeros(len(solutions))}
+    for port_idx, port in enumerate(['hv', 'mv', 'lv']):
+        v = solutions[:, port_idx]
+        s_mva = solutions[:, port_idx + 3]
+        if port != 'hv':
+            v_ang_degree[port] = np.degrees(np.angle(v))
+            columns['v_%s_pu' % port] = np.abs(v)
+            columns['v_ang_%s_degree' % port] = v_ang_degree[port]
+        p_kw, q_kvar = s_mva.real * 1000.0, s_mva.imag * 1000.0
+        columns['p_%s_kw' % port] = p_kw
+        columns['q_%s_kvar' % port] = q_kvar
+        columns['s_%s_kva' % port] = np.abs(s_mva) * 1000.0
+        columns['i_mag_%s_a' % port] = np.abs(s_mva) / (
+                np.abs(v) * THREE_WINDING_TRANSFORMER['vn_%s_kv' % port] * sqrt(3)) * 1000.0
+        columns['i_ang_%s_degree' % port] = calc_current_angles(p_kw, q_kvar, v_ang_degree[port])
+    return [GridResultThreeWinding(**dict(zip(GridResultThreeWinding.FIELDS, values))) for values in
+            zip(*(columns[field].tolist() for field in GridResultThreeWinding.FIELDS))]
+
+
 class ThreeWindingTestBench(TestBench):
-    def __init__(self):
-        super().__init__()
+    GRID_PARAMETERS = THREE_WINDING_TRANSFORMER
+
+    def __init__(self, setup_logging: bool = True):
+        super().__init__(setup_logging)
 
     def calculate(self, tap_min: int = -10, tap_max: int = 10, s_nom_hv_mva: float = 300.0, s_nom_mv_mva: float = 300.0,
                   s_nom_lv_mva: float = 100.0, p_step: int = 11, v_ref_kv: float = 380.0,
                   s_ref_mva: float = 300.0, with_main_field_losses: bool = False,
-                  tap_at_star_point: bool = False) -> list:
+                  tap_at_star_point: bool = False, warm_start: bool = False, workers: int = 1,
+                  cache_admittances: bool = False, fast_extraction: bool = False, checkpoint_directory: str = None,
+                  resume: bool = False, checkpoint_every: int = 1000) -> list:
         """
         Iterate over tap positions, medium and low voltage power consumption and perform the power flow calculation.
 
+        If warm starting is enabled, the operating points are walked as a serpentine (cf.
+        TestHelper.serpentine_order) and every power flow is initialized with the result of the previous one. The
+        results are nevertheless handed back in canonical order. The Newton-Raphson iterations needed per operating
+        point are available in canonical order in 'iterations' afterwards.
+
+        With more than one worker, every tap position is calculated in a separate process (cf.
+        TestBench._calculate_parallel). Each worker logs to it's own file.
+
+        If admittances are cached, pandapower's internal grid representation is only built once per tap position and
+        all further operating points are handed to pandapower's Newton-Raphson solver directly (cf. AdmittanceCache).
+
+        With fast extraction, pandapower is asked for the nodal voltages only. The solution is read from pandapower's
+        internal arrays and the results of all operating points are derived in one go after each tap position.
+        Together with cached admittances, pandapower's result tables aren't built at all.
+
+        To write the results while the sweep is still running, use iter_calculate instead.
+
+        If a checkpoint directory is given, the completed operating points are persisted every 'checkpoint_every'
+        operating points and at the end of each tap position (cf. Checkpoint). Thereby, an aborted sweep loses at most
+        'checkpoint_every' operating points. The checkpoint is tied to the sweep's parameters. When resuming, only the
+        operating points missing in the checkpoint are calculated. Their Newton-Raphson iterations are reported as
+        zero.
+
+        Parameters:
+            tap_min (int): Minimum tap position of the transformer
+            tap_max (int): Maximum tap position of the transformer
+            s_nom_hv_mva (float): Nominal apparent power at the high voltage node
+            s_nom_mv_mva (float): Nominal apparent power at the medium voltage node
+            s_nom_lv_mva (float): Nominal apparent power at the low voltage node
+            p_step (float): Amount of ticks along each active power axis
+            v_ref_kv (float): Reference voltage of the calculation
+            s_ref_mva (float): Reference apparent power of the calculation
+            with_main_field_losses (bool): True, if the main field losses may be considered
+            tap_at_star_point (bool): True, if the tap changer is located at the transformers star point
+            warm_start (bool): True, if each power flow shall be initialized with the previous result
+            workers (int): Amount of worker processes to distribute the tap positions to
+            cache_admittances (bool): True, if the admittance matrix shall only be built once per tap position
+            fast_extraction (bool): True, if the results shall be read from pandapower's internal arrays
+            checkpoint_directory (str): Base directory of the checkpoints, if the sweep shall be checkpointed
+            resume (bool): True, if the operating points of the checkpoint shall be reused
+            checkpoint_every (int): Amount of operating points, after which the completed ones are persisted
+        """
+        if workers > 1:
+            return self._calculate_parallel(tap_min=tap_min, tap_max=tap_max, workers=workers,
+                                            s_nom_hv_mva=s_nom_hv_mva, s_nom_mv_mva=s_nom_mv_mva,
+                                            s_nom_lv_mva=s_nom_lv_mva, p_step=p_step, v_ref_kv=v_ref_kv,
+                                            s_ref_mva=s_ref_mva, with_main_field_losses=with_main_field_losses,
+                                            tap_at_star_point=tap_at_star_point, warm_start=warm_start,
+                                            cache_admittances=cache_admittances, fast_extraction=fast_extraction,
+                                            checkpoint_directory=checkpoint_directory, resume=resume,
+                                            checkpoint_every=checkpoint_every)
+        return list(self.iter_calculate(tap_min=tap_min, tap_max=tap_max, s_nom_hv_mva=s_nom_hv_mva,
+                                        s_nom_mv_mva=s_nom_mv_mva, s_nom_lv_mva=s_nom_lv_mva, p_step=p_step,
+                                        v_ref_kv=v_ref_kv, s_ref_mva=s_ref_mva,
+                                        with_main_field_losses=with_main_field_losses,
+                                        tap_at_star_point=tap_at_star_point, warm_start=warm_start,
+                                        cache_admittances=cache_admittances, fast_extraction=fast_extraction,
+                                        checkpoint_directory=checkpoint_directory, resume=resume,
+                                        checkpoint_every=checkpoint_every))
+
+    def iter_calculate(self, tap_min: int = -10, tap_max: int = 10, s_nom_hv_mva: float = 300.0,
+                       s_nom_mv_mva: float = 300.0, s_nom_lv_mva: float = 100.0, p_step: int = 11,
+                       v_ref_kv: float = 380.0, s_ref_mva: float = 300.0, with_main_field_losses: bool = False,
+                       tap_at_star_point: bool = False, warm_start: bool = False, cache_admittances: bool = False,
+                       fast_extraction: bool = False, checkpoint_directory: str = None, resume: bool = False,
+                       checkpoint_every: int = 1000):
+        """
+        Streaming counterpart of calculate. The sweep is performed tap position by tap position and the results are
+        handed out as soon as a tap position is finished, so that only one tap position is held in memory at a time.
+        The results are yielded in canonical order and are identical to the ones of calculate. They may directly be
+        handed to a result sink (cf. ResultSink.consume). The Newton-Raphson iterations are appended to 'iterations'
+        with every finished tap position.
+
         Parameters:
             tap_min (int): Minimum tap position of the transformer
             tap_max (int): Maximum tap position of the transformer
@@ -88,43 +216,81 @@ class ThreeWindingTestBench(TestBench):
             s_ref_mva (float): Reference apparent power of the calculation
             with_main_field_losses (bool): True, if the main field losses may be considered
             tap_at_star_point (bool): True, if the tap changer is located at the transformers star point
+            warm_start (bool): True, if each power flow shall be initialized with the previous result
+            cache_admittances (bool): True, if the admittance matrix shall only be built once per tap position
+            fast_extraction (bool): True, if the results shall be read from pandapower's internal arrays
+            checkpoint_directory (str): Base directory of the checkpoints, if the sweep shall be checkpointed
+            resume (bool): True, if the operating points of the checkpoint shall be reused
+            checkpoint_every (int): Amount of operating points, after which the completed ones are persisted
+
+        Returns:
+            generator: Dictionaries with tap position, medium and low voltage active power and result per operating
+            point
         """
         # --- General information ---
-        tap_range: range = range(tap_min, tap_max + 1)
         p_mv_range_mw = [round(p_pu * s_nom_mv_mva) for p_pu in np.linspace(-1.0, 1.0, p_step)]  # Power range @ mv port
         p_step_lv_mw = 2 * s_nom_lv_mva / (p_step - 1)  # Bin width at the lv side
         self.logger.info(
             ("Starting to calculate grid with pandapower. Parameters: tap = %i...%i, reference = %.2f MVA @ %.2f kV, " %
              (tap_min, tap_max, s_ref_mva, v_ref_kv)) + "tap changer is" + (
                 " " if tap_at_star_point else " not ") + "at star point")
+        self.iterations = []
+        directions = [True, True, True]
+        checkpoint = self._open_checkpoint(
+            checkpoint_directory, resume, key_names=KEY_NAMES, result_class=GridResultThreeWinding,
+            parameters={'bench': type(self).__name__, 's_nom_hv_mva': s_nom_hv_mva, 's_nom_mv_mva': s_nom_mv_mva,
+                        's_nom_lv_mva': s_nom_lv_mva, 'p_step': p_step, 'v_ref_kv': v_ref_kv, 's_ref_mva': s_ref_mva,
+                        'with_main_field_losses': with_main_field_losses, 'tap_at_star_point': tap_at_star_point})
+
+        # --- Build the grid once and only move its operating point during the sweep ---
+        net = test_grid_three_winding(sn_mva=s_ref_mva, with_main_field_losses=with_main_field_losses,
+                                      tap_at_star_point=tap_at_star_point)
 
-        # --- Prepare the output dictionary ---
-        out = []
+        # --- Iterate through all tap positions and their operating points ---
+        init = "auto"
+        for tap_pos in range(tap_min, tap_max + 1):
+            operating_points = TestHelper.operating_points_three_winding(range(tap_pos, tap_pos + 1), p_mv_range_mw,
+                                                                         s_nom_hv_mva, s_nom_lv_mva, p_step_lv_mw)
+            order = TestHelper.serpentine_order(operating_points, directions) if warm_start else range(
+                len(operating_points))
+            out = self._completed_records(checkpoint, resume, tap_pos, operating_points)
+            order = [idx for idx in order if out[idx] is None]
+            iterations = [0] * len(operating_points)
+            solutions = np.zeros((len(operating_points), 6), dtype=complex) if fast_extraction else None
+            pending = []
 
-        # --- Iterate through tap positions ---
-        for tap_pos in tap_range:
-            # --- Iterate over medium voltage load ---
-            for p_mv_mw in p_mv_range_mw:
-                # --- Figure out permissible power range for low voltage load and iterate over it
-                p_lv_range_mw: ndarray = TestHelper.permissible_power_range_lv(s_nom_hv_mva, s_nom_lv_mva, p_mv_mw,
-                                                                               p_step_lv_mw)
+            for idx in order:
+                _, p_mv_mw, p_lv_mw = operating_points[idx]
                 self.logger.debug(
-                    "Power range for low voltage load is from %.2f...%.2f MW (medium voltage load is at %.2f MW)" % (
-                        min(p_lv_range_mw), max(p_lv_range_mw), p_mv_mw))
-
-                for p_lv_mw in p_lv_range_mw:
-                    self.logger.debug(
-                        "Perform power flow calculation with the following parameters:\n\ttap pos = %i\n\tp_mv_mw = "
-                        "%.2f MW\n\tp_lv_mw = %.2f MW" % (tap_pos, p_mv_mw, p_lv_mw))
-                    net = test_grid_three_winding(tap_pos=tap_pos, p_mv_mw=p_mv_mw, p_lv_mw=p_lv_mw, sn_mva=s_ref_mva,
-                                                  with_main_field_losses=with_main_field_losses,
-                                                  tap_at_star_point=tap_at_star_point)
-                    pp.runpp(net)
-
-                    # Extract the result of this model run
-                    result = extract_results(net)
-
-                    # Register the results
-                    out.append({'tap_pos': tap_pos, 'p_mv': p_mv_mw, 'p_lv': p_lv_mw, 'result': result})
-                # --- Register the results to mv loop ---
-        return out
+                    "Perform power flow calculation with the following parameters:\n\ttap pos = %i\n\tp_mv_mw = "
+                    "%.2f MW\n\tp_lv_mw = %.2f MW" % (tap_pos, p_mv_mw, p_lv_mw))
+                set_operating_point_three_winding(net, tap_pos=tap_pos, p_mv_mw=p_mv_mw, p_lv_mw=p_lv_mw)
+                if cache_admittances:
+                    self.admittance_cache.runpp(net, key=(tap_pos, with_main_field_losses, tap_at_star_point),
+                                                init=init, only_v_results=fast_extraction)
+                else:
+                    pp.runpp(net, init=init, only_v_results=fast_extraction)
+                iterations[idx] = int(net._ppc["iterations"])
+                if warm_start:
+                    init = "results"
+
+                # Extract the result of this model run and register it
+                if fast_extraction:
+                    solutions[idx] = extract_solution_three_winding(net)
+                else:
+                    out[idx] = {'tap_pos': tap_pos, 'p_mv': p_mv_mw, 'p_lv': p_lv_mw, 'result': extract_results(net)}
+                pending.append(idx)
+                if checkpoint is not None and len(pending) >= checkpoint_every:
+                    self._complete_records(checkpoint, KEY_NAMES, operating_points, pending, out, solutions,
+                                           results_from_solutions)
+                    pending = []
+
+            self._complete_records(checkpoint, KEY_NAMES, operating_points, pending, out, solutions,
+                                   results_from_solutions)
+            self.iterations.extend(iterations)
+            yield from out
+
+        self.logger.info("Performed %i power flow calculations with %i Newton-Raphson iterations in total." % (
+            len(self.iterations), sum(self.iterations)))
+        if cache_admittances:
+            self._log_admittance_cache()
@@ -6,10 +6,16 @@ import pandapower
 import pandapower as pp
 from numpy.ma import arange
 
-from tcv.calculation.pandapower.TestGrid import TapSide, TransformerModel, test_grid_two_winding
+from tcv.calculation import TestHelper
+from tcv.calculation.pandapower.TestGrid import TapSide, TransformerModel, TWO_WINDING_TRANSFORMER, \
+    test_grid_two_winding, set_operating_point_two_winding
 from tcv.calculation.result.GridResultTwoWinding import GridResultTwoWinding
 from tcv.calculation.pandapower import ResultWriter
-from tcv.calculation.pandapower.TestBench import TestBench, __calc_current_angle
+from tcv.calculation.pandapower.TestBench import TestBench, __calc_current_angle, calc_current_angles, \
+    extract_solution
+
+# Entries of a record, that identify the operating point, in the order of TestHelper's operating points
+KEY_NAMES = ('tap_pos', 'p_lv')
 
 
 def extract_results(net: pandapower.pandapowerNet = None):
@@ -50,13 +56,65 @@ def extract_results(net: pandapower.pandapowerNet = None):
                                 i_ang_lv_degree=i_ang_lv_degree)
 
 
+def extract_solution_two_winding(net: pandapower.pandapowerNet) -> np.ndarray:
+    """
+    Read the solution of interest from pandapower's internal result arrays (cf. TestBench.extract_solution)
+
+    Parameters:
+        net (pandapowerNet): pandapower's net model, additionally carrying results of last simulation
+
+    Returns:
+        ndarray: Complex voltages at the high and low voltage node in p.u. as well as complex power at the high and
+        low voltage port in MVA
+    """
+    return extract_solution(net, buses=[0, 1], branch_ends=[("trafo", 0, "from"), ("trafo", 0, "to")])
+
+
+def results_from_solutions(solutions: np.ndarray) -> list:
+    """
+    Derive the results of interest for a whole batch of operating points at once
+
+    Parameters:
+        solutions (ndarray): One row per operating point as given by extract_solution_two_winding
+
+    Returns:
+        list: GridResultTwoWinding per operating point
+    """
+    v_hv, v_lv, s_hv_mva, s_lv_mva = solutions.T
+    v_ang_degree = np.degrees(np.angle(v_lv))
+    p_hv_kw, q_hv_kvar = s_hv_mva.real * 1000.0, s_hv_mva.imag * 1000.0
+    p_lv_kw, q_lv_kvar = s_lv_mva.real * 1000.0, s_lv_mva.imag * 1000.0
+    i_mag_hv_a = np.abs(s_hv_mva) / (np.abs(v_hv) * TWO_WINDING_TRANSFORMER['vn_hv_kv'] * sqrt(3)) * 1000.0
+    i_mag_lv_a = np.abs(s_lv_mva) / (np.abs(v_lv) * TWO_WINDING_TRANSFORMER['vn_lv_kv'] * sqrt(3)) * 1000.0
+    columns = {
+        'v_lv_pu': np.abs(v_lv),
+        'v_ang_lv_degree': v_ang_degree,
+        'p_hv_kw': p_hv_kw,
+        'q_hv_kvar': q_hv_kvar,
+        's_hv_kva': np.abs(s_hv_mva) * 1000.0,
+        'i_mag_hv_a': i_mag_hv_a,
+        'i_ang_hv_degree': calc_current_angles(p_hv_kw, q_hv_kvar, 0.0),
+        'p_lv_kw': p_lv_kw,
+        'q_lv_kvar': q_lv_kvar,
+        's_lv_kva': np.abs(s_lv_mva) * 1000.0,
+        'i_mag_lv_a': i_mag_lv_a,
+        'i_ang_lv_degree': calc_current_angles(p_lv_kw, q_lv_kvar, v_ang_degree)
+    }
+    return [GridResultTwoWinding(**dict(zip(GridResultTwoWinding.FIELDS, values))) for values in
+            zip(*(columns[field].tolist() for field in GridResultTwoWinding.FIELDS))]
+
+
 class TwoWindingTestBench(TestBench):
+    GRID_PARAMETERS = TWO_WINDING_TRANSFORMER
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, setup_logging: bool = True):
+        super().__init__(setup_logging)
 
     def calculate(self, tap_min=-10, tap_max=10, p_min=-1.0, p_max=1.0, s_nom_mva: float = 0.63, p_step: int = 21,
-                  v_ref_kv=0.4, s_ref_mva=0.4, tap_side=TapSide.LV, transformer_model=TransformerModel.PI):
+                  v_ref_kv=0.4, s_ref_mva=0.4, tap_side=TapSide.LV, transformer_model=TransformerModel.PI,
+                  warm_start: bool = False, workers: int = 1, cache_admittances: bool = False,
+                  fast_extraction: bool = False, checkpoint_directory: str = None, resume: bool = False,
+                  checkpoint_every: int = 1000):
         """
         Performs a series of power flow calculations with pandapower and the transformer test bench. It iterates through
         all permissible tap positions and further sweeps the range of permissible power infeed or consumption.
@@ -64,6 +122,29 @@ class TwoWindingTestBench(TestBench):
         representation of the tap position, whereas values are a list of tuples with relative active power and the
         result object.
 
+        If warm starting is enabled, the operating points are walked as a serpentine (cf.
+        TestHelper.serpentine_order) and every power flow is initialized with the result of the previous one. The
+        results are nevertheless handed back in canonical order. The Newton-Raphson iterations needed per operating
+        point are available in canonical order in 'iterations' afterwards.
+
+        With more than one worker, every tap position is calculated in a separate process (cf.
+        TestBench._calculate_parallel). Each worker logs to it's own file.
+
+        If admittances are cached, pandapower's internal grid representation is only built once per tap position and
+        all further operating points are handed to pandapower's Newton-Raphson solver directly (cf. AdmittanceCache).
+
+        With fast extraction, pandapower is asked for the nodal voltages only. The solution is read from pandapower's
+        internal arrays and the results of all operating points are derived in one go after each tap position.
+        Together with cached admittances, pandapower's result tables aren't built at all.
+
+        To write the results while the sweep is still running, use iter_calculate instead.
+
+        If a checkpoint directory is given, the completed operating points are persisted every 'checkpoint_every'
+        operating points and at the end of each tap position (cf. Checkpoint). Thereby, an aborted sweep loses at most
+        'checkpoint_every' operating points. The checkpoint is tied to the sweep's parameters. When resuming, only the
+        operating points missing in the checkpoint are calculated. Their Newton-Raphson iterations are reported as
+        zero.
+
         Parameters:
             tap_min (int): Minimum permissible tap position
             tap_max (int): Maximum permissible tap position
@@ -75,6 +156,60 @@ class TwoWindingTestBench(TestBench):
             s_ref_mva (float): Nominal apparent power of the reference system in MVA
             tap_side (TapSide): Position of the tap changer
             transformer_model (TapModel): Type of model to use for calculation
+            warm_start (bool): True, if each power flow shall be initialized with the previous result
+            workers (int): Amount of worker processes to distribute the tap positions to
+            cache_admittances (bool): True, if the admittance matrix shall only be built once per tap position
+            fast_extraction (bool): True, if the results shall be read from pandapower's internal arrays
+            checkpoint_directory (str): Base directory of the checkpoints, if the sweep shall be checkpointed
+            resume (bool): True, if the operating points of the checkpoint shall be reused
+            checkpoint_every (int): Amount of operating points, after which the completed ones are persisted
+        """
+        if workers > 1:
+            return self._calculate_parallel(tap_min=tap_min, tap_max=tap_max, workers=workers, p_min=p_min,
+                                            p_max=p_max, s_nom_mva=s_nom_mva, p_step=p_step, v_ref_kv=v_ref_kv,
+                                            s_ref_mva=s_ref_mva, tap_side=tap_side,
+                                            transformer_model=transformer_model, warm_start=warm_start,
+                                            cache_admittances=cache_admittances, fast_extraction=fast_extraction,
+                                            checkpoint_directory=checkpoint_directory, resume=resume,
+                                            checkpoint_every=checkpoint_every)
+        return list(self.iter_calculate(tap_min=tap_min, tap_max=tap_max, p_min=p_min, p_max=p_max,
+                                        s_nom_mva=s_nom_mva, p_step=p_step, v_ref_kv=v_ref_kv, s_ref_mva=s_ref_mva,
+                                        tap_side=tap_side, transformer_model=transformer_model,
+                                        warm_start=warm_start, cache_admittances=cache_admittances,
+                                        fast_extraction=fast_extraction, checkpoint_directory=checkpoint_directory,
+                                        resume=resume, checkpoint_every=checkpoint_every))
+
+    def iter_calculate(self, tap_min=-10, tap_max=10, p_min=-1.0, p_max=1.0, s_nom_mva: float = 0.63, p_step: int = 21,
+                       v_ref_kv=0.4, s_ref_mva=0.4, tap_side=TapSide.LV, transformer_model=TransformerModel.PI,
+                       warm_start: bool = False, cache_admittances: bool = False, fast_extraction: bool = False,
+                       checkpoint_directory: str = None, resume: bool = False, checkpoint_every: int = 1000):
+        """
+        Streaming counterpart of calculate. The sweep is performed tap position by tap position and the results are
+        handed out as soon as a tap position is finished, so that only one tap position is held in memory at a time.
+        The results are yielded in canonical order and are identical to the ones of calculate. They may directly be
+        handed to a result sink (cf. ResultSink.consume). The Newton-Raphson iterations are appended to 'iterations'
+        with every finished tap position.
+
+        Parameters:
+            tap_min (int): Minimum permissible tap position
+            tap_max (int): Maximum permissible tap position
+            p_min (float): Minimum permissible active power (negative = infeed) in p.u.
+            p_max (float): Maximum permissible active power (negative = infeed) in p.u.
+            s_nom_mva (float): Nominal power of the load in MW
+            p_step (float): Amount of ticks along active power axis
+            v_ref_kv (float): Nominal voltage of the reference system in kV
+            s_ref_mva (float): Nominal apparent power of the reference system in MVA
+            tap_side (TapSide): Position of the tap changer
+            transformer_model (TapModel): Type of model to use for calculation
+            warm_start (bool): True, if each power flow shall be initialized with the previous result
+            cache_admittances (bool): True, if the admittance matrix shall only be built once per tap position
+            fast_extraction (bool): True, if the results shall be read from pandapower's internal arrays
+            checkpoint_directory (str): Base directory of the checkpoints, if the sweep shall be checkpointed
+            resume (bool): True, if the operating points of the checkpoint shall be reused
+            checkpoint_every (int): Amount of operating points, after which the completed ones are persisted
+
+        Returns:
+            generator: Dictionaries with tap position, active power and result per operating point
         """
         # --- General information ---
         self.logger.info(
@@ -82,27 +217,64 @@ class TwoWindingTestBench(TestBench):
             "reference = %.2f MVA @ %.2f kV, tap side = %s" %
             (tap_min, tap_max, p_min, p_max, s_nom_mva, s_ref_mva, v_ref_kv, tap_side))
         self.logger.info("Preparing the general information")
-        tap_range = range(tap_min, tap_max + 1)  # Range of available tap positions
         p_range = [round(p_pu * s_nom_mva * 1000) / 1000 for p_pu in
                    np.linspace(-1.0, 1.0, p_step)]  # Power range @ mv port
+        self.iterations = []
+        directions = [True, True]
+        checkpoint = self._open_checkpoint(
+            checkpoint_directory, resume, key_names=KEY_NAMES, result_class=GridResultTwoWinding,
+            parameters={'bench': type(self).__name__, 'p_min': p_min, 'p_max': p_max, 's_nom_mva': s_nom_mva,
+                        'p_step': p_step, 'v_ref_kv': v_ref_kv, 's_ref_mva': s_ref_mva, 'tap_side': tap_side,
+                        'transformer_model': transformer_model})
+
+        # --- Build the grid once and only move its operating point during the sweep ---
+        net = test_grid_two_winding(sn_mva=s_ref_mva, tap_side=tap_side)
+
+        # --- Iterate through all tap positions and their operating points ---
+        init = "auto"
+        for tap_pos in range(tap_min, tap_max + 1):
+            operating_points = TestHelper.operating_points_two_winding(range(tap_pos, tap_pos + 1), p_range)
+            order = TestHelper.serpentine_order(operating_points, directions) if warm_start else range(
+                len(operating_points))
+            out = self._completed_records(checkpoint, resume, tap_pos, operating_points)
+            order = [idx for idx in order if out[idx] is None]
+            iterations = [0] * len(operating_points)
+            solutions = np.zeros((len(operating_points), 4), dtype=complex) if fast_extraction else None
+            pending = []
 
-        # --- Prepare the output dictionary ---
-        out = []
+            for idx in order:
+                _, p = operating_points[idx]
 
-        # --- Iterate through all available tap positions ---
-        tap_pos: int
-        for tap_pos in tap_range:
-            for p in p_range:
                 # Perform the calculation
                 self.logger.debug(
                     "Power flow with tap position = %i and p = %.3f MW)" % (tap_pos, p))
-                net = test_grid_two_winding(tap_pos, p, s_ref_mva, tap_side)
-                pp.runpp(net, trafo_model=transformer_model.value)
+                set_operating_point_two_winding(net, tap_pos=tap_pos, p_mw=p)
+                if cache_admittances:
+                    self.admittance_cache.runpp(net, key=(tap_pos, tap_side, transformer_model), init=init,
+                                                trafo_model=transformer_model.value, only_v_results=fast_extraction)
+                else:
+                    pp.runpp(net, trafo_model=transformer_model.value, init=init, only_v_results=fast_extraction)
+                iterations[idx] = int(net._ppc["iterations"])
+                if warm_start:
+                    init = "results"
 
-                # Extract the result of this model run
-                result = extract_results(net)
+                # Extract the result of this model run and register it
+                if fast_extraction:
+                    solutions[idx] = extract_solution_two_winding(net)
+                else:
+                    out[idx] = {'tap_pos': tap_pos, 'p_lv': p, 'result': extract_results(net)}
+                pending.append(idx)
+                if checkpoint is not None and len(pending) >= checkpoint_every:
+                    self._complete_records(checkpoint, KEY_NAMES, operating_points, pending, out, solutions,
+                                           results_from_solutions)
+                    pending = []
 
-                # Register the results
-                out.append({'tap_pos': tap_pos, 'p_lv': p, 'result': result})
+            self._complete_records(checkpoint, KEY_NAMES, operating_points, pending, out, solutions,
+                                   results_from_solutions)
+            self.iterations.extend(iterations)
+            yield from out
 
-        return out
+        self.logger.info("Performed %i power flow calculations with %i Newton-Raphson iterations in total." % (
+            len(self.iterations), sum(self.iterations)))
+        if cache_admittances:
+            self._log_admittance_cache()
@@ -1,11 +1,23 @@
+import csv
+import glob
+import os
 import re
-from datetime import timedelta
-from typing import List, Dict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+from itertools import repeat, groupby
+from typing import List, Dict, Union, Iterator
 from uuid import UUID
 
 from tcv.calculation.powersystemdatamodel import ResultConverter
-from tcv.calculation.powersystemdatamodel.model.TimeSeriesResult import TimeSeriesResult
+from tcv.calculation.powersystemdatamodel.model import LoadResult, NodeResult, Transformer2WResult, Transformer3WResult
+from tcv.calculation.powersystemdatamodel.model.ColumnarResult import ColumnarResult, to_datetime
+from tcv.calculation.powersystemdatamodel.model.TimeSeriesResult import TimeSeriesResult, NODE_RESULT_FILE, \
+    LOAD_RESULT_FILE, TRANSFORMER_2W_RESULT_FILE, TRANSFORMER_3W_RESULT_FILE
+from tcv.calculation.result.GridResultThreeWinding import GridResultThreeWinding
+from tcv.calculation.result.GridResultTwoWinding import GridResultTwoWinding
 from tcv.exception.ResultCollectionException import ResultCollectionException
+from tcv.util.CompressedFile import find_file, open_text
 
 
 def tap_pos_to_base_directory(tap_pos_range: range, pattern: str) -> Dict[int, str]:
@@ -22,12 +34,37 @@ def tap_pos_to_base_directory(tap_pos_range: range, pattern: str) -> Dict[int, s
     return mapping
 
 
-def collect(tap_to_base_directory: dict, node_a: UUID, node_b: UUID, node_c: UUID, load_mv: UUID, load_lv: UUID,
-            v_rated_hv: float, v_rated_mv: float, v_rated_lv: float) -> List[dict]:
+def discover_base_directories(pattern: str) -> Dict[int, str]:
     """
-    Gather all results from a mapping from tap position to base directory and add them to a flat list
+    Builds a mapping from tap position to base directory from the directories, that are actually present. The pattern
+    is a glob, that has to contain exactly one '*' (or '%i') at the place of the tap position, e.g.
+    'results/three_winding/simona/loaded/examination_tap_*'. Matches, that don't carry an integer at this place, are
+    skipped.
 
-    :param tap_to_base_directory: Mapping from tap changer position to base directory
+    :param pattern: base directory glob
+    """
+    pattern = re.sub('%i', '*', pattern)
+    if pattern.count('*') != 1:
+        raise ValueError("The pattern '%s' has to contain exactly one wildcard for the tap position." % pattern)
+    prefix, suffix = pattern.split('*')
+    mapping = {}
+    for base_directory in glob.glob(glob.escape(prefix) + '*' + glob.escape(suffix)):
+        # The glob hands back the literal parts of the pattern unaltered
+        tap_pos = base_directory[len(prefix):len(base_directory) - len(suffix)]
+        if re.fullmatch('-?\\d+', tap_pos) is not None and os.path.isdir(base_directory):
+            mapping[int(tap_pos)] = base_directory
+    return dict(sorted(mapping.items()))
+
+
+def collect(tap_to_base_directory: Union[dict, str], node_a: UUID, node_b: UUID, node_c: UUID, load_mv: UUID,
+            load_lv: UUID, v_rated_hv: float, v_rated_mv: float, v_rated_lv: float, workers: int = 1) -> List[dict]:
+    """
+    Gather all results from a mapping from tap position to base directory and add them to a flat list. The results
+    are ordered by ascending tap position. As the directories are independent of each other, they may be parsed and
+    converted within a pool of worker processes.
+
+    :param tap_to_base_directory: Mapping from tap changer position to base directory or a glob to discover the base
+        directories from (cf. discover_base_directories)
     :param node_a: Unique identifier of the highest voltage node
     :param node_b: Unique identifier of the medium voltage node
     :param node_c: Unique identifier of the low voltage node
@@ -36,38 +73,67 @@ def collect(tap_to_base_directory: dict, node_a: UUID, node_b: UUID, node_c: UUI
     :param v_rated_hv: Rated voltage magnitude of the highest voltage node
     :param v_rated_mv: Rated voltage magnitude of the medium voltage node
     :param v_rated_lv: Rated voltage magnitude of the low voltage node
+    :param workers: Amount of worker processes to distribute the directories to
     """
-    results = []
-    for tap_pos in tap_to_base_directory:
-        base_directory = tap_to_base_directory[tap_pos]
-        results.extend(
-            _collect(base_directory=base_directory, node_a=node_a, node_b=node_b, node_c=node_c, load_mv=load_mv,
-                     load_lv=load_lv, v_rated_hv=v_rated_hv, v_rated_mv=v_rated_mv, v_rated_lv=v_rated_lv,
-                     tap_pos=tap_pos))
-    return results
+    return _collect_all(_collect, tap_to_base_directory, workers, node_a=node_a, node_b=node_b, node_c=node_c,
+                        load_mv=load_mv, load_lv=load_lv, v_rated_hv=v_rated_hv, v_rated_mv=v_rated_mv,
+                        v_rated_lv=v_rated_lv)
 
 
-def collect_two_winding(tap_to_base_directory: dict, node_a: UUID, node_b: UUID, load: UUID, v_rated_hv: float,
-                        v_rated_lv: float) -> List[dict]:
+def collect_two_winding(tap_to_base_directory: Union[dict, str], node_a: UUID, node_b: UUID, load: UUID,
+                        v_rated_hv: float, v_rated_lv: float, workers: int = 1) -> List[dict]:
     """
-    Gather all results from a mapping from tap position to base directory and add them to a flat list
+    Gather all results from a mapping from tap position to base directory and add them to a flat list. The results
+    are ordered by ascending tap position. As the directories are independent of each other, they may be parsed and
+    converted within a pool of worker processes.
 
-    :param tap_to_base_directory: Mapping from tap changer position to base directory
+    :param tap_to_base_directory: Mapping from tap changer position to base directory or a glob to discover the base
+        directories from (cf. discover_base_directories)
     :param node_a: Unique identifier of the highest voltage node
     :param node_b: Unique identifier of the medium voltage node
     :param load: Unique identifier of the low voltage load
     :param v_rated_hv: Rated voltage magnitude of the highest voltage node
     :param v_rated_lv: Rated voltage magnitude of the low voltage node
+    :param workers: Amount of worker processes to distribute the directories to
     """
+    return _collect_all(_collect_two_winding, tap_to_base_directory, workers, node_a=node_a, node_b=node_b,
+                        load=load, v_rated_hv=v_rated_hv, v_rated_lv=v_rated_lv)
+
+
+def _collect_all(collect_function, tap_to_base_directory: Union[dict, str], workers: int, **kwargs) -> List[dict]:
+    """
+    Apply the collect function to all base directories and merge the results in ascending tap position
+
+    :param collect_function: Function, that collects the results of one base directory
+    :param tap_to_base_directory: Mapping from tap changer position to base directory or a glob
+    :param workers: Amount of worker processes to distribute the directories to
+    :param kwargs: All further keyword arguments of the collect function
+    """
+    if isinstance(tap_to_base_directory, str):
+        tap_to_base_directory = discover_base_directories(tap_to_base_directory)
+    chunks = [dict(kwargs, base_directory=tap_to_base_directory[tap_pos], tap_pos=tap_pos) for tap_pos in
+              sorted(tap_to_base_directory)]
     results = []
-    for tap_pos in tap_to_base_directory:
-        base_directory = tap_to_base_directory[tap_pos]
-        results.extend(
-            _collect_two_winding(base_directory=base_directory, node_a=node_a, node_b=node_b, load=load,
-                                 v_rated_hv=v_rated_hv, v_rated_lv=v_rated_lv, tap_pos=tap_pos))
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for partial_results in executor.map(_collect_in_worker, repeat(collect_function), chunks):
+                results.extend(partial_results)
+    else:
+        for chunk in chunks:
+            results.extend(collect_function(**chunk))
     return results
 
 
+def _collect_in_worker(collect_function, kwargs: dict) -> List[dict]:
+    """
+    Collect the results of one base directory within a worker process
+
+    :param collect_function: Function, that collects the results of one base directory
+    :param kwargs: Keyword arguments to hand over to the collect function
+    """
+    return collect_function(**kwargs)
+
+
 def _collect(base_directory: str, node_a: UUID, node_b: UUID, node_c: UUID, load_mv: UUID, load_lv: UUID,
              v_rated_hv: float, v_rated_mv: float, v_rated_lv: float, tap_pos: int) -> List[dict]:
     """
@@ -88,11 +154,11 @@ def _collect(base_directory: str, node_a: UUID, node_b: UUID, node_c: UUID, load
     time_series_result = TimeSeriesResult(base_directory=base_directory)
 
     # Map time step onto power consumption
-    time_to_power = _map_time_to_power(time_series_result.load_results, load_mv, load_lv)
+    time_to_power = _map_time_to_power(time_series_result.load_table, load_mv, load_lv)
 
     # Map time step onto power flow results
-    time_to_pf = _map_time_to_power_flow_result(time_series_result.node_results,
-                                                time_series_result.transformer_3w_results, node_a, node_b, node_c,
+    time_to_pf = _map_time_to_power_flow_result(time_series_result.node_table,
+                                                time_series_result.transformer_3w_table, node_a, node_b, node_c,
                                                 v_rated_hv, v_rated_mv, v_rated_lv)
 
     # Bring together both results
@@ -100,7 +166,7 @@ def _collect(base_directory: str, node_a: UUID, node_b: UUID, node_c: UUID, load
     for time_step in time_to_power.keys():
         p_mv_mw, p_lv_mw = time_to_power[time_step]
         # Match with the power flow result one tick ahead, because of SIMONA's logic
-        pf_time = time_step + timedelta(seconds=1)
+        pf_time = time_step + 1
         grid_result = time_to_pf[pf_time]
 
         results.append({
@@ -113,35 +179,37 @@ def _collect(base_directory: str, node_a: UUID, node_b: UUID, node_c: UUID, load
     return results
 
 
-def _map_time_to_power(load_results: dict, load_mv: UUID, load_lv: UUID) -> dict:
+def _map_time_to_power(load_table: ColumnarResult, load_mv: UUID, load_lv: UUID) -> dict:
     """
     Map the time series time steps to induced powers at the ports
 
-    :param load_results: The dictionary from time_step to a list of load results
+    :param load_table: The load results
     :param load_mv: Unique identifier of the medium voltage load
     :param load_lv: Unique identifier of the low voltage load
     """
     time_to_power: dict = {}
-    for time_step in load_results.keys():
-        powers = load_results[time_step]
-        if len(powers) == 2:
+    p_mw = load_table.columns['p_mw']
+    for time_step in load_table.time_steps():
+        amount = len(load_table.at(time_step))
+        if amount == 2:
             # The result contains power in kW and is supposed to be MW
-            p_mv_mw = next(result.p_mw for result in powers if result.input_model == load_mv)
-            p_lv_mw = next(result.p_mw for result in powers if result.input_model == load_lv)
+            p_mv_mw = p_mw[_locate(load_table, time_step, load_mv)].item()
+            p_lv_mw = p_mw[_locate(load_table, time_step, load_lv)].item()
 
             time_to_power[time_step] = (p_mv_mw, p_lv_mw)
         else:
-            raise ResultCollectionException("I need two power results, but found %i." % len(powers))
+            raise ResultCollectionException("I need two power results, but found %i." % amount)
     return time_to_power
 
 
-def _map_time_to_power_flow_result(node_results: dict, transformer_results: dict, node_a: UUID, node_b: UUID,
-                                   node_c: UUID, v_rated_hv: float, v_rated_mv: float, v_rated_lv: float) -> dict:
+def _map_time_to_power_flow_result(node_table: ColumnarResult, transformer_table: ColumnarResult, node_a: UUID,
+                                   node_b: UUID, node_c: UUID, v_rated_hv: float, v_rated_mv: float,
+                                   v_rated_lv: float) -> dict:
     """
     Determine the mapping from simulation time step to power flow result
 
-    :param node_results: Mapping from time step to node results
-    :param transformer_results: Mapping from time step to transformer results
+    :param node_table: The node results
+    :param transformer_table: The transformer results
     :param node_a: Unique identifier of the highest voltage node
     :param node_b: Unique identifier of the medium voltage node
     :param node_c: Unique identifier of the low voltage node
@@ -149,21 +217,62 @@ def _map_time_to_power_flow_result(node_results: dict, transformer_results: dict
     :param v_rated_mv: Rated voltage magnitude of the medium voltage node
     :param v_rated_lv: Rated voltage magnitude of the low voltage node
     """
-    time_to_power_flow_result = dict()
-    for time_step in node_results.keys():
-        node_result_a = next(result for result in node_results[time_step] if result.input_model == node_a)
-        node_result_b = next(result for result in node_results[time_step] if result.input_model == node_b)
-        node_result_c = next(result for result in node_results[time_step] if result.input_model == node_c)
-        transformer_result = next(result for result in transformer_results[time_step])
+    time_steps = node_table.time_steps()
+    if len(time_steps) == 0:
+        return {}
+    index_a = [_locate(node_table, time_step, node_a) for time_step in time_steps]
+    index_b = [_locate(node_table, time_step, node_b) for time_step in time_steps]
+    index_c = [_locate(node_table, time_step, node_c) for time_step in time_steps]
+    index_transformer = [_first(transformer_table, time_step) for time_step in time_steps]
+
+    v_mag, v_ang = node_table.columns['v_mag_pu'], node_table.columns['v_ang_degree']
+    currents = {name: column[index_transformer] for name, column in transformer_table.columns.items()}
+    columns = ResultConverter.to_three_winding_columns(
+        v_mag_hv_pu=v_mag[index_a], v_ang_hv_degree=v_ang[index_a], v_mag_mv_pu=v_mag[index_b],
+        v_ang_mv_degree=v_ang[index_b], v_mag_lv_pu=v_mag[index_c], v_ang_lv_degree=v_ang[index_c],
+        i_mag_hv_ampere=currents['i_a_mag_ampere'], i_ang_hv_degree=currents['i_a_ang_degree'],
+        i_mag_mv_ampere=currents['i_b_mag_ampere'], i_ang_mv_degree=currents['i_b_ang_degree'],
+        i_mag_lv_ampere=currents['i_c_mag_ampere'], i_ang_lv_degree=currents['i_c_ang_degree'],
+        v_rated_hv=v_rated_hv, v_rated_mv=v_rated_mv, v_rated_lv=v_rated_lv)
+    return dict(zip(time_steps, _result_objects(columns, GridResultThreeWinding)))
+
+
+def _result_objects(columns: dict, result_class: type) -> list:
+    """
+    Build the result objects from a columnar table
+
+    :param columns: Mapping from the fields of the result class to arrays
+    :param result_class: Class of the results, e.g. GridResultThreeWinding
+    """
+    values = zip(*(columns[field].tolist() for field in result_class.FIELDS))
+    return [result_class(**dict(zip(result_class.FIELDS, value))) for value in values]
 
-        power_flow_result = ResultConverter.to_three_winding_result(node_result_a=node_result_a,
-                                                                    node_result_b=node_result_b,
-                                                                    node_result_c=node_result_c,
-                                                                    transformer_result=transformer_result,
-                                                                    v_rated_hv=v_rated_hv, v_rated_mv=v_rated_mv,
-                                                                    v_rated_lv=v_rated_lv)
-        time_to_power_flow_result[time_step] = power_flow_result
-    return time_to_power_flow_result
+
+def _locate(table: ColumnarResult, time_step: int, input_model: UUID) -> int:
+    """
+    Find the result of an input model at a given time step
+
+    :param table: The results to search in
+    :param time_step: Seconds since epoch
+    :param input_model: Unique identifier of the input model
+    """
+    index = table.locate(time_step, input_model)
+    if index < 0:
+        raise ResultCollectionException("There is no result for '%s' at %s." % (input_model, to_datetime(time_step)))
+    return index
+
+
+def _first(table: ColumnarResult, time_step: int) -> int:
+    """
+    Find the first result at a given time step
+
+    :param table: The results to search in
+    :param time_step: Seconds since epoch
+    """
+    indices = table.at(time_step) if table is not None else []
+    if len(indices) == 0:
+        raise ResultCollectionException("There is no transformer result at %s." % to_datetime(time_step))
+    return indices[0]
 
 
 def _collect_two_winding(base_directory: str, node_a: UUID, node_b: UUID, load: UUID, v_rated_hv: float,
@@ -183,11 +292,11 @@ def _collect_two_winding(base_directory: str, node_a: UUID, node_b: UUID, load:
     time_series_result = TimeSeriesResult(base_directory=base_directory)
 
     # Map time step onto power consumption
-    time_to_power = _map_time_to_power_two_winding(time_series_result.load_results, load)
+    time_to_power = _map_time_to_power_two_winding(time_series_result.load_table, load)
 
     # Map time step onto power flow results
-    time_to_pf = _map_time_to_power_flow_result_two_winding(time_series_result.node_results,
-                                                            time_series_result.transformer_2w_results, node_a, node_b,
+    time_to_pf = _map_time_to_power_flow_result_two_winding(time_series_result.node_table,
+                                                            time_series_result.transformer_2w_table, node_a, node_b,
                                                             v_rated_hv, v_rated_lv)
 
     # Bring together both results
@@ -195,7 +304,7 @@ def _collect_two_winding(base_directory: str, node_a: UUID, node_b: UUID, load:
     for time_step in time_to_power.keys():
         p_lv_mw = time_to_power[time_step]
         # Match with the power flow result one tick ahead, because of SIMONA's logic
-        pf_time = time_step + timedelta(seconds=1)
+        pf_time = time_step + 1
         grid_result = time_to_pf[pf_time]
 
         results.append({
@@ -207,48 +316,205 @@ def _collect_two_winding(base_directory: str, node_a: UUID, node_b: UUID, load:
     return results
 
 
-def _map_time_to_power_two_winding(load_results: dict, load: UUID) -> dict:
+def _map_time_to_power_two_winding(load_table: ColumnarResult, load: UUID) -> dict:
     """
     Map the time series time steps to induced powers at the ports
 
-    :param load_results: The dictionary from time_step to a list of load results
+    :param load_table: The load results
     :param load: Unique identifier of the low voltage load
     """
     time_to_power: dict = {}
-    for time_step in load_results.keys():
-        powers = load_results[time_step]
-        if len(powers) == 1:
+    p_mw = load_table.columns['p_mw']
+    for time_step in load_table.time_steps():
+        amount = len(load_table.at(time_step))
+        if amount == 1:
             # The result contains power in kW and is supposed to be MW
-            p_lv_mw = next(result.p_mw for result in powers if result.input_model == load)
+            p_lv_mw = p_mw[_locate(load_table, time_step, load)].item()
 
             time_to_power[time_step] = p_lv_mw
         else:
-            raise ResultCollectionException("I need one power results, but found %i." % len(powers))
+            raise ResultCollectionException("I need one power results, but found %i." % amount)
     return time_to_power
 
 
-def _map_time_to_power_flow_result_two_winding(node_results: dict, transformer_results: dict, node_a: UUID,
-                                               node_b: UUID, v_rated_hv: float, v_rated_lv: float) -> dict:
+def _map_time_to_power_flow_result_two_winding(node_table: ColumnarResult, transformer_table: ColumnarResult,
+                                               node_a: UUID, node_b: UUID, v_rated_hv: float,
+                                               v_rated_lv: float) -> dict:
     """
     Determine the mapping from simulation time step to power flow result
 
-    :param node_results: Mapping from time step to node results
-    :param transformer_results: Mapping from time step to transformer results
+    :param node_table: The node results
+    :param transformer_table: The transformer results
+    :param node_a: Unique identifier of the highest voltage node
+    :param node_b: Unique identifier of the medium voltage node
+    :param v_rated_hv: Rated voltage magnitude of the highest voltage node
+    :param v_rated_lv: Rated voltage magnitude of the low voltage node
+    """
+    time_steps = node_table.time_steps()
+    if len(time_steps) == 0:
+        return {}
+    index_a = [_locate(node_table, time_step, node_a) for time_step in time_steps]
+    index_b = [_locate(node_table, time_step, node_b) for time_step in time_steps]
+    index_transformer = [_first(transformer_table, time_step) for time_step in time_steps]
+
+    v_mag, v_ang = node_table.columns['v_mag_pu'], node_table.columns['v_ang_degree']
+    currents = {name: column[index_transformer] for name, column in transformer_table.columns.items()}
+    columns = ResultConverter.to_two_winding_columns(
+        v_mag_hv_pu=v_mag[index_a], v_ang_hv_degree=v_ang[index_a], v_mag_lv_pu=v_mag[index_b],
+        v_ang_lv_degree=v_ang[index_b], i_mag_hv_ampere=currents['i_a_mag_ampere'],
+        i_ang_hv_degree=currents['i_a_ang_degree'], i_mag_lv_ampere=currents['i_b_mag_ampere'],
+        i_ang_lv_degree=currents['i_b_ang_degree'], v_rated_hv=v_rated_hv, v_rated_lv=v_rated_lv)
+    return dict(zip(time_steps, _result_objects(columns, GridResultTwoWinding)))
+
+
+def stream_collect(tap_to_base_directory: Union[dict, str], node_a: UUID, node_b: UUID, node_c: UUID, load_mv: UUID,
+                   load_lv: UUID, v_rated_hv: float, v_rated_mv: float, v_rated_lv: float,
+                   delimiter: str = ',') -> Iterator[dict]:
+    """
+    Streaming counterpart of collect. The result files of each base directory are read in lockstep, time step by time
+    step, and joined on the fly, so that only one time step is held in memory. This requires the files to be ordered
+    by time, as SIMONA writes them. The results are yielded in ascending tap position.
+
+    :param tap_to_base_directory: Mapping from tap changer position to base directory or a glob to discover the base
+        directories from (cf. discover_base_directories)
+    :param node_a: Unique identifier of the highest voltage node
+    :param node_b: Unique identifier of the medium voltage node
+    :param node_c: Unique identifier of the low voltage node
+    :param load_mv: Unique identifier of the medium voltage load
+    :param load_lv: Unique identifier of the low voltage node
+    :param v_rated_hv: Rated voltage magnitude of the highest voltage node
+    :param v_rated_mv: Rated voltage magnitude of the medium voltage node
+    :param v_rated_lv: Rated voltage magnitude of the low voltage node
+    :param delimiter: Column delimiter of the files
+    """
+    if isinstance(tap_to_base_directory, str):
+        tap_to_base_directory = discover_base_directories(tap_to_base_directory)
+    for tap_pos in sorted(tap_to_base_directory):
+        base_directory = tap_to_base_directory[tap_pos]
+        for time_step, loads, node_results, transformer_results in _join_time_steps(
+                base_directory, TRANSFORMER_3W_RESULT_FILE, Transformer3WResult.from_dict, delimiter):
+            if len(loads) != 2:
+                raise ResultCollectionException("I need two power results, but found %i." % len(loads))
+            grid_result = ResultConverter.to_three_winding_result(
+                node_result_a=_find(node_results, node_a, time_step),
+                node_result_b=_find(node_results, node_b, time_step),
+                node_result_c=_find(node_results, node_c, time_step), transformer_result=transformer_results[0],
+                v_rated_hv=v_rated_hv, v_rated_mv=v_rated_mv, v_rated_lv=v_rated_lv)
+            yield {
+                'tap_pos': tap_pos,
+                'p_mv': _find(loads, load_mv, time_step).p_mw,
+                'p_lv': _find(loads, load_lv, time_step).p_mw,
+                'result': grid_result
+            }
+
+
+def stream_collect_two_winding(tap_to_base_directory: Union[dict, str], node_a: UUID, node_b: UUID, load: UUID,
+                               v_rated_hv: float, v_rated_lv: float, delimiter: str = ',') -> Iterator[dict]:
+    """
+    Streaming counterpart of collect_two_winding (cf. stream_collect)
+
+    :param tap_to_base_directory: Mapping from tap changer position to base directory or a glob to discover the base
+        directories from (cf. discover_base_directories)
     :param node_a: Unique identifier of the highest voltage node
     :param node_b: Unique identifier of the medium voltage node
+    :param load: Unique identifier of the low voltage load
     :param v_rated_hv: Rated voltage magnitude of the highest voltage node
     :param v_rated_lv: Rated voltage magnitude of the low voltage node
+    :param delimiter: Column delimiter of the files
+    """
+    if isinstance(tap_to_base_directory, str):
+        tap_to_base_directory = discover_base_directories(tap_to_base_directory)
+    for tap_pos in sorted(tap_to_base_directory):
+        base_directory = tap_to_base_directory[tap_pos]
+        for time_step, loads, node_results, transformer_results in _join_time_steps(
+                base_directory, TRANSFORMER_2W_RESULT_FILE, Transformer2WResult.from_dict, delimiter):
+            if len(loads) != 1:
+                raise ResultCollectionException("I need one power results, but found %i." % len(loads))
+            grid_result = ResultConverter.to_two_winding_result(
+                node_result_a=_find(node_results, node_a, time_step),
+                node_result_b=_find(node_results, node_b, time_step), transformer_result=transformer_results[0],
+                v_rated_hv=v_rated_hv, v_rated_lv=v_rated_lv)
+            yield {
+                'tap_pos': tap_pos,
+                'p_lv': _find(loads, load, time_step).p_mw,
+                'result': grid_result
+            }
+
+
+def _join_time_steps(base_directory: str, transformer_file_name: str, transformer_from_dict,
+                     delimiter: str) -> Iterator[tuple]:
+    """
+    Read the load, node and transformer results in lockstep and join the loads of each time step with the power flow
+    results one tick ahead, because of SIMONA's logic
+
+    :param base_directory: The base directory, where the time series results can be found
+    :param transformer_file_name: Name of the transformer result file
+    :param transformer_from_dict: Parser of the transformer results
+    :param delimiter: Column delimiter of the files
+    :return: Generator of the time step of the loads, the load, node and transformer results
+    """
+    with ExitStack() as stack:
+        load_steps = _time_steps(stack, os.path.join(base_directory, LOAD_RESULT_FILE), LoadResult.from_dict,
+                                 delimiter)
+        node_steps = _time_steps(stack, os.path.join(base_directory, NODE_RESULT_FILE), NodeResult.from_dict,
+                                 delimiter)
+        transformer_steps = _time_steps(stack, os.path.join(base_directory, transformer_file_name),
+                                        transformer_from_dict, delimiter)
+        node_step, transformer_step = None, None
+        for time_step, loads in load_steps:
+            pf_time = time_step + timedelta(seconds=1)
+            node_step = _seek(node_steps, node_step, pf_time)
+            transformer_step = _seek(transformer_steps, transformer_step, pf_time)
+            if node_step is None or node_step[0] != pf_time:
+                raise ResultCollectionException("There are no node results at %s." % pf_time)
+            if transformer_step is None or transformer_step[0] != pf_time:
+                raise ResultCollectionException("There is no transformer result at %s." % pf_time)
+            yield time_step, loads, node_step[1], transformer_step[1]
+
+
+def _time_steps(stack: ExitStack, file_path: str, from_dict, delimiter: str) -> Iterator[tuple]:
+    """
+    Read a result file row by row and group consecutive results of the same time step
+
+    :param stack: Context, that closes the file
+    :param file_path: Path to the uncompressed result file. A compressed one is read, if it is present instead.
+    :param from_dict: Parser of the results
+    :param delimiter: Column delimiter of the file
+    :return: Generator of time step and list of results
+    """
+    present_file_path = find_file(file_path)
+    if present_file_path is None:
+        raise ResultCollectionException("There is no result file '%s'." % file_path)
+    lines = stack.enter_context(open_text(present_file_path))
+    results = (from_dict(dct) for dct in csv.DictReader(lines, delimiter=delimiter))
+    return ((time_step, list(group)) for time_step, group in groupby(results, key=lambda result: result.time))
+
+
+def _seek(time_steps: Iterator[tuple], current: tuple, time_step: datetime) -> tuple:
+    """
+    Advance to the first time step, that isn't before the given one
+
+    :param time_steps: Generator of time step and list of results
+    :param current: The current time step and list of results
+    :param time_step: Time step to advance to
+    :return: The reached time step and list of results or None, if the file is exhausted
+    """
+    while current is None or current[0] < time_step:
+        current = next(time_steps, None)
+        if current is None:
+            return None
+    return current
+
+
+def _find(results: list, input_model: UUID, time_step: datetime):
+    """
+    Find the result of an input model within the results of one time step
+
+    :param results: The results of one time step
+    :param input_model: Unique identifier of the input model
+    :param time_step: The time step
     """
-    time_to_power_flow_result = dict()
-    for time_step in node_results.keys():
-        node_result_a = next(result for result in node_results[time_step] if result.input_model == node_a)
-        node_result_b = next(result for result in node_results[time_step] if result.input_model == node_b)
-        transformer_result = next(result for result in transformer_results[time_step])
-
-        power_flow_result = ResultConverter.to_two_winding_result(node_result_a=node_result_a,
-                                                                  node_result_b=node_result_b,
-                                                                  transformer_result=transformer_result,
-                                                                  v_rated_hv=v_rated_hv,
-                                                                  v_rated_lv=v_rated_lv)
-        time_to_power_flow_result[time_step] = power_flow_result
-    return time_to_power_flow_result
+    result = next((result for result in results if result.input_model == input_model), None)
+    if result is None:
+        raise ResultCollectionException("There is no result for '%s' at %s." % (input_model, time_step))
+    return result
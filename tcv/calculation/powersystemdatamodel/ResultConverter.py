@@ -1,5 +1,7 @@
 from math import cos, radians, sin, sqrt
 
+import numpy as np
+
 from tcv.calculation.powersystemdatamodel.model.NodeResult import NodeResult
 from tcv.calculation.powersystemdatamodel.model.Transformer2WResult import Transformer2WResult
 from tcv.calculation.powersystemdatamodel.model.Transformer3WResult import Transformer3WResult
@@ -76,6 +78,61 @@ def _convert_transformer_3w_result(hv_node_result: NodeResult, mv_node_result: N
     return s_a_kva, p_a_kw, q_a_kvar, s_b_kva, p_b_kw, q_b_kvar, s_c_kva, p_c_kw, q_c_kvar
 
 
+def to_three_winding_columns(v_mag_hv_pu: np.ndarray, v_ang_hv_degree: np.ndarray, v_mag_mv_pu: np.ndarray,
+                             v_ang_mv_degree: np.ndarray, v_mag_lv_pu: np.ndarray, v_ang_lv_degree: np.ndarray,
+                             i_mag_hv_ampere: np.ndarray, i_ang_hv_degree: np.ndarray, i_mag_mv_ampere: np.ndarray,
+                             i_ang_mv_degree: np.ndarray, i_mag_lv_ampere: np.ndarray, i_ang_lv_degree: np.ndarray,
+                             v_rated_hv: float, v_rated_mv: float, v_rated_lv: float) -> dict:
+    """
+    Array counterpart of to_three_winding_result. Converts the columns of the SIMONA results of many operation points
+    at once into a columnar table of the commonly shared data for comparison.
+
+    :param v_mag_hv_pu: Voltage magnitudes of the highest voltage node
+    :param v_ang_hv_degree: Voltage angles of the highest voltage node
+    :param v_mag_mv_pu: Voltage magnitudes of the medium voltage node
+    :param v_ang_mv_degree: Voltage angles of the medium voltage node
+    :param v_mag_lv_pu: Voltage magnitudes of the lowest voltage node
+    :param v_ang_lv_degree: Voltage angles of the lowest voltage node
+    :param i_mag_hv_ampere: Current magnitudes at the highest voltage port
+    :param i_ang_hv_degree: Current angles at the highest voltage port
+    :param i_mag_mv_ampere: Current magnitudes at the medium voltage port
+    :param i_ang_mv_degree: Current angles at the medium voltage port
+    :param i_mag_lv_ampere: Current magnitudes at the lowest voltage port
+    :param i_ang_lv_degree: Current angles at the lowest voltage port
+    :param v_rated_hv: Rated nodal voltage at highest voltage port
+    :param v_rated_mv: Rated nodal voltage at medium voltage port
+    :param v_rated_lv: Rated nodal voltage at lowest voltage port
+    :return: Mapping from the fields of GridResultThreeWinding to arrays
+    """
+    s_a_kva, p_a_kw, q_a_kvar = _calculate_powers(v_mag_hv_pu, v_ang_hv_degree, i_mag_hv_ampere, i_ang_hv_degree,
+                                                  v_rated_hv)
+    s_b_kva, p_b_kw, q_b_kvar = _calculate_powers(v_mag_mv_pu, v_ang_mv_degree, i_mag_mv_ampere, i_ang_mv_degree,
+                                                  v_rated_mv)
+    s_c_kva, p_c_kw, q_c_kvar = _calculate_powers(v_mag_lv_pu, v_ang_lv_degree, i_mag_lv_ampere, i_ang_lv_degree,
+                                                  v_rated_lv)
+    return {
+        'v_mv_pu': np.asarray(v_mag_mv_pu, dtype=float),
+        'v_ang_mv_degree': np.asarray(v_ang_mv_degree, dtype=float),
+        'v_lv_pu': np.asarray(v_mag_lv_pu, dtype=float),
+        'v_ang_lv_degree': np.asarray(v_ang_lv_degree, dtype=float),
+        'p_hv_kw': p_a_kw,
+        'q_hv_kvar': q_a_kvar,
+        's_hv_kva': s_a_kva,
+        'i_mag_hv_a': np.asarray(i_mag_hv_ampere, dtype=float),
+        'i_ang_hv_degree': np.asarray(i_ang_hv_degree, dtype=float),
+        'p_mv_kw': p_b_kw,
+        'q_mv_kvar': q_b_kvar,
+        's_mv_kva': s_b_kva,
+        'i_mag_mv_a': np.asarray(i_mag_mv_ampere, dtype=float),
+        'i_ang_mv_degree': np.asarray(i_ang_mv_degree, dtype=float),
+        'p_lv_kw': p_c_kw,
+        'q_lv_kvar': q_c_kvar,
+        's_lv_kva': s_c_kva,
+        'i_mag_lv_a': np.asarray(i_mag_lv_ampere, dtype=float),
+        'i_ang_lv_degree': np.asarray(i_ang_lv_degree, dtype=float)
+    }
+
+
 def to_two_winding_result(node_result_a: NodeResult, node_result_b: NodeResult, transformer_result: Transformer2WResult,
                           v_rated_hv: float, v_rated_lv: float) -> GridResultTwoWinding:
     """
@@ -110,6 +167,46 @@ def to_two_winding_result(node_result_a: NodeResult, node_result_b: NodeResult,
     )
 
 
+def to_two_winding_columns(v_mag_hv_pu: np.ndarray, v_ang_hv_degree: np.ndarray, v_mag_lv_pu: np.ndarray,
+                           v_ang_lv_degree: np.ndarray, i_mag_hv_ampere: np.ndarray, i_ang_hv_degree: np.ndarray,
+                           i_mag_lv_ampere: np.ndarray, i_ang_lv_degree: np.ndarray, v_rated_hv: float,
+                           v_rated_lv: float) -> dict:
+    """
+    Array counterpart of to_two_winding_result. Converts the columns of the SIMONA results of many operation points at
+    once into a columnar table of the commonly shared data for comparison.
+
+    :param v_mag_hv_pu: Voltage magnitudes of the highest voltage node
+    :param v_ang_hv_degree: Voltage angles of the highest voltage node
+    :param v_mag_lv_pu: Voltage magnitudes of the lowest voltage node
+    :param v_ang_lv_degree: Voltage angles of the lowest voltage node
+    :param i_mag_hv_ampere: Current magnitudes at the highest voltage port
+    :param i_ang_hv_degree: Current angles at the highest voltage port
+    :param i_mag_lv_ampere: Current magnitudes at the lowest voltage port
+    :param i_ang_lv_degree: Current angles at the lowest voltage port
+    :param v_rated_hv: Rated nodal voltage at highest voltage port
+    :param v_rated_lv: Rated nodal voltage at lowest voltage port
+    :return: Mapping from the fields of GridResultTwoWinding to arrays
+    """
+    s_a_kva, p_a_kw, q_a_kvar = _calculate_powers(v_mag_hv_pu, v_ang_hv_degree, i_mag_hv_ampere, i_ang_hv_degree,
+                                                  v_rated_hv)
+    s_b_kva, p_b_kw, q_b_kvar = _calculate_powers(v_mag_lv_pu, v_ang_lv_degree, i_mag_lv_ampere, i_ang_lv_degree,
+                                                  v_rated_lv)
+    return {
+        'v_lv_pu': np.asarray(v_mag_lv_pu, dtype=float),
+        'v_ang_lv_degree': np.asarray(v_ang_lv_degree, dtype=float),
+        'p_hv_kw': p_a_kw,
+        'q_hv_kvar': q_a_kvar,
+        's_hv_kva': s_a_kva,
+        'i_mag_hv_a': np.asarray(i_mag_hv_ampere, dtype=float),
+        'i_ang_hv_degree': np.asarray(i_ang_hv_degree, dtype=float),
+        'p_lv_kw': p_b_kw,
+        'q_lv_kvar': q_b_kvar,
+        's_lv_kva': s_b_kva,
+        'i_mag_lv_a': np.asarray(i_mag_lv_ampere, dtype=float),
+        'i_ang_lv_degree': np.asarray(i_ang_lv_degree, dtype=float)
+    }
+
+
 def _convert_transformer_2w_result(hv_node_result: NodeResult, lv_node_result: NodeResult,
                                    transformer_result: Transformer2WResult, v_rated_hv: float, v_rated_lv: float) -> (
         float, float, float, float, float, float):
@@ -150,3 +247,23 @@ def _calculate_power(v_mag_pu: float, v_ang_degree: float, i_mag_ampere: float,
     q_kvar = s_kva * sin(s_ang_rad)
 
     return s_kva, p_kw, q_kvar
+
+
+def _calculate_powers(v_mag_pu: np.ndarray, v_ang_degree: np.ndarray, i_mag_ampere: np.ndarray,
+                      i_ang_degree: np.ndarray, v_nom_kv: float) -> (np.ndarray, np.ndarray, np.ndarray):
+    """
+    Array counterpart of _calculate_power, that calculates the power at a transformers node for many operation points
+    at once
+
+    :param v_mag_pu: Magnitudes of the nodal voltage
+    :param v_ang_degree: Angles of the nodal voltage
+    :param i_mag_ampere: Magnitudes of the port current
+    :param i_ang_degree: Angles of the port current
+    :param v_nom_kv: Nominal voltage to apply
+    """
+    s_kva = sqrt(3) * v_nom_kv * np.asarray(v_mag_pu, dtype=float) * np.asarray(i_mag_ampere, dtype=float)
+    s_ang_rad = np.radians(np.subtract(v_ang_degree, i_ang_degree, dtype=float))
+    p_kw = s_kva * np.cos(s_ang_rad)
+    q_kvar = s_kva * np.sin(s_ang_rad)
+
+    return s_kva, p_kw, q_kvar
@@ -0,0 +1,232 @@
+import csv
+import os
+import uuid as uuid_module
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import numpy as np
+
+from tcv.calculation.powersystemdatamodel.model.ParseCache import parse_time
+from tcv.util.CompressedFile import open_text
+
+
+def to_epoch_seconds(time_string: str) -> int:
+    """
+    Parse a single time stamp, as written by SIMONA (e.g. '2020-01-01T00:00:00Z[UTC]'), into seconds since epoch (cf.
+    ParseCache.parse_time). Time stamps without time zone information are treated as UTC.
+
+    :param time_string: The time stamp to parse
+    :return: Seconds since 1970-01-01T00:00:00Z
+    """
+    time = parse_time(time_string)
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=timezone.utc)
+    return int(time.timestamp())
+
+
+def parse_times(time_strings: list) -> np.ndarray:
+    """
+    Parse a column of time stamps into seconds since epoch. Each distinct time stamp is only parsed once.
+
+    :param time_strings: The time stamps to parse
+    :return: Array of seconds since 1970-01-01T00:00:00Z (int64)
+    """
+    if len(time_strings) == 0:
+        return np.empty(0, dtype=np.int64)
+    distinct, inverse = np.unique(np.asarray(time_strings), return_inverse=True)
+    return np.array([to_epoch_seconds(time_string) for time_string in distinct], dtype=np.int64)[inverse]
+
+
+def to_datetime(epoch_seconds: int) -> datetime:
+    """
+    Turn seconds since epoch back into a time zone aware time stamp
+
+    :param epoch_seconds: Seconds since 1970-01-01T00:00:00Z
+    :return: The time stamp in UTC
+    """
+    return datetime.fromtimestamp(int(epoch_seconds), tz=timezone.utc)
+
+
+def read_csv(file_path: str, model_class: type, csv_fields: dict, delimiter: str = ',') -> 'ColumnarResult':
+    """
+    Read a SIMONA result file into a columnar table. The file is read as a whole and each column is converted in bulk.
+    Compressed files (e.g. 'node_res.csv.xz') are decompressed on the fly (cf. CompressedFile.open_text).
+
+    :param file_path: Path to the csv file
+    :param model_class: Class of the row objects, e.g. NodeResult.NodeResult
+    :param csv_fields: Mapping from csv column to attribute and its type, e.g. NodeResult.CSV_FIELDS
+    :param delimiter: Column delimiter of the file
+    :return: The columnar table
+    """
+    with open_text(file_path) as file_to_read:
+        reader = csv.reader(file_to_read, delimiter=delimiter)
+        header = next(reader, [])
+        rows = [row for row in reader if row]
+    raw_columns = dict(zip(header, zip(*rows))) if rows else {name: () for name in header}
+
+    input_models, codes = np.unique(np.asarray(raw_columns['input_model'], dtype=str), return_inverse=True)
+    columns = {attribute: np.asarray(raw_columns[column], dtype=np.int64 if data_type is int else np.float64)
+               for column, (attribute, data_type) in csv_fields.items()}
+    return ColumnarResult(model_class=model_class,
+                          uuid=np.asarray(raw_columns['uuid'], dtype=str),
+                          time=parse_times(raw_columns['time']),
+                          input_model=codes.astype(np.int32),
+                          input_models=[uuid_module.UUID(input_model) for input_model in input_models],
+                          columns=columns)
+
+
+def read_parsed(directory: str, model_class: type, csv_fields: dict, memory_map: bool = True) -> 'ColumnarResult':
+    """
+    Read a columnar table, that has been written by ColumnarResult.save
+
+    :param directory: Directory of the table
+    :param model_class: Class of the row objects, e.g. NodeResult.NodeResult
+    :param csv_fields: Mapping from csv column to attribute and its type, e.g. NodeResult.CSV_FIELDS
+    :param memory_map: True, if the columns shall be mapped into memory instead of being read
+    :return: The columnar table
+    """
+    def _load(name: str) -> np.ndarray:
+        return np.load(os.path.join(directory, "%s.npy" % name), mmap_mode='r' if memory_map else None)
+
+    return ColumnarResult(model_class=model_class,
+                          uuid=_load('uuid'),
+                          time=_load('time'),
+                          input_model=_load('input_model'),
+                          input_models=[uuid_module.UUID(input_model) for input_model in _load('input_models')],
+                          columns={attribute: _load(attribute) for attribute, _ in csv_fields.values()})
+
+
+class ColumnarResult:
+    """
+    Column wise representation of one SIMONA result file. Time stamps are held as seconds since epoch, the input
+    models as categorical codes into the list of distinct input models and all further attributes as one array per
+    attribute. Row objects (e.g. NodeResult) are only built on request.
+    """
+
+    def __init__(self, model_class: type, uuid: np.ndarray, time: np.ndarray, input_model: np.ndarray,
+                 input_models: list, columns: dict):
+        """
+        Constructor for the class
+
+        :param model_class: Class of the row objects, e.g. NodeResult.NodeResult
+        :param uuid: Unique identifiers of the results as strings
+        :param time: Seconds since epoch per result
+        :param input_model: Index of the input model into input_models per result
+        :param input_models: Distinct unique identifiers of the input models
+        :param columns: Mapping from attribute name to values per result
+        """
+        self.model_class = model_class
+        self.uuid = uuid
+        self.time = time
+        self.input_model = input_model
+        self.input_models = input_models
+        self.columns = columns
+        self.__codes = {model: code for code, model in enumerate(input_models)}
+        self.__index = None
+        self.__time_index = None
+
+    def __len__(self):
+        return len(self.time)
+
+    def save(self, directory: str):
+        """
+        Write the table into one NumPy file per column, so that it can be mapped into memory later on (cf.
+        read_parsed)
+
+        :param directory: Directory to write the table to. It is created, if it's missing.
+        """
+        os.makedirs(directory, exist_ok=True)
+        arrays = dict(self.columns, uuid=self.uuid, time=self.time, input_model=self.input_model,
+                      input_models=np.asarray([str(input_model) for input_model in self.input_models], dtype=str))
+        for name, array in arrays.items():
+            np.save(os.path.join(directory, "%s.npy" % name), np.asarray(array))
+
+    def code_of(self, input_model: uuid_module.UUID) -> int:
+        """
+        Categorical code of an input model
+
+        :param input_model: Unique identifier of the input model
+        :return: The code or -1, if there are no results for the input model
+        """
+        return self.__codes.get(input_model, -1)
+
+    def time_steps(self) -> list:
+        """
+        Distinct time stamps in the order of their first appearance
+
+        :return: Seconds since epoch per time step
+        """
+        self.__build_index()
+        return list(self.__time_index.keys())
+
+    def locate(self, time: int, input_model: uuid_module.UUID) -> int:
+        """
+        Find the result of an input model at a given time. If there are several, the first one is handed back.
+
+        :param time: Seconds since epoch
+        :param input_model: Unique identifier of the input model
+        :return: Index of the row or -1, if there is no such result
+        """
+        self.__build_index()
+        return self.__index.get((time, self.code_of(input_model)), -1)
+
+    def at(self, time: int) -> list:
+        """
+        Find all results at a given time
+
+        :param time: Seconds since epoch
+        :return: Indices of the rows in the order of the file
+        """
+        self.__build_index()
+        return self.__time_index.get(time, [])
+
+    def row(self, index: int):
+        """
+        Build a single row object
+
+        :param index: Index of the row
+        :return: The row object
+        """
+        return next(self.rows([index]))
+
+    def rows(self, indices=None):
+        """
+        Build the row objects lazily. Equal time stamps and input models are represented by the same objects.
+
+        :param indices: Indices of the rows to build. If not given, all rows are built.
+        :return: Generator of row objects
+        """
+        indices = range(len(self)) if indices is None else indices
+        times = {}
+        attributes = self.columns.keys()
+        for index in indices:
+            epoch_seconds = int(self.time[index])
+            time = times.get(epoch_seconds)
+            if time is None:
+                time = times[epoch_seconds] = to_datetime(epoch_seconds)
+            yield self.model_class(uuid=uuid_module.UUID(self.uuid[index]), time=time,
+                                   input_model=self.input_models[self.input_model[index]],
+                                   **{attribute: self.columns[attribute][index].item() for attribute in attributes})
+
+    def by_time(self) -> dict:
+        """
+        Build all row objects and group them by time stamp
+
+        :return: Mapping from time stamp to list of row objects
+        """
+        grouped = defaultdict(list)
+        for row in self.rows():
+            grouped[row.time].append(row)
+        return grouped
+
+    def __build_index(self):
+        """
+        Build the mappings from time stamp and input model to row and from time stamp to rows once
+        """
+        if self.__index is not None:
+            return
+        self.__index = {}
+        self.__time_index = {}
+        for index, key in enumerate(zip(self.time.tolist(), self.input_model.tolist())):
+            self.__index.setdefault(key, index)
+            self.__time_index.setdefault(key[0], []).append(index)
@@ -1,25 +1,42 @@
-import re
 import uuid as uuid_module
-from dataclasses import dataclass
 from datetime import datetime
 
-import dateutil.parser
+from tcv.calculation.powersystemdatamodel.model.ParseCache import parse_time, parse_uuid
+from tcv.calculation.powersystemdatamodel.model.ResultModel import ResultModel, DEFAULT_TIME
 
+# Mapping from column of the csv file to attribute and its type, in addition to uuid, time and input_model
+CSV_FIELDS = {
+    'p': ('p_mw', float),
+    'q': ('q_mvar', float)
+}
 
-@dataclass
-class LoadResult:
-    uuid: uuid_module.UUID = uuid_module.uuid4()
-    time: datetime = dateutil.parser.isoparse('1970-01-01T00:00:00Z')
-    input_model: uuid_module.UUID = uuid_module.uuid4()
-    p_mw: float = 0.0
-    q_mvar: float = 0.0
+
+class LoadResult(ResultModel):
+    __slots__ = ('uuid', 'time', 'input_model', 'p_mw', 'q_mvar')
+
+    def __init__(self, uuid: uuid_module.UUID = uuid_module.uuid4(), time: datetime = DEFAULT_TIME,
+                 input_model: uuid_module.UUID = uuid_module.uuid4(), p_mw: float = 0.0, q_mvar: float = 0.0):
+        """
+        Constructor for the class
+
+        :param uuid: Unique identifier of the result
+        :param time: Time stamp of the result
+        :param input_model: Unique identifier of the input model, the result belongs to
+        :param p_mw: Active power in MW
+        :param q_mvar: Reactive power in MVAr
+        """
+        self.uuid = uuid
+        self.time = time
+        self.input_model = input_model
+        self.p_mw = p_mw
+        self.q_mvar = q_mvar
 
 
 def from_dict(dct: dict) -> LoadResult:
     return LoadResult(
         uuid_module.UUID(dct['uuid']),
-        dateutil.parser.isoparse(re.sub('\\[UTC]$', "", dct['time'])),
-        uuid_module.UUID(dct['input_model']),
+        parse_time(dct['time']),
+        parse_uuid(dct['input_model']),
         float(dct['p']),
         float(dct['q'])
     )
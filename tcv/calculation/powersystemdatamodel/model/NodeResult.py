@@ -1,25 +1,42 @@
-import re
 import uuid as uuid_module
-from dataclasses import dataclass
 from datetime import datetime
 
-import dateutil.parser
+from tcv.calculation.powersystemdatamodel.model.ParseCache import parse_time, parse_uuid
+from tcv.calculation.powersystemdatamodel.model.ResultModel import ResultModel, DEFAULT_TIME
 
+# Mapping from column of the csv file to attribute and its type, in addition to uuid, time and input_model
+CSV_FIELDS = {
+    'v_ang': ('v_ang_degree', float),
+    'v_mag': ('v_mag_pu', float)
+}
 
-@dataclass
-class NodeResult:
-    uuid: uuid_module.UUID = uuid_module.uuid4()
-    time: datetime = dateutil.parser.isoparse('1970-01-01T00:00:00Z')
-    input_model: uuid_module.UUID = uuid_module.uuid4()
-    v_ang_degree: float = 0.0
-    v_mag_pu: float = 0.0
+
+class NodeResult(ResultModel):
+    __slots__ = ('uuid', 'time', 'input_model', 'v_ang_degree', 'v_mag_pu')
+
+    def __init__(self, uuid: uuid_module.UUID = uuid_module.uuid4(), time: datetime = DEFAULT_TIME,
+                 input_model: uuid_module.UUID = uuid_module.uuid4(), v_ang_degree: float = 0.0, v_mag_pu: float = 0.0):
+        """
+        Constructor for the class
+
+        :param uuid: Unique identifier of the result
+        :param time: Time stamp of the result
+        :param input_model: Unique identifier of the input model, the result belongs to
+        :param v_ang_degree: Voltage angle in degree
+        :param v_mag_pu: Voltage magnitude in p.u.
+        """
+        self.uuid = uuid
+        self.time = time
+        self.input_model = input_model
+        self.v_ang_degree = v_ang_degree
+        self.v_mag_pu = v_mag_pu
 
 
 def from_dict(dct: dict) -> NodeResult:
     return NodeResult(
         uuid_module.UUID(dct['uuid']),
-        dateutil.parser.isoparse(re.sub('\\[UTC]$', "", dct['time'])),
-        uuid_module.UUID(dct['input_model']),
+        parse_time(dct['time']),
+        parse_uuid(dct['input_model']),
         float(dct['v_ang']),
         float(dct['v_mag'])
     )
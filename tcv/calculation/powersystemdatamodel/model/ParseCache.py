@@ -0,0 +1,70 @@
+import re
+import uuid as uuid_module
+from datetime import datetime
+from functools import lru_cache
+
+import dateutil.parser
+import dateutil.tz
+
+# Upper bounds of the amount of memoized time stamps and unique identifiers
+MAX_TIMES = 1 << 17
+MAX_UUIDS = 1 << 12
+
+# Time stamps, as SIMONA writes them, e.g. '2020-01-01T00:00:00Z[UTC]'
+_SIMONA_TIME = re.compile('(\\d{4})-(\\d{2})-(\\d{2})T(\\d{2}):(\\d{2}):(\\d{2})Z(?:\\[UTC])?')
+
+
+@lru_cache(maxsize=MAX_TIMES)
+def parse_time(time_string: str) -> datetime:
+    """
+    Parse a time stamp of a SIMONA result. The fixed format, that SIMONA writes (e.g. '2020-01-01T00:00:00Z[UTC]'), is
+    taken apart directly. Only other strings are handed to dateutil. The results are memoized, so that equal time
+    stamps are parsed once and share one object.
+
+    :param time_string: The time stamp to parse
+    :return: The time stamp
+    """
+    match = _SIMONA_TIME.fullmatch(time_string)
+    if match is not None:
+        return datetime(*(int(group) for group in match.groups()), tzinfo=dateutil.tz.UTC)
+    return dateutil.parser.isoparse(re.sub('\\[UTC]$', "", time_string))
+
+
+@lru_cache(maxsize=MAX_UUIDS)
+def parse_uuid(uuid_string: str) -> uuid_module.UUID:
+    """
+    Parse a unique identifier, that is shared by many results (e.g. the input model). The results are memoized, so that
+    equal identifiers share one object.
+
+    :param uuid_string: The unique identifier to parse
+    :return: The unique identifier
+    """
+    return uuid_module.UUID(uuid_string)
+
+
+def statistics() -> dict:
+    """
+    Hit rates of the memoized parsers
+
+    :return: Mapping from parser to hits, misses, current and maximum size and hit rate
+    """
+    out = {}
+    for name, parser in (('time', parse_time), ('uuid', parse_uuid)):
+        info = parser.cache_info()
+        calls = info.hits + info.misses
+        out[name] = {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'max_size': info.maxsize,
+            'hit_rate': info.hits / calls if calls > 0 else 0.0
+        }
+    return out
+
+
+def clear():
+    """
+    Forget all memoized values and reset the statistics
+    """
+    parse_time.cache_clear()
+    parse_uuid.cache_clear()
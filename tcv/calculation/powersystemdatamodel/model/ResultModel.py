@@ -0,0 +1,26 @@
+from datetime import datetime
+
+import dateutil.parser
+
+DEFAULT_TIME: datetime = dateutil.parser.isoparse('1970-01-01T00:00:00Z')
+
+
+class ResultModel:
+    """
+    Base class of the SIMONA result models. The models declare their attributes as __slots__, so that the instances
+    don't carry a dictionary each. Equal time stamps and input models of many results share one object, as they are
+    parsed by the memoized parsers (cf. ParseCache). Equality and representation are derived from the slots, as a
+    dataclass would.
+    """
+
+    __slots__ = ()
+    __hash__ = None
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return "%s(%s)" % (self.__class__.__name__,
+                           ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__))
@@ -1,67 +1,175 @@
-import csv
-import itertools
+import json
+import logging
 import os
+import shutil
 from collections import defaultdict
 
 from tcv.calculation.powersystemdatamodel.model import LoadResult
 from tcv.calculation.powersystemdatamodel.model import NodeResult, Transformer3WResult
 from tcv.calculation.powersystemdatamodel.model import Transformer2WResult
+from tcv.calculation.powersystemdatamodel.model.ColumnarResult import read_csv, read_parsed
+from tcv.util.CompressedFile import find_file
+
+NODE_RESULT_FILE = "node_res.csv"
+LOAD_RESULT_FILE = "load_res.csv"
+TRANSFORMER_2W_RESULT_FILE = "transformer_2_w_res.csv"
+TRANSFORMER_3W_RESULT_FILE = "transformer_3_w_res.csv"
+
+# Mapping from result file to the table's attribute name, the row class and the csv fields
+RESULT_FILES = {
+    NODE_RESULT_FILE: ('node_table', NodeResult.NodeResult, NodeResult.CSV_FIELDS),
+    LOAD_RESULT_FILE: ('load_table', LoadResult.LoadResult, LoadResult.CSV_FIELDS),
+    TRANSFORMER_2W_RESULT_FILE: ('transformer_2w_table', Transformer2WResult.Transformer2WResult,
+                                 Transformer2WResult.CSV_FIELDS),
+    TRANSFORMER_3W_RESULT_FILE: ('transformer_3w_table', Transformer3WResult.Transformer3WResult,
+                                 Transformer3WResult.CSV_FIELDS)
+}
+# The transformer results are optional
+OPTIONAL_RESULT_FILES = (TRANSFORMER_2W_RESULT_FILE, TRANSFORMER_3W_RESULT_FILE)
+
+# Hidden directory within a SIMONA output directory, that holds the parsed tables
+SIDECAR_DIRECTORY_NAME = ".tcv_parsed"
+FINGERPRINT_FILE_NAME = "fingerprint.json"
+# Version of the sidecar's layout. Increase it, whenever the layout changes.
+SIDECAR_VERSION = 1
+
+
+def fingerprint(base_directory: str, delimiter: str = ',') -> dict:
+    """
+    Fingerprint of the result files within a SIMONA output directory, that covers name, size and modification time of
+    each file. It changes as soon as a file is added, removed, rewritten or compressed.
+
+    :param base_directory: The base directory, where the time series results can be found
+    :param delimiter: Column delimiter of the files
+    :return: Version of the sidecar's layout, delimiter and name, size and modification time per present file
+    """
+    files = {}
+    for file_name in RESULT_FILES:
+        file_path = find_file(os.path.join(base_directory, file_name))
+        if file_path is not None:
+            stat = os.stat(file_path)
+            files[file_name] = [os.path.basename(file_path), stat.st_size, stat.st_mtime_ns]
+    return {'version': SIDECAR_VERSION, 'delimiter': delimiter, 'files': files}
 
 
 class TimeSeriesResult:
-    node_results: dict = defaultdict(list)
-    load_results: dict = defaultdict(list)
-    transformer_2w_results: dict = defaultdict(list)
-    transformer_3w_results: dict = defaultdict(list)
-
-    def __new__(cls, *args, **kwargs):
-        obj = super().__new__(cls)
-
-        obj.node_results = defaultdict(list)
-        obj.load_results = defaultdict(list)
-        obj.transformer_2w_results = defaultdict(list)
-        obj.transformer_3w_results = defaultdict(list)
-
-        return obj
-
-    def __init__(self, base_directory: str, delimiter: str = ','):
-        node_result_file = os.path.join(base_directory, "node_res.csv")
-        load_result_file = os.path.join(base_directory, "load_res.csv")
-        transformer_2w_result_file = os.path.join(base_directory, "transformer_2_w_res.csv")
-        transformer_3w_result_file = os.path.join(base_directory, "transformer_3_w_res.csv")
-
-        # Handling the node results
-        with open(node_result_file, mode='r') as node_result_lines:
-            for dct in csv.DictReader(node_result_lines, delimiter=delimiter):
-                node_result = NodeResult.from_dict(dct)
-                self.node_results[node_result.time].append(node_result)
-
-        # Handling the load results
-        with open(load_result_file, mode='r') as load_result_lines:
-            for dct in csv.DictReader(load_result_lines, delimiter=delimiter):
-                load_result = LoadResult.from_dict(dct)
-                self.load_results[load_result.time].append(load_result)
-
-        # Handling the two winding transformer results
-        if os.path.exists(transformer_2w_result_file):
-            with open(transformer_2w_result_file, mode='r') as transformer_2w_lines:
-                for dct in csv.DictReader(transformer_2w_lines, delimiter=delimiter):
-                    transformer_result = Transformer2WResult.from_dict(dct)
-                    self.transformer_2w_results[transformer_result.time].append(transformer_result)
-
-        # Handling the transformer three winding results
-        if os.path.exists(transformer_3w_result_file):
-            with open(transformer_3w_result_file, mode='r') as transformer_3w_lines:
-                for dct in csv.DictReader(transformer_3w_lines, delimiter=delimiter):
-                    transformer_result = Transformer3WResult.from_dict(dct)
-                    self.transformer_3w_results[transformer_result.time].append(transformer_result)
+    """
+    All results of one SIMONA simulation. Each result file is read into a columnar table (cf. ColumnarResult). The
+    mappings from time stamp to row objects (e.g. node_results) are only built on first access. The result files may
+    be compressed with gzip, bzip2 or xz (e.g. 'node_res.csv.xz', cf. CompressedFile).
+
+    The parsed tables are stored in a hidden sidecar directory next to the result files together with a fingerprint
+    of the files (cf. fingerprint). As long as the files don't change, the tables are mapped into memory from there
+    instead of being parsed again. If the sidecar can't be written (e.g. due to missing permissions), the results are
+    parsed every time.
+    """
+
+    logger = logging.getLogger()
+
+    def __init__(self, base_directory: str, delimiter: str = ',', cache: bool = True):
+        """
+        Constructor for the class
+
+        :param base_directory: The base directory, where the time series results can be found
+        :param delimiter: Column delimiter of the files
+        :param cache: True, if the parsed tables shall be read from and written to the sidecar directory
+        """
+        self.node_table = None
+        self.load_table = None
+        self.transformer_2w_table = None
+        self.transformer_3w_table = None
+
+        current = fingerprint(base_directory, delimiter)
+        sidecar_directory = os.path.join(base_directory, SIDECAR_DIRECTORY_NAME)
+        if not (cache and self.__read_sidecar(sidecar_directory, current)):
+            for file_name, (attribute, model_class, csv_fields) in RESULT_FILES.items():
+                file_path = find_file(os.path.join(base_directory, file_name))
+                if file_path is None:
+                    if file_name in OPTIONAL_RESULT_FILES:
+                        continue
+                    raise FileNotFoundError("There is no file '%s' in '%s'." % (file_name, base_directory))
+                setattr(self, attribute, read_csv(file_path, model_class, csv_fields, delimiter))
+            if cache:
+                self.__write_sidecar(sidecar_directory, current)
+
+        self.__node_results = None
+        self.__load_results = None
+        self.__transformer_2w_results = None
+        self.__transformer_3w_results = None
+
+    def __read_sidecar(self, sidecar_directory: str, current: dict) -> bool:
+        """
+        Map the parsed tables into memory, if the sidecar matches the current result files
+
+        :param sidecar_directory: Directory of the sidecar
+        :param current: Fingerprint of the current result files
+        :return: True, if the tables have been read from the sidecar
+        """
+        try:
+            with open(os.path.join(sidecar_directory, FINGERPRINT_FILE_NAME), "r") as fingerprint_file:
+                if json.load(fingerprint_file) != current:
+                    return False
+            for file_name in current['files']:
+                attribute, model_class, csv_fields = RESULT_FILES[file_name]
+                setattr(self, attribute, read_parsed(os.path.join(sidecar_directory, attribute), model_class,
+                                                     csv_fields))
+            return True
+        except (OSError, ValueError, KeyError):
+            return False
+
+    def __write_sidecar(self, sidecar_directory: str, current: dict):
+        """
+        Store the parsed tables together with the fingerprint of the result files. The tables are written to a
+        temporary directory first, so that the sidecar is either complete or not present at all.
+
+        :param sidecar_directory: Directory of the sidecar
+        :param current: Fingerprint of the result files, the tables have been parsed from
+        """
+        temporary = "%s.%i" % (sidecar_directory, os.getpid())
+        try:
+            shutil.rmtree(temporary, ignore_errors=True)
+            for file_name in current['files']:
+                attribute = RESULT_FILES[file_name][0]
+                getattr(self, attribute).save(os.path.join(temporary, attribute))
+            with open(os.path.join(temporary, FINGERPRINT_FILE_NAME), "w") as fingerprint_file:
+                json.dump(current, fingerprint_file, indent=2, sort_keys=True)
+            shutil.rmtree(sidecar_directory, ignore_errors=True)
+            os.replace(temporary, sidecar_directory)
+        except OSError as error:
+            self.logger.warning("Cannot store the parsed results in '%s': %s" % (sidecar_directory, error))
+            shutil.rmtree(temporary, ignore_errors=True)
+
+    @property
+    def node_results(self) -> dict:
+        if self.__node_results is None:
+            self.__node_results = self.node_table.by_time()
+        return self.__node_results
+
+    @property
+    def load_results(self) -> dict:
+        if self.__load_results is None:
+            self.__load_results = self.load_table.by_time()
+        return self.__load_results
+
+    @property
+    def transformer_2w_results(self) -> dict:
+        if self.__transformer_2w_results is None:
+            self.__transformer_2w_results = self.transformer_2w_table.by_time() \
+                if self.transformer_2w_table is not None else defaultdict(list)
+        return self.__transformer_2w_results
+
+    @property
+    def transformer_3w_results(self) -> dict:
+        if self.__transformer_3w_results is None:
+            self.__transformer_3w_results = self.transformer_3w_table.by_time() \
+                if self.transformer_3w_table is not None else defaultdict(list)
+        return self.__transformer_3w_results
 
     def __str__(self):
         return "TimeSeriesResult{node_results=%i,load_results=%i,transformer_2w_results=%i,transformer_3w_results=%i}" % (
-            len(list(itertools.chain(*self.node_results.values()))),
-            len(list(itertools.chain(*self.load_results.values()))),
-            len(list(itertools.chain(*self.transformer_2w_results.values()))),
-            len(list(itertools.chain(*self.transformer_3w_results.values()))))
+            len(self.node_table), len(self.load_table),
+            len(self.transformer_2w_table) if self.transformer_2w_table is not None else 0,
+            len(self.transformer_3w_table) if self.transformer_3w_table is not None else 0)
 
     def join(self, that):
         """
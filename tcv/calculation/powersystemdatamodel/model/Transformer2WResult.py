@@ -1,28 +1,54 @@
-import re
 import uuid as uuid_module
-from dataclasses import dataclass
 from datetime import datetime
 
-import dateutil.parser
+from tcv.calculation.powersystemdatamodel.model.ParseCache import parse_time, parse_uuid
+from tcv.calculation.powersystemdatamodel.model.ResultModel import ResultModel, DEFAULT_TIME
 
+# Mapping from column of the csv file to attribute and its type, in addition to uuid, time and input_model
+CSV_FIELDS = {
+    'i_a_ang': ('i_a_ang_degree', float),
+    'i_b_ang': ('i_b_ang_degree', float),
+    'i_a_mag': ('i_a_mag_ampere', float),
+    'i_b_mag': ('i_b_mag_ampere', float),
+    'tap_pos': ('tap_pos', int)
+}
 
-@dataclass
-class Transformer2WResult:
-    uuid: uuid_module.UUID = uuid_module.uuid4()
-    time: datetime = dateutil.parser.isoparse('1970-01-01T00:00:00Z')
-    input_model: uuid_module.UUID = uuid_module.uuid4()
-    i_a_ang_degree: float = 0.0
-    i_b_ang_degree: float = 0.0
-    i_a_mag_ampere: float = 0.0
-    i_b_mag_ampere: float = 0.0
-    tap_pos: int = 0
+
+class Transformer2WResult(ResultModel):
+    __slots__ = ('uuid', 'time', 'input_model', 'i_a_ang_degree', 'i_b_ang_degree', 'i_a_mag_ampere', 'i_b_mag_ampere',
+                 'tap_pos')
+
+    def __init__(self, uuid: uuid_module.UUID = uuid_module.uuid4(), time: datetime = DEFAULT_TIME,
+                 input_model: uuid_module.UUID = uuid_module.uuid4(), i_a_ang_degree: float = 0.0,
+                 i_b_ang_degree: float = 0.0, i_a_mag_ampere: float = 0.0, i_b_mag_ampere: float = 0.0,
+                 tap_pos: int = 0):
+        """
+        Constructor for the class
+
+        :param uuid: Unique identifier of the result
+        :param time: Time stamp of the result
+        :param input_model: Unique identifier of the input model, the result belongs to
+        :param i_a_ang_degree: Angle of the current at port A in degree
+        :param i_b_ang_degree: Angle of the current at port B in degree
+        :param i_a_mag_ampere: Magnitude of the current at port A in ampere
+        :param i_b_mag_ampere: Magnitude of the current at port B in ampere
+        :param tap_pos: Position of the tap changer
+        """
+        self.uuid = uuid
+        self.time = time
+        self.input_model = input_model
+        self.i_a_ang_degree = i_a_ang_degree
+        self.i_b_ang_degree = i_b_ang_degree
+        self.i_a_mag_ampere = i_a_mag_ampere
+        self.i_b_mag_ampere = i_b_mag_ampere
+        self.tap_pos = tap_pos
 
 
 def from_dict(dct: dict) -> Transformer2WResult:
     return Transformer2WResult(
         uuid_module.UUID(dct['uuid']),
-        dateutil.parser.isoparse(re.sub('\\[UTC]$', "", dct['time'])),
-        uuid_module.UUID(dct['input_model']),
+        parse_time(dct['time']),
+        parse_uuid(dct['input_model']),
         float(dct['i_a_ang']),
         float(dct['i_b_ang']),
         float(dct['i_a_mag']),
@@ -0,0 +1,214 @@
+import itertools
+
+import numpy as np
+
+from tcv.calculation.result.GridResultTable import GridResultTable, table_from_records
+
+# Powers of the operating points, that differ by no more than this (in MW), denote the same operating point
+DEFAULT_TOLERANCE = 0.1
+
+
+class GridResultDiff:
+    """
+    Outcome of joining two result sets on their operating points (cf. diff_results)
+    """
+
+    def __init__(self, difference: GridResultTable, lhs_index: np.ndarray, rhs_index: np.ndarray,
+                 lhs_unmatched: GridResultTable, rhs_unmatched: GridResultTable):
+        """
+        Constructor for the class
+
+        Parameters:
+            difference (GridResultTable): Operating points of the left hand side and the differences of all result
+                fields (left minus right hand side) for all matched rows
+            lhs_index (np.ndarray): Row of the left hand side for each row of the difference
+            rhs_index (np.ndarray): Row of the right hand side for each row of the difference
+            lhs_unmatched (GridResultTable): Rows of the left hand side without partner
+            rhs_unmatched (GridResultTable): Rows of the right hand side without partner
+        """
+        self.difference = difference
+        self.lhs_index = lhs_index
+        self.rhs_index = rhs_index
+        self.lhs_unmatched = lhs_unmatched
+        self.rhs_unmatched = rhs_unmatched
+
+    def is_complete(self) -> bool:
+        """
+        Check, if every row found a partner
+
+        Returns:
+            bool: True, if there are no unmatched rows on either side
+        """
+        return len(self.lhs_unmatched) == 0 and len(self.rhs_unmatched) == 0
+
+    def __str__(self):
+        return "GridResultDiff{matched=%i, lhs_unmatched=%s, rhs_unmatched=%s}" % (
+            len(self.difference), self.lhs_unmatched.keys().tolist(), self.rhs_unmatched.keys().tolist())
+
+
+def _buckets(table: GridResultTable, tolerance: float) -> np.ndarray:
+    """
+    Operating points of all rows as integers. The tap position is taken as is, the powers are replaced by the index of
+    their bucket of the tolerance's width. Powers, that differ by no more than the tolerance, lie within the same or
+    neighbouring buckets.
+
+    Parameters:
+        table (GridResultTable): The table
+        tolerance (float): Width of the buckets
+
+    Returns:
+        np.ndarray: One row per operating point and one column per key name
+    """
+    return np.column_stack([table[name] if name == 'tap_pos' else np.floor(table[name] / tolerance).astype(np.int64)
+                            for name in table.KEY_NAMES])
+
+
+def _lookups(lhs_buckets: np.ndarray, rhs_buckets: np.ndarray, offsets: np.ndarray):
+    """
+    Number the buckets of both sides, so that each bucket of the left hand side, shifted by each of the offsets, can be
+    looked up among the buckets of the right hand side. If the ranges of the buckets permit, they are packed into one
+    integer each. Then, a shift is the addition of a constant and the shifted buckets stay in order. Otherwise, the
+    columns are numbered densely one after another and folded into one integer.
+
+    Parameters:
+        lhs_buckets (np.ndarray): Buckets of the left hand side (cf. _buckets)
+        rhs_buckets (np.ndarray): Buckets of the right hand side
+        offsets (np.ndarray): Shifts of the buckets of the left hand side, one row each
+
+    Returns:
+        tuple: Ids of the right hand side's buckets and a generator of the order of the left hand side's rows and
+            their sorted ids, one per offset
+    """
+    keys = np.concatenate([lhs_buckets, rhs_buckets])
+    lower = keys.min(axis=0, initial=0) + offsets.min(axis=0)
+    spans = keys.max(axis=0, initial=0) + offsets.max(axis=0) - lower + 1
+    if np.prod(spans.astype(np.float64)) < 2 ** 62:
+        strides = np.append(np.cumprod(spans[:0:-1])[::-1], 1)
+        lhs_ids = (lhs_buckets - lower) @ strides
+        order = np.argsort(lhs_ids)
+        sorted_ids = lhs_ids[order]
+        return (rhs_buckets - lower) @ strides, ((order, sorted_ids + offset @ strides) for offset in offsets)
+
+    keys = np.concatenate([lhs_buckets + offset for offset in offsets] + [rhs_buckets])
+    ids = np.zeros(len(keys), dtype=np.int64)
+    for column in keys.T:
+        codes = np.unique(column, return_inverse=True)[1].reshape(-1)
+        ids = np.unique(ids * (codes.max() + 1) + codes, return_inverse=True)[1].reshape(-1)
+    queries = (ids[idx * len(lhs_buckets):(idx + 1) * len(lhs_buckets)] for idx in range(len(offsets)))
+    return ids[len(offsets) * len(lhs_buckets):], ((np.argsort(query), np.sort(query)) for query in queries)
+
+
+def _candidates(lhs: GridResultTable, rhs: GridResultTable, tolerance: float) -> tuple:
+    """
+    Find all pairs of rows with equal tap position, whose powers differ by no more than the tolerance. The right hand
+    side is sorted by bucket once and the buckets of each row of the left hand side and their neighbours are looked up
+    in it.
+
+    Parameters:
+        lhs (GridResultTable): Left hand side
+        rhs (GridResultTable): Right hand side
+        tolerance (float): Largest deviation of the powers
+
+    Returns:
+        tuple: Rows of the left hand side, rows of the right hand side and the largest deviation of their powers
+    """
+    powers = [name for name in lhs.KEY_NAMES if name != 'tap_pos']
+    offsets = np.array(list(itertools.product((-1, 0, 1), repeat=len(powers))), dtype=np.int64)
+    # The tap position is never shifted
+    offsets = np.column_stack([np.zeros(len(offsets), dtype=np.int64), offsets])
+    rhs_ids, queries = _lookups(_buckets(lhs, tolerance), _buckets(rhs, tolerance), offsets)
+    rhs_order = np.argsort(rhs_ids, kind='stable')
+    sorted_rhs_ids = rhs_ids[rhs_order]
+
+    lhs_candidates, rhs_candidates = [], []
+    for query_order, query_ids in queries:
+        starts = np.searchsorted(sorted_rhs_ids, query_ids, side='left')
+        stops = np.searchsorted(sorted_rhs_ids, query_ids, side='right')
+        # Usually, a bucket holds one row at most. Walk through the buckets' rows, if it's more.
+        for depth in range(int((stops - starts).max(initial=0))):
+            rows = np.flatnonzero(starts + depth < stops)
+            lhs_candidates.append(query_order[rows])
+            rhs_candidates.append(rhs_order[starts[rows] + depth])
+    lhs_candidates = np.concatenate(lhs_candidates) if lhs_candidates else np.zeros(0, dtype=np.int64)
+    rhs_candidates = np.concatenate(rhs_candidates) if rhs_candidates else np.zeros(0, dtype=np.int64)
+    deviation = np.zeros(len(lhs_candidates))
+    for name in powers:
+        deviation = np.maximum(deviation, np.abs(lhs[name][lhs_candidates] - rhs[name][rhs_candidates]))
+    within = deviation <= tolerance
+    return lhs_candidates[within], rhs_candidates[within], deviation[within]
+
+
+def _pair(lhs_candidates: np.ndarray, rhs_candidates: np.ndarray, deviation: np.ndarray) -> tuple:
+    """
+    Pair each row with at most one row of the other side. Closer candidates are preferred, ties are resolved in favour
+    of the earlier rows. In each round, every unpaired row of the left hand side proposes it's best candidate and every
+    row of the right hand side accepts the best proposal.
+
+    Parameters:
+        lhs_candidates (np.ndarray): Rows of the left hand side
+        rhs_candidates (np.ndarray): Rows of the right hand side
+        deviation (np.ndarray): Largest deviation of the powers of each candidate pair
+
+    Returns:
+        tuple: Paired rows of the left and right hand side, in the order of the left hand side
+    """
+    order = np.lexsort((rhs_candidates, lhs_candidates, deviation))
+    lhs_candidates, rhs_candidates = lhs_candidates[order], rhs_candidates[order]
+    lhs_paired, rhs_paired = [], []
+    while len(lhs_candidates) > 0:
+        proposals = np.sort(np.unique(lhs_candidates, return_index=True)[1])
+        accepted = proposals[np.unique(rhs_candidates[proposals], return_index=True)[1]]
+        lhs_paired.append(lhs_candidates[accepted])
+        rhs_paired.append(rhs_candidates[accepted])
+        remaining = ~(np.isin(lhs_candidates, lhs_candidates[accepted]) |
+                      np.isin(rhs_candidates, rhs_candidates[accepted]))
+        lhs_candidates, rhs_candidates = lhs_candidates[remaining], rhs_candidates[remaining]
+    lhs_index = np.concatenate(lhs_paired) if lhs_paired else np.zeros(0, dtype=np.int64)
+    rhs_index = np.concatenate(rhs_paired) if rhs_paired else np.zeros(0, dtype=np.int64)
+    order = np.argsort(lhs_index)
+    return lhs_index[order], rhs_index[order]
+
+
+def _empty(table_class: type) -> GridResultTable:
+    return table_class({name: [] for name in table_class.KEY_NAMES + table_class.RESULT_CLASS.FIELDS})
+
+
+def diff_results(lhs, rhs, tolerance: float = DEFAULT_TOLERANCE) -> GridResultDiff:
+    """
+    Join two result sets on their operating points, e.g. (tap_pos, p_mv, p_lv), and build the differences of all
+    result fields at once. The order of the rows on either side doesn't matter. Rows with equal tap position, whose
+    powers differ by no more than the tolerance, are paired (cf. the notebooks' check abs(p_mv - p_mv') > 0.1). If a
+    row has more than one candidate, the closest one is chosen. If an operating point occurs more than once on one
+    side, only it's first occurrence is paired. All rows without partner are reported instead of raising an error.
+
+    Parameters:
+        lhs: Left hand side, either a GridResultTable or records, i.e. dictionaries with the operating point and the
+            result object
+        rhs: Right hand side of the same kind of results
+        tolerance (float): Largest deviation of the powers of paired rows in MW. It has to be positive.
+
+    Returns:
+        GridResultDiff: Differences of the matched rows and the unmatched rows of both sides
+    """
+    if not tolerance > 0.0:
+        raise ValueError("The tolerance has to be positive, but is %s." % tolerance)
+    lhs = lhs if isinstance(lhs, GridResultTable) else table_from_records(list(lhs))
+    rhs = rhs if isinstance(rhs, GridResultTable) else table_from_records(list(rhs))
+    if type(lhs) is not type(rhs):
+        # Empty records don't reveal their kind of results
+        if len(lhs) == 0:
+            lhs = _empty(type(rhs))
+        elif len(rhs) == 0:
+            rhs = _empty(type(lhs))
+        else:
+            raise ValueError("Cannot join a %s with a %s." % (type(lhs).__name__, type(rhs).__name__))
+
+    lhs_index, rhs_index = _pair(*_candidates(lhs, rhs, tolerance))
+
+    columns = {name: lhs[name][lhs_index] for name in lhs.KEY_NAMES}
+    columns.update({field: lhs[field][lhs_index] - rhs[field][rhs_index] for field in lhs.RESULT_CLASS.FIELDS})
+    rhs_matched = np.zeros(len(rhs), dtype=bool)
+    rhs_matched[rhs_index] = True
+    lhs_matched = np.zeros(len(lhs), dtype=bool)
+    lhs_matched[lhs_index] = True
+    return GridResultDiff(type(lhs)(columns), lhs_index, rhs_index, lhs[~lhs_matched], rhs[~rhs_matched])
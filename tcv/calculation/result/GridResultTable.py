@@ -0,0 +1,172 @@
+import numpy as np
+
+from tcv.calculation.result.GridResultThreeWinding import GridResultThreeWinding
+from tcv.calculation.result.GridResultTwoWinding import GridResultTwoWinding
+
+
+class GridResultTable:
+    """
+    Column wise counterpart of a list of records, i.e. of dictionaries with the operating point (e.g. 'tap_pos' and
+    'p_lv') and the 'result' object. Each key of the operating point and each field of the result class is held as
+    one array. Operations run on whole columns instead of on single result objects.
+    """
+    RESULT_CLASS: type = None
+    KEY_NAMES: tuple = ()
+
+    def __init__(self, columns: dict):
+        """
+        Constructor for the class
+
+        Parameters:
+            columns (dict): Mapping from key names and result fields to arrays of equal length, e.g. as read by
+                read_columnar or ResultCache.get_columns
+        """
+        missing = [name for name in self.KEY_NAMES + self.RESULT_CLASS.FIELDS if name not in columns]
+        if missing:
+            raise ValueError("The columns %s are missing." % missing)
+        self.columns = {name: np.asarray(columns[name], dtype=np.int64 if name == 'tap_pos' else np.float64) for name
+                        in self.KEY_NAMES + self.RESULT_CLASS.FIELDS}
+        lengths = {len(column) for column in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("The columns have different lengths: %s" % sorted(lengths))
+
+    @classmethod
+    def from_records(cls, records: list) -> 'GridResultTable':
+        """
+        Build a table from records, e.g. as handed back by the test benches or ResultCollector
+
+        Parameters:
+            records (list): Dictionaries with the operating point and the result object
+
+        Returns:
+            GridResultTable: The table
+        """
+        columns = {name: [record[name] for record in records] for name in cls.KEY_NAMES}
+        columns.update({field: [getattr(record['result'], field) for record in records] for field in
+                        cls.RESULT_CLASS.FIELDS})
+        return cls(columns)
+
+    def to_records(self) -> list:
+        """
+        Turn the table back into records
+
+        Returns:
+            list: Dictionaries with the operating point and the result object
+        """
+        keys = zip(*(self.columns[name].tolist() for name in self.KEY_NAMES))
+        values = zip(*(self.columns[field].tolist() for field in self.RESULT_CLASS.FIELDS))
+        records = []
+        for key, value in zip(keys, values):
+            record = dict(zip(self.KEY_NAMES, key))
+            record['result'] = self.RESULT_CLASS(**dict(zip(self.RESULT_CLASS.FIELDS, value)))
+            records.append(record)
+        return records
+
+    def __len__(self):
+        return len(self.columns['tap_pos'])
+
+    def __getitem__(self, item):
+        """
+        Access a column by name or a subset of the rows by index, slice, index array or boolean mask
+
+        Parameters:
+            item: Column name or row selection
+
+        Returns:
+            Either the column's array or a table with the selected rows
+        """
+        if isinstance(item, str):
+            return self.columns[item]
+        if isinstance(item, (int, np.integer)):
+            item = [item]
+        return type(self)({name: column[item] for name, column in self.columns.items()})
+
+    def keys(self) -> np.ndarray:
+        """
+        Operating points of all rows
+
+        Returns:
+            np.ndarray: One row per operating point and one column per key name
+        """
+        return np.column_stack([self.columns[name].astype(np.float64) for name in self.KEY_NAMES])
+
+    def subtract(self, other: 'GridResultTable') -> 'GridResultTable':
+        """
+        Builds the difference between this and another table row by row (cf. GridResultTwoWinding.subtract). Both
+        tables have to hold the same operating points in the same order.
+
+        Parameters:
+            other (GridResultTable): The right hand side
+
+        Returns:
+            GridResultTable: Table with the operating points and the differences of all result fields
+        """
+        if type(other) is not type(self):
+            raise ValueError("Cannot subtract a %s from a %s." % (type(other).__name__, type(self).__name__))
+        if not np.array_equal(self.keys(), other.keys()):
+            raise ValueError("The tables don't hold the same operating points in the same order.")
+        columns = {name: self.columns[name] for name in self.KEY_NAMES}
+        columns.update({field: self.columns[field] - other.columns[field] for field in self.RESULT_CLASS.FIELDS})
+        return type(self)(columns)
+
+    def group_by_tap(self) -> dict:
+        """
+        Split the table by tap position
+
+        Returns:
+            dict: Mapping from tap position to the table of it's rows in ascending tap position
+        """
+        tap_pos = self.columns['tap_pos']
+        return {int(value): self[np.flatnonzero(tap_pos == value)] for value in np.unique(tap_pos)}
+
+    def select(self, **ranges) -> 'GridResultTable':
+        """
+        Select the rows, whose operating point lies within the given ranges, e.g. select(tap_pos=(-2, 2),
+        p_lv=(0.0, None)). The bounds are inclusive. None leaves a side open.
+
+        Parameters:
+            ranges: Mapping from key name to tuple of lower and upper bound
+
+        Returns:
+            GridResultTable: Table with the selected rows
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for name, (lower, upper) in ranges.items():
+            if name not in self.KEY_NAMES:
+                raise ValueError("'%s' is not a key of the operating point. Choose one of %s." % (name, self.KEY_NAMES))
+            if lower is not None:
+                mask &= self.columns[name] >= lower
+            if upper is not None:
+                mask &= self.columns[name] <= upper
+        return self[mask]
+
+
+class GridResultTableTwoWinding(GridResultTable):
+    """
+    Table of the results of the two winding transformer test bench
+    """
+    RESULT_CLASS = GridResultTwoWinding
+    KEY_NAMES = ('tap_pos', 'p_lv')
+
+
+class GridResultTableThreeWinding(GridResultTable):
+    """
+    Table of the results of the three winding transformer test bench
+    """
+    RESULT_CLASS = GridResultThreeWinding
+    KEY_NAMES = ('tap_pos', 'p_mv', 'p_lv')
+
+
+def table_from_records(records: list) -> GridResultTable:
+    """
+    Build the suitable table from records, depending on the class of their results
+
+    Parameters:
+        records (list): Dictionaries with the operating point and the result object
+
+    Returns:
+        GridResultTable: The table
+    """
+    if len(records) > 0 and isinstance(records[0]['result'], GridResultThreeWinding):
+        return GridResultTableThreeWinding.from_records(records)
+    return GridResultTableTwoWinding.from_records(records)
@@ -2,6 +2,10 @@ class GridResultThreeWinding:
     """
     Class to hold information about the results of interest of a power flow calculation obtained with pandapower
     """
+    FIELDS = ('v_mv_pu', 'v_ang_mv_degree', 'v_lv_pu', 'v_ang_lv_degree', 'p_hv_kw', 'q_hv_kvar', 's_hv_kva',
+              'i_mag_hv_a', 'i_ang_hv_degree', 'p_mv_kw', 'q_mv_kvar', 's_mv_kva', 'i_mag_mv_a', 'i_ang_mv_degree',
+              'p_lv_kw', 'q_lv_kvar', 's_lv_kva', 'i_mag_lv_a', 'i_ang_lv_degree')
+
     v_mv_pu: float = 0.0
     v_ang_mv_degree: float = 0.0
     v_lv_pu: float = 0.0
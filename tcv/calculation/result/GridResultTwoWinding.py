@@ -2,6 +2,9 @@ class GridResultTwoWinding:
     """
     Class to hold information about the results of interest of a power flow calculation obtained with pandapower
     """
+    FIELDS = ('v_lv_pu', 'v_ang_lv_degree', 'p_hv_kw', 'q_hv_kvar', 's_hv_kva', 'i_mag_hv_a', 'i_ang_hv_degree',
+              'p_lv_kw', 'q_lv_kvar', 's_lv_kva', 'i_mag_lv_a', 'i_ang_lv_degree')
+
     v_lv_pu: float = 0.0
     v_ang_lv_degree: float = 0.0
     p_hv_kw: float = 0.0
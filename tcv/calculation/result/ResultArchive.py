@@ -0,0 +1,174 @@
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from tcv.calculation.result.GridResultTable import GridResultTable, GridResultTableThreeWinding, \
+    GridResultTableTwoWinding, table_from_records
+from tcv.encoder import SchemaDecoder
+from tcv.encoder.DictEncoder import DictEncoder
+
+HEADER_FILE_NAME = "header.json"
+ARCHIVE_VERSION = 1
+TABLE_CLASSES = {table_class.RESULT_CLASS.__name__: table_class for table_class in
+                 (GridResultTableTwoWinding, GridResultTableThreeWinding)}
+
+
+def write_archive(directory: str, results, metadata: dict = None) -> 'ResultArchive':
+    """
+    Write results into an archive directory. Each key of the operating point and each result field is saved as one
+    .npy file. The rows are ordered by tap position, so that the rows of one tap position occupy a contiguous range of
+    each file. A header file holds the result class, the ranges of the tap positions and the given metadata. An
+    existing archive at the same place is replaced.
+
+    Parameters:
+        directory (str): Directory of the archive
+        results: Either a GridResultTable or records, i.e. dictionaries with the operating point and the result object
+        metadata (dict): JSON serializable description of the sweep, e.g. the grid's parameters
+
+    Returns:
+        ResultArchive: The written archive
+    """
+    table = results if isinstance(results, GridResultTable) else table_from_records(list(results))
+    # Stable, so that the order within one tap position is kept
+    table = table[np.argsort(table['tap_pos'], kind='stable')]
+    tap_pos = table['tap_pos']
+    tap_positions, starts = np.unique(tap_pos, return_index=True)
+    stops = np.append(starts[1:], len(tap_pos))
+    header = {
+        'version': ARCHIVE_VERSION,
+        'result_class': table.RESULT_CLASS.__name__,
+        'rows': len(table),
+        'columns': list(table.columns.keys()),
+        'tap_ranges': {str(tap): [int(start), int(stop)] for tap, start, stop in zip(tap_positions, starts, stops)},
+        'metadata': metadata if metadata is not None else {}
+    }
+
+    parent = os.path.dirname(os.path.abspath(directory))
+    os.makedirs(parent, exist_ok=True)
+    temporary_directory = tempfile.mkdtemp(dir=parent, prefix=".archive_")
+    try:
+        for name, column in table.columns.items():
+            np.save(os.path.join(temporary_directory, "%s.npy" % name), column)
+        with open(os.path.join(temporary_directory, HEADER_FILE_NAME), "w") as header_file:
+            json.dump(header, header_file, indent=2)
+        if os.path.isdir(directory):
+            shutil.rmtree(directory)
+        os.replace(temporary_directory, directory)
+    except BaseException:
+        shutil.rmtree(temporary_directory, ignore_errors=True)
+        raise
+    return ResultArchive(directory)
+
+
+def json_to_archive(json_path: str, directory: str, metadata: dict = None) -> 'ResultArchive':
+    """
+    Convert a result file, as written with DictEncoder, into an archive. The file is decoded into columns directly
+    (cf. SchemaDecoder).
+
+    Parameters:
+        json_path (str): Path to the JSON file
+        directory (str): Directory of the archive
+        metadata (dict): JSON serializable description of the sweep
+
+    Returns:
+        ResultArchive: The written archive
+    """
+    return write_archive(directory, SchemaDecoder.load(json_path, columnar=True), metadata)
+
+
+def archive_to_json(directory: str, json_path: str):
+    """
+    Convert an archive back into a result file, as the test benches have been writing it with DictEncoder
+
+    Parameters:
+        directory (str): Directory of the archive
+        json_path (str): Path of the JSON file to write
+    """
+    with open(json_path, "w") as file_to_write:
+        json.dump(ResultArchive(directory).records(), file_to_write, cls=DictEncoder, indent=2)
+
+
+class ResultArchive:
+    """
+    Read access to an archive, as written by write_archive. The columns are mapped into memory, so that reading one
+    column of one tap position only touches the bytes of that range.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Constructor for the class
+
+        Parameters:
+            directory (str): Directory of the archive
+        """
+        with open(os.path.join(directory, HEADER_FILE_NAME), "r") as header_file:
+            header = json.load(header_file)
+        if header.get('version') != ARCHIVE_VERSION:
+            raise ValueError("Unsupported version %s of the archive in '%s'." % (header.get('version'), directory))
+        self.directory = directory
+        self.table_class = TABLE_CLASSES[header['result_class']]
+        self.metadata = header['metadata']
+        self.rows = header['rows']
+        self.column_names = tuple(header['columns'])
+        self.tap_ranges = {int(tap): (start, stop) for tap, (start, stop) in header['tap_ranges'].items()}
+        self.__columns = {}
+
+    def __len__(self):
+        return self.rows
+
+    def tap_positions(self) -> list:
+        """
+        All tap positions within the archive
+
+        Returns:
+            list: The tap positions in ascending order
+        """
+        return sorted(self.tap_ranges.keys())
+
+    def column(self, name: str, tap_pos: int = None) -> np.ndarray:
+        """
+        Access one column, either completely or only the rows of one tap position
+
+        Parameters:
+            name (str): Key name or result field, e.g. 'v_lv_pu'
+            tap_pos (int): Tap position to restrict the rows to. None hands back all rows.
+
+        Returns:
+            np.ndarray: Read only view of the memory mapped column
+        """
+        if name not in self.column_names:
+            raise ValueError("'%s' is not a column of the archive. Choose one of %s." % (name, self.column_names))
+        column = self.__columns.get(name)
+        if column is None:
+            column = self.__columns[name] = np.load(os.path.join(self.directory, "%s.npy" % name), mmap_mode='r')
+        if tap_pos is None:
+            return column
+        start, stop = self.tap_ranges.get(tap_pos, (0, 0))
+        return column[start:stop]
+
+    def table(self, tap_pos: int = None) -> GridResultTable:
+        """
+        The archive's content as table
+
+        Parameters:
+            tap_pos (int): Tap position to restrict the rows to. None hands back all rows.
+
+        Returns:
+            GridResultTable: The table
+        """
+        return self.table_class({name: self.column(name, tap_pos) for name in self.column_names})
+
+    def records(self, tap_pos: int = None) -> list:
+        """
+        The archive's content as records
+
+        Parameters:
+            tap_pos (int): Tap position to restrict the rows to. None hands back all rows.
+
+        Returns:
+            list: Dictionaries with the operating point and the result object
+        """
+        return self.table(tap_pos).to_records()
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import logging
+import os
+from enum import Enum
+
+from tcv.encoder.DictEncoder import DictEncoder
+
+PARAMETER_FILE_NAME = "parameters.json"
+# Amount of bytes to read at once, while searching the end of the last complete line
+_BLOCK_SIZE = 1 << 16
+
+
+def json_default(value):
+    """
+    Fallback of the JSON encoder for sweep parameters, that aren't serializable by default. Enumerations are
+    represented by their value, everything else by it's string representation.
+
+    Parameters:
+        value: The value to encode
+
+    Returns:
+        The serializable representation
+    """
+    return value.value if isinstance(value, Enum) else str(value)
+
+
+def parameter_hash(parameters: dict) -> str:
+    """
+    Stable hash of the parameters of a sweep. Enumerations are represented by their value.
+
+    Parameters:
+        parameters (dict): Parameters, that determine the results of a sweep
+
+    Returns:
+        str: Hexadecimal SHA-256 digest
+    """
+    canonical = json.dumps(parameters, sort_keys=True, default=json_default)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class Checkpoint:
+    """
+    Persists the completed operating points of a sweep, so that an aborted sweep can be resumed later on. The
+    checkpoint lives in a subdirectory named after the hash of the sweep parameters (cf. parameter_hash). Thereby, a
+    checkpoint of a sweep with other parameters is never picked up by mistake. Within this directory, the records of
+    each tap position are appended to a separate JSON Lines file. Hence, different worker processes may store their
+    tap positions at the same time and only one tap position has to be held in memory when resuming.
+    """
+
+    logger = logging.getLogger()
+
+    def __init__(self, directory: str, parameters: dict, key_names: tuple, result_class: type):
+        """
+        Constructor for the class
+
+        Parameters:
+            directory (str): Base directory of all checkpoints
+            parameters (dict): Parameters, that determine the results of the sweep
+            key_names (tuple): Entries of a record, that identify the operating point, e.g. ('tap_pos', 'p_lv')
+            result_class (type): Class of the results, e.g. GridResultTwoWinding
+        """
+        self.key = parameter_hash(parameters)
+        self.path = os.path.join(directory, self.key)
+        self.key_names = key_names
+        self.result_class = result_class
+        os.makedirs(self.path, exist_ok=True)
+        parameter_file = os.path.join(self.path, PARAMETER_FILE_NAME)
+        if not os.path.exists(parameter_file):
+            with open(parameter_file, "w") as file_to_write:
+                json.dump(parameters, file_to_write, indent=2, sort_keys=True, default=json_default)
+
+    def operating_point(self, record: dict) -> tuple:
+        """
+        Key of the operating point, the record belongs to
+
+        Parameters:
+            record (dict): Record of a sweep
+
+        Returns:
+            tuple: The record's entries named in key_names
+        """
+        return tuple(record[name] for name in self.key_names)
+
+    def load(self, tap_pos: int) -> dict:
+        """
+        Load all completed operating points of one tap position. An incomplete last line, e.g. due to a crash while
+        storing, and lines, that can't be decoded, are ignored.
+
+        Parameters:
+            tap_pos (int): Tap position of interest
+
+        Returns:
+            dict: Mapping from operating point (cf. operating_point) to record
+        """
+        file_path = self.__tap_file(tap_pos)
+        if not os.path.exists(file_path):
+            return {}
+        completed = {}
+        with open(file_path, "r") as file_to_read:
+            for line in file_to_read:
+                if not line.endswith("\n") or not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    self.logger.warning("Ignoring an undecodable line of the checkpoint '%s'." % file_path)
+                    continue
+                record['result'] = self.result_class(
+                    **{field: record['result'][field] for field in self.result_class.FIELDS})
+                completed[self.operating_point(record)] = record
+        return completed
+
+    def store(self, tap_pos: int, records: list):
+        """
+        Append the given records of one tap position and make sure, they have been written to disk. An incomplete
+        last line, e.g. due to a crash while storing, is removed beforehand, so that the records start on a new line.
+
+        Parameters:
+            tap_pos (int): Tap position, the records belong to
+            records (list): Records of newly completed operating points
+        """
+        if len(records) == 0:
+            return
+        file_path = self.__tap_file(tap_pos)
+        if os.path.exists(file_path):
+            self.__truncate_incomplete_line(file_path)
+        with open(file_path, "a") as file_to_write:
+            for record in records:
+                file_to_write.write(json.dumps(record, cls=DictEncoder))
+                file_to_write.write("\n")
+            file_to_write.flush()
+            os.fsync(file_to_write.fileno())
+
+    def clear(self, tap_pos: int = None):
+        """
+        Remove the stored operating points
+
+        Parameters:
+            tap_pos (int): Tap position to remove the operating points of. If not given, all tap positions are removed.
+        """
+        if tap_pos is not None:
+            if os.path.exists(self.__tap_file(tap_pos)):
+                os.remove(self.__tap_file(tap_pos))
+            return
+        for file_name in os.listdir(self.path):
+            if file_name != PARAMETER_FILE_NAME:
+                os.remove(os.path.join(self.path, file_name))
+
+    @staticmethod
+    def __truncate_incomplete_line(file_path: str):
+        """
+        Cut the file back to the end of it's last complete line, i.e. remove everything after the last line break
+
+        Parameters:
+            file_path (str): Path to the JSON Lines file of one tap position
+        """
+        with open(file_path, "rb+") as file_to_cut:
+            size = file_to_cut.seek(0, os.SEEK_END)
+            end = size
+            while end > 0:
+                start = max(0, end - _BLOCK_SIZE)
+                file_to_cut.seek(start)
+                position = file_to_cut.read(end - start).rfind(b"\n")
+                if position >= 0:
+                    end = start + position + 1
+                    break
+                end = start
+            if end < size:
+                file_to_cut.truncate(end)
+
+    def __tap_file(self, tap_pos: int) -> str:
+        return os.path.join(self.path, "tap_%i.jsonl" % tap_pos)
@@ -0,0 +1,141 @@
+import json
+import os
+
+import numpy as np
+
+from tcv.calculation.sink.ResultSink import ResultSink, flatten_record
+
+HEADER_FILE_NAME = "header.json"
+INTEGER_COLUMNS = ('tap_pos',)
+
+
+def read_columnar(directory: str, memory_map: bool = True) -> dict:
+    """
+    Read the columns, that have been written by ColumnarSink. If the sweep has been aborted, only the rows, that have
+    been written to all columns, are handed back.
+
+    Parameters:
+        directory (str): Directory of the columnar results
+        memory_map (bool): True, if the columns shall be mapped into memory instead of being read
+
+    Returns:
+        dict: Mapping from column name to one dimensional array
+    """
+    with open(os.path.join(directory, HEADER_FILE_NAME), "r") as header_file:
+        header = json.load(header_file)
+    columns = [(column['name'], np.dtype(column['dtype'])) for column in header['columns']]
+    rows = min(os.path.getsize(os.path.join(directory, column_file_name(name))) // dtype.itemsize for name, dtype in
+               columns) if columns else 0
+    out = {}
+    for name, dtype in columns:
+        path = os.path.join(directory, column_file_name(name))
+        if memory_map and rows > 0:
+            out[name] = np.memmap(path, dtype=dtype, mode="r", shape=(rows,))
+        else:
+            out[name] = np.fromfile(path, dtype=dtype, count=rows)
+    return out
+
+
+def column_file_name(name: str) -> str:
+    """
+    Name of the raw file, that holds the given column
+
+    Parameters:
+        name (str): Name of the column
+
+    Returns:
+        str: File name within the directory of the columnar results
+    """
+    return "%s.bin" % name
+
+
+def records_from_columns(columns: dict, result_class: type) -> list:
+    """
+    Turn columns, e.g. as read by read_columnar, back into the records of a sweep
+
+    Parameters:
+        columns (dict): Mapping from column name to one dimensional array
+        result_class (type): Class of the results, e.g. GridResultTwoWinding
+
+    Returns:
+        list: Dictionaries with the operating point and the result object
+    """
+    key_names = [name for name in columns if name not in result_class.FIELDS]
+    keys = zip(*(columns[name].tolist() for name in key_names))
+    values = zip(*(columns[field].tolist() for field in result_class.FIELDS))
+    records = []
+    for key, value in zip(keys, values):
+        record = dict(zip(key_names, key))
+        record['result'] = result_class(**dict(zip(result_class.FIELDS, value)))
+        records.append(record)
+    return records
+
+
+class ColumnarSink(ResultSink):
+    """
+    Sink, that writes the records column by column into one raw binary file per column (little endian float64, int64
+    for the tap position). A header file lists the columns and their data types. The rows are buffered and appended to
+    the column files in chunks. The columns can be read back or mapped into memory with read_columnar.
+    """
+
+    def __init__(self, directory: str, chunk_size: int = 4096):
+        """
+        Constructor for the class
+
+        Parameters:
+            directory (str): Directory to write the columns to. It is created, if it's missing.
+            chunk_size (int): Amount of rows to buffer, before they are appended to the column files
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.columns = None
+        self.buffer = None
+        # Amount of rows within the buffer
+        self.buffered = 0
+        self.files = {}
+        self.rows = 0
+
+    def write(self, record: dict):
+        row = flatten_record(record)
+        if self.columns is None:
+            self.__open(list(row.keys()))
+        for name in self.columns:
+            self.buffer[name].append(row[name])
+        self.buffered += 1
+        if self.buffered >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Append all buffered rows to the column files
+        """
+        if self.columns is None:
+            return
+        for name, dtype in self.columns.items():
+            np.asarray(self.buffer[name], dtype=dtype).tofile(self.files[name])
+            self.files[name].flush()
+            self.buffer[name] = []
+        self.rows += self.buffered
+        self.buffered = 0
+
+    def shutdown(self):
+        self.flush()
+        for file in self.files.values():
+            file.close()
+        self.files = {}
+
+    def __open(self, names: list):
+        """
+        Set up the header and the column files, as soon as the columns are known from the first record
+
+        Parameters:
+            names (list): Names of the columns
+        """
+        self.columns = {name: np.dtype('<i8') if name in INTEGER_COLUMNS else np.dtype('<f8') for name in names}
+        self.buffer = {name: [] for name in names}
+        header = {'columns': [{'name': name, 'dtype': dtype.str} for name, dtype in self.columns.items()]}
+        with open(os.path.join(self.directory, HEADER_FILE_NAME), "w") as header_file:
+            json.dump(header, header_file, indent=2)
+        self.files = {name: open(os.path.join(self.directory, column_file_name(name)), "wb") for name in names}
+
@@ -0,0 +1,193 @@
+import json
+import logging
+import os
+import re
+from typing import Optional
+
+from tcv.calculation.sink.ResultSink import ResultSink, consume
+from tcv.encoder import SchemaDecoder
+from tcv.encoder.DictEncoder import DictEncoder
+
+logger = logging.getLogger()
+
+# Tap position of a record, as written by json.dumps. The results don't hold a field of that name.
+_TAP_POS = re.compile('"tap_pos"\\s*:\\s*(-?\\d+)[,}\\s]')
+
+
+def _tap_positions(tap_pos) -> Optional[set]:
+    """
+    Normalize the tap position(s) to read into a set
+
+    Parameters:
+        tap_pos (int or iterable): Tap position(s) to read. None reads all records.
+
+    Returns:
+        set: The tap positions or None, if all records shall be read
+    """
+    if tap_pos is None:
+        return None
+    if isinstance(tap_pos, int):
+        return {tap_pos}
+    return set(tap_pos)
+
+
+def _lines(file_path: str):
+    """
+    Read the non-empty lines of a JSON Lines file. A last line without line break is only handed back, if it holds a
+    complete JSON object. Otherwise, e.g. if the sweep has been aborted while writing it, it is skipped with a warning.
+
+    Parameters:
+        file_path (str): Path to the JSON Lines file
+
+    Returns:
+        generator: The lines
+    """
+    with open(file_path, "r") as file_to_read:
+        for line in file_to_read:
+            if not line.strip():
+                continue
+            if not line.endswith("\n"):
+                try:
+                    json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Skipping the incomplete last line of '%s'." % file_path)
+                    return
+            yield line
+
+
+def read_json_lines(file_path: str, tap_pos=None):
+    """
+    Lazily read the records of a JSON Lines file, as written by JsonLinesSink. The result class is derived from the
+    first line and reused for all further lines (cf. SchemaDecoder). An incomplete last line, e.g. due to an aborted
+    sweep, is skipped (cf. _lines). If tap positions are given, the tap position of each line is looked up without
+    parsing it and only the matching lines are decoded.
+
+    Parameters:
+        file_path (str): Path to the JSON Lines file
+        tap_pos (int or iterable): Tap position(s) to read. None reads all records.
+
+    Returns:
+        generator: The decoded records
+    """
+    tap_positions = _tap_positions(tap_pos)
+    result_class = None
+    for line in _lines(file_path):
+        if tap_positions is not None:
+            match = _TAP_POS.search(line)
+            if match is not None and int(match.group(1)) not in tap_positions:
+                continue
+        record = json.loads(line)
+        if tap_positions is not None and record['tap_pos'] not in tap_positions:
+            continue
+        if result_class is None:
+            result_class = SchemaDecoder.result_class_of(record['result'])
+        yield SchemaDecoder.decode_records([record], result_class)[0]
+
+
+def read_results(file_path: str, tap_pos=None):
+    """
+    Lazily read the records of a result file. JSON Lines files ('.jsonl') are streamed (cf. read_json_lines). All
+    other files are treated as one JSON array, as the test benches have been writing so far, and are decoded as a
+    whole (cf. SchemaDecoder.load).
+
+    Parameters:
+        file_path (str): Path to the result file
+        tap_pos (int or iterable): Tap position(s) to read. None reads all records.
+
+    Returns:
+        generator: The decoded records
+    """
+    if file_path.endswith(".jsonl"):
+        yield from read_json_lines(file_path, tap_pos)
+        return
+    tap_positions = _tap_positions(tap_pos)
+    for record in SchemaDecoder.load(file_path):
+        if tap_positions is None or record['tap_pos'] in tap_positions:
+            yield record
+
+
+def write_json_lines(records, file_path: str, flush_every: int = 1000) -> int:
+    """
+    Write the records of a (possibly still running) sweep into a JSON Lines file, e.g. the ones of a test bench's
+    iter_calculate, instead of dumping them as one JSON array
+
+    Parameters:
+        records (iterable): Records of a sweep
+        file_path (str): Path to the JSON Lines file
+        flush_every (int): Amount of records, after which the file is flushed to disk
+
+    Returns:
+        int: Amount of written records
+    """
+    return consume(records, JsonLinesSink(file_path, flush_every))
+
+
+def json_to_json_lines(json_path: str, json_lines_path: str):
+    """
+    Convert a JSON array, as written by the test benches so far, into a JSON Lines file. The entries are copied
+    without decoding their results.
+
+    Parameters:
+        json_path (str): Path to the JSON file
+        json_lines_path (str): Path of the JSON Lines file to write
+    """
+    with open(json_path, "r") as file_to_read:
+        records = json.load(file_to_read)
+    with open(json_lines_path, "w") as file_to_write:
+        for record in records:
+            file_to_write.write(json.dumps(record))
+            file_to_write.write("\n")
+
+
+def json_lines_to_json(json_lines_path: str, json_path: str):
+    """
+    Convert a JSON Lines file into one JSON array, as it has been written by the test benches before. The lines are
+    copied one by one without decoding them. An incomplete last line is skipped (cf. _lines).
+
+    Parameters:
+        json_lines_path (str): Path to the JSON Lines file
+        json_path (str): Path of the JSON file to write
+    """
+    with open(json_path, "w") as file_to_write:
+        file_to_write.write("[")
+        separator = "\n"
+        for line in _lines(json_lines_path):
+            file_to_write.write(separator)
+            file_to_write.write(line.rstrip("\n"))
+            separator = ",\n"
+        file_to_write.write("\n]\n")
+
+
+class JsonLinesSink(ResultSink):
+    """
+    Sink, that writes one JSON object per record and line. The results are encoded with DictEncoder, so that each line
+    looks like an entry of the JSON files, the test benches have been writing so far.
+    """
+
+    def __init__(self, file_path: str, flush_every: int = 1000):
+        """
+        Constructor for the class
+
+        Parameters:
+            file_path (str): Path to the JSON Lines file. Missing directories are created.
+            flush_every (int): Amount of records, after which the file is flushed to disk
+        """
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file_path = file_path
+        self.flush_every = flush_every
+        self.pending = 0
+        self.file = open(file_path, "w")
+
+    def write(self, record: dict):
+        self.file.write(json.dumps(record, cls=DictEncoder))
+        self.file.write("\n")
+        self.pending += 1
+        if self.pending >= self.flush_every:
+            self.file.flush()
+            self.pending = 0
+
+    def shutdown(self):
+        if not self.file.closed:
+            self.file.close()
@@ -0,0 +1,75 @@
+import abc
+import logging
+
+
+def flatten_record(record: dict) -> dict:
+    """
+    Flatten a record of a sweep, i.e. a dictionary with the operating point (e.g. 'tap_pos' and 'p_lv') and the
+    'result' object, into one plain dictionary. The operating point comes first, followed by the result's fields.
+
+    Parameters:
+        record (dict): Record of a sweep
+
+    Returns:
+        dict: Plain mapping from column name to value
+    """
+    row = {key: value for key, value in record.items() if key != 'result'}
+    row.update(vars(record['result']))
+    return row
+
+
+def consume(records, *sinks) -> int:
+    """
+    Hand every record of a (possibly still running) sweep to all given sinks, as soon as it is available. The sinks are
+    shut down afterwards, also if the sweep fails midway. Thereby, everything that has been calculated up to the
+    failure is kept.
+
+    Parameters:
+        records (iterable): Records of a sweep, e.g. as yielded by a test bench's iter_calculate
+        sinks (ResultSink): Sinks to write the records to
+
+    Returns:
+        int: Amount of consumed records
+    """
+    amount = 0
+    try:
+        for record in records:
+            for sink in sinks:
+                sink.write(record)
+            amount += 1
+    finally:
+        for sink in sinks:
+            sink.shutdown()
+    return amount
+
+
+class ResultSink(abc.ABC):
+    """
+    Base class of all consumers, that write the records of a sweep incrementally. Each record is a dictionary with the
+    operating point (e.g. 'tap_pos' and 'p_lv') and the 'result' object. Sinks may be used as context managers, that
+    shut them down on exit.
+    """
+
+    logger = logging.getLogger()
+
+    @abc.abstractmethod
+    def write(self, record: dict):
+        """
+        Write a single record
+
+        Parameters:
+            record (dict): Record of a sweep
+        """
+
+    def shutdown(self):
+        """
+        Write everything, that is still pending, and release all resources
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+        return False
@@ -0,0 +1,121 @@
+"""
+Native reproduction of pandapower's two winding transformer model. All functions operate on whole arrays of tap
+positions at once and yield the two-port admittances in the per unit system of the grid, so that power flows can be
+solved without setting up a pandapower net.
+"""
+
+import numpy as np
+from numpy import ndarray
+
+from tcv.calculation.pandapower.TestGrid import TransformerModel
+
+
+def tap_adjusted_voltages(tap_pos: ndarray, tap_neutral: int, tap_step_percent: float, vn_hv_kv: float,
+                          vn_lv_kv: float, tap_at_hv: bool) -> (ndarray, ndarray):
+    """
+    Adjust the rated voltages of the transformer windings to the tap position. Only the winding with the tap changer
+    is affected.
+
+    :param tap_pos: Tap positions
+    :param tap_neutral: Neutral tap position
+    :param tap_step_percent: Voltage change per tap step in percent
+    :param vn_hv_kv: Rated voltage of the high voltage winding
+    :param vn_lv_kv: Rated voltage of the low voltage winding
+    :param tap_at_hv: True, if the tap changer is installed at the high voltage winding
+    """
+    factor = 1.0 + (np.asarray(tap_pos, dtype=float) - tap_neutral) * tap_step_percent / 100.0
+    if tap_at_hv:
+        return vn_hv_kv * factor, np.full_like(factor, vn_lv_kv)
+    else:
+        return np.full_like(factor, vn_hv_kv), vn_lv_kv * factor
+
+
+def two_port_admittances(vn_trafo_hv_kv: ndarray, vn_trafo_lv_kv: ndarray, vn_hv_kv: float, vn_lv_kv: float,
+                         vn_bus_hv_kv: float, vn_bus_lv_kv: float, sn_mva: float, vk_percent: float,
+                         vkr_percent: float, pfe_kw: float, i0_percent: float, sn_ref_mva: float,
+                         transformer_model: TransformerModel = TransformerModel.PI) -> (
+        ndarray, ndarray, ndarray, ndarray):
+    """
+    Determine the two-port admittances of a transformer in the same way as pandapower does. The impedances are referred
+    to the low voltage side, whereas the off-nominal ratio is applied at the high voltage port. The T model is
+    converted into the equivalent PI model.
+
+    :param vn_trafo_hv_kv: Tap adjusted rated voltage of the high voltage winding
+    :param vn_trafo_lv_kv: Tap adjusted rated voltage of the low voltage winding
+    :param vn_hv_kv: Rated voltage of the high voltage winding
+    :param vn_lv_kv: Rated voltage of the low voltage winding
+    :param vn_bus_hv_kv: Rated voltage of the node at the high voltage port
+    :param vn_bus_lv_kv: Rated voltage of the node at the low voltage port
+    :param sn_mva: Rated apparent power of the transformer
+    :param vk_percent: Short circuit voltage
+    :param vkr_percent: Real part of the short circuit voltage
+    :param pfe_kw: Iron losses
+    :param i0_percent: No load current
+    :param sn_ref_mva: Reference apparent power of the grid
+    :param transformer_model: Equivalent circuit to use
+    :return: The admittances y_ff, y_ft, y_tf, y_tt in p.u.
+    """
+    ratio = (vn_trafo_hv_kv / vn_trafo_lv_kv) / (vn_bus_hv_kv / vn_bus_lv_kv)
+
+    # Short circuit impedance
+    z_scale = np.square(vn_trafo_lv_kv / vn_bus_lv_kv) * sn_ref_mva / sn_mva
+    z_sc = vk_percent / 100.0 * z_scale
+    r_sc = vkr_percent / 100.0 * z_scale
+    x_sc = np.sign(z_sc) * np.sqrt(z_sc ** 2 - r_sc ** 2)
+
+    # Main field admittance
+    pfe_mw = pfe_kw * 1e-3
+    b_mva = -np.sqrt(max((i0_percent / 100.0 * sn_mva) ** 2 - pfe_mw ** 2, 0.0))
+    y_scale = np.square(vn_bus_lv_kv) / sn_ref_mva / vn_lv_kv ** 2 / np.square(vn_trafo_lv_kv / vn_lv_kv)
+    y_m = (pfe_mw + 1j * b_mva) * y_scale
+
+    z_series = r_sc + 1j * x_sc
+    y_m = y_m * np.ones_like(z_series)
+    y_shunt_from = y_m / 2
+    y_shunt_to = y_m / 2
+    if transformer_model == TransformerModel.T and np.any(y_m != 0):
+        # Star-delta conversion with the leakage impedance split in halves
+        z_a = z_series / 2
+        z_b = z_series / 2
+        z_c = 1 / y_m
+        z_sum = z_a * z_b + z_a * z_c + z_b * z_c
+        z_series = z_sum / z_c
+        y_shunt_from = z_b / z_sum
+        y_shunt_to = z_a / z_sum
+
+    y_series = 1 / z_series
+    y_ff = (y_series + y_shunt_from) / ratio ** 2
+    y_ft = -y_series / ratio
+    y_tf = -y_series / ratio
+    y_tt = y_series + y_shunt_to
+    return y_ff, y_ft, y_tf, y_tt
+
+
+def star_equivalent_short_circuit_voltages(vk_percent: tuple, vkr_percent: tuple, sn_mva: tuple) -> (
+        ndarray, ndarray):
+    """
+    Convert the short circuit voltages of a three winding transformer into the ones of the three equivalent two
+    winding transformers between each port and the star point in the same way as pandapower does. The short circuit
+    voltages are given for the pairs hv-mv, mv-lv and hv-lv, whereas the result refers to the branches hv, mv and lv,
+    each related to the rated apparent power of it's port.
+
+    :param vk_percent: Short circuit voltages of the pairs hv-mv, mv-lv and hv-lv
+    :param vkr_percent: Real parts of the short circuit voltages of the pairs hv-mv, mv-lv and hv-lv
+    :param sn_mva: Rated apparent power of the ports hv, mv and lv
+    :return: The short circuit voltages and their real parts of the star branches hv, mv and lv
+    """
+    sn = np.asarray(sn_mva, dtype=float)
+    pair_sn = np.array([min(sn[0], sn[1]), min(sn[1], sn[2]), min(sn[0], sn[2])])
+
+    # Refer the pairwise values to the rated apparent power of the high voltage port
+    vk_delta = sn[0] * np.asarray(vk_percent, dtype=float) / pair_sn
+    vkr_delta = sn[0] * np.asarray(vkr_percent, dtype=float) / pair_sn
+    vki_delta = np.sqrt(vk_delta ** 2 - vkr_delta ** 2)
+
+    def delta_to_star(z_delta: ndarray) -> ndarray:
+        return .5 * sn / sn[0] * np.array([z_delta[0] + z_delta[2] - z_delta[1], z_delta[1] + z_delta[0] - z_delta[2],
+                                          z_delta[2] + z_delta[1] - z_delta[0]])
+
+    vkr_star = delta_to_star(vkr_delta)
+    vki_star = delta_to_star(vki_delta)
+    return np.sign(vki_star) * np.sqrt(vki_star ** 2 + vkr_star ** 2), vkr_star
@@ -0,0 +1,350 @@
+import numpy as np
+import pandapower as pp
+from numpy import ndarray
+
+from tcv.calculation import TestHelper
+from tcv.calculation.pandapower.TestBench import TestBench, calc_current_angles
+from tcv.calculation.pandapower.TestGrid import TransformerModel, THREE_WINDING_TRANSFORMER, \
+    test_grid_three_winding, set_operating_point_three_winding
+from tcv.calculation.result.GridResultThreeWinding import GridResultThreeWinding
+from tcv.calculation.vectorized.BranchAdmittance import tap_adjusted_voltages, two_port_admittances, \
+    star_equivalent_short_circuit_voltages
+from tcv.exception.CrossCheckException import CrossCheckException
+
+# Node indices of the star equivalent. The slack node is the high voltage node.
+HV, MV, LV, STAR = 0, 1, 2, 3
+PQ_NODES = [MV, LV, STAR]
+
+
+def branch_admittances(tap_pos: ndarray, s_ref_mva: float = 300.0, with_main_field_losses: bool = False,
+                       tap_at_star_point: bool = False,
+                       transformer_model: TransformerModel = TransformerModel.T) -> dict:
+    """
+    Build the two-port admittances of the three star branches hv (high voltage node to star point), mv and lv (star
+    point to medium and low voltage node) in the same way as pandapower converts the three winding transformer. The
+    star point's nominal voltage equals the one of the high voltage node. The main field losses are assigned to the
+    high voltage branch.
+
+    Parameters:
+        tap_pos (ndarray): Tap positions to build the admittances for
+        s_ref_mva (float): Reference apparent power of the calculation
+        with_main_field_losses (bool): True, if the main field losses may be considered
+        tap_at_star_point (bool): True, if the tap changer is located at the transformers star point
+        transformer_model (TransformerModel): Type of model to use for the star branches
+
+    Returns:
+        dict: Mapping from branch ('hv', 'mv', 'lv') to the admittances y_ff, y_ft, y_tf, y_tt in p.u. Only the high
+        voltage branch depends on the tap position.
+    """
+    trafo = THREE_WINDING_TRANSFORMER
+    sn_mva = (trafo['sn_hv_mva'], trafo['sn_mv_mva'], trafo['sn_lv_mva'])
+    vk_percent, vkr_percent = star_equivalent_short_circuit_voltages(
+        (trafo['vk_hv_percent'], trafo['vk_mv_percent'], trafo['vk_lv_percent']),
+        (trafo['vkr_hv_percent'], trafo['vkr_mv_percent'], trafo['vkr_lv_percent']), sn_mva)
+    pfe_kw = trafo['pfe_kw'] if with_main_field_losses else 0.0
+    i0_percent = trafo['i0_percent'] if with_main_field_losses else 0.0
+
+    # The high voltage branch carries the tap changer. At the star point, it is moved to the branch's star point side
+    # with inverted effect.
+    vn_star_kv = trafo['vn_hv_kv']
+    tap_pos = np.asarray(tap_pos, dtype=float)
+    if tap_at_star_point:
+        factor = 1.0 + (tap_pos - trafo['tap_neutral']) * trafo['tap_step_percent'] / 100.0
+        vn_trafo_hv_kv, vn_trafo_lv_kv = np.full_like(tap_pos, vn_star_kv), vn_star_kv / factor
+    else:
+        vn_trafo_hv_kv, vn_trafo_lv_kv = tap_adjusted_voltages(tap_pos, trafo['tap_neutral'],
+                                                               trafo['tap_step_percent'], vn_star_kv, vn_star_kv,
+                                                               True)
+    branches = {'hv': two_port_admittances(vn_trafo_hv_kv, vn_trafo_lv_kv, vn_star_kv, vn_star_kv, vn_star_kv,
+                                           vn_star_kv, sn_mva[0], vk_percent[0], vkr_percent[0], pfe_kw, i0_percent,
+                                           s_ref_mva, transformer_model)}
+    for idx, port in [(1, 'mv'), (2, 'lv')]:
+        vn_port_kv = trafo['vn_%s_kv' % port]
+        branches[port] = two_port_admittances(np.array([vn_star_kv]), np.array([vn_port_kv]), vn_star_kv, vn_port_kv,
+                                              vn_star_kv, vn_port_kv, sn_mva[idx], vk_percent[idx], vkr_percent[idx],
+                                              0.0, 0.0, s_ref_mva, transformer_model)
+    return branches
+
+
+def admittance_matrices(branches: dict) -> ndarray:
+    """
+    Assemble the nodal admittance matrices of the star equivalent from the branch admittances
+
+    Parameters:
+        branches (dict): Branch admittances as given by branch_admittances
+
+    Returns:
+        ndarray: Admittance matrices with one 4x4 matrix per tap position
+    """
+    y_hv_ff, y_hv_ft, y_hv_tf, y_hv_tt = branches['hv']
+    y_bus = np.zeros((len(y_hv_ff), 4, 4), dtype=complex)
+    y_bus[:, HV, HV] += y_hv_ff
+    y_bus[:, HV, STAR] += y_hv_ft
+    y_bus[:, STAR, HV] += y_hv_tf
+    y_bus[:, STAR, STAR] += y_hv_tt
+    for node, port in [(MV, 'mv'), (LV, 'lv')]:
+        y_ff, y_ft, y_tf, y_tt = branches[port]
+        y_bus[:, STAR, STAR] += y_ff
+        y_bus[:, STAR, node] += y_ft
+        y_bus[:, node, STAR] += y_tf
+        y_bus[:, node, node] += y_tt
+    return y_bus
+
+
+def _mismatch(y_bus: ndarray, v: ndarray, s_spec: ndarray) -> ndarray:
+    """
+    Power mismatch at the PQ nodes, stacked as real and imaginary parts
+
+    Parameters:
+        y_bus (ndarray): Admittance matrices (batch x 4 x 4)
+        v (ndarray): Complex nodal voltages (batch x 4)
+        s_spec (ndarray): Specified nodal power injections (batch x 4)
+
+    Returns:
+        ndarray: Mismatch (batch x 6)
+    """
+    mismatch = (v * np.conj(np.einsum('bij,bj->bi', y_bus, v)) - s_spec)[:, PQ_NODES]
+    return np.concatenate([mismatch.real, mismatch.imag], axis=1)
+
+
+def _jacobian(y_bus: ndarray, v: ndarray) -> ndarray:
+    """
+    Jacobian of the nodal power with regard to the voltage angles and magnitudes of the PQ nodes
+
+    Parameters:
+        y_bus (ndarray): Admittance matrices (batch x 4 x 4)
+        v (ndarray): Complex nodal voltages (batch x 4)
+
+    Returns:
+        ndarray: Jacobian matrices (batch x 6 x 6)
+    """
+    i = np.einsum('bij,bj->bi', y_bus, v)
+    v_norm = v / np.abs(v)
+    diag_i = np.einsum('bi,ij->bij', i, np.eye(4))
+    ds_dva = 1j * v[:, :, None] * np.conj(diag_i - y_bus * v[:, None, :])
+    ds_dvm = v[:, :, None] * np.conj(y_bus * v_norm[:, None, :]) + np.einsum('bi,ij->bij', np.conj(i) * v_norm,
+                                                                             np.eye(4))
+    ds_dva = ds_dva[:, PQ_NODES][:, :, PQ_NODES]
+    ds_dvm = ds_dvm[:, PQ_NODES][:, :, PQ_NODES]
+    return np.concatenate([np.concatenate([ds_dva.real, ds_dvm.real], axis=2),
+                           np.concatenate([ds_dva.imag, ds_dvm.imag], axis=2)], axis=1)
+
+
+def newton_raphson(y_bus: ndarray, s_spec: ndarray, tolerance_pu: float = 1e-10, max_iteration: int = 10) -> (
+        ndarray, ndarray):
+    """
+    Solve the power flow of a batch of star equivalents with the Newton-Raphson method in polar coordinates. All
+    operating points are iterated jointly, but every operating point is excluded from further updates, as soon as it
+    has converged.
+
+    Parameters:
+        y_bus (ndarray): Admittance matrices (batch x 4 x 4)
+        s_spec (ndarray): Specified nodal power injections in p.u. (batch x 4)
+        tolerance_pu (float): Permissible power mismatch in p.u.
+        max_iteration (int): Maximum amount of iterations
+
+    Returns:
+        tuple: Complex nodal voltages (batch x 4) and the amount of iterations per operating point
+    """
+    v = np.ones(s_spec.shape, dtype=complex)
+    iterations = np.zeros(len(s_spec), dtype=int)
+    active = np.arange(len(s_spec))
+    for iteration in range(max_iteration + 1):
+        mismatch = _mismatch(y_bus[active], v[active], s_spec[active])
+        not_converged = np.max(np.abs(mismatch), axis=1) >= tolerance_pu
+        active, mismatch = active[not_converged], mismatch[not_converged]
+        if len(active) == 0:
+            return v, iterations
+        if iteration == max_iteration:
+            break
+
+        dx = np.linalg.solve(_jacobian(y_bus[active], v[active]), -mismatch[:, :, None])[:, :, 0]
+        va = np.angle(v[active][:, PQ_NODES]) + dx[:, :3]
+        vm = np.abs(v[active][:, PQ_NODES]) + dx[:, 3:]
+        v_active = v[active]
+        v_active[:, PQ_NODES] = vm * np.exp(1j * va)
+        v[active] = v_active
+        iterations[active] += 1
+    raise pp.LoadflowNotConverged(
+        "Newton-Raphson did not converge within %i iterations for %i operating points" % (max_iteration, len(active)))
+
+
+class NumpyThreeWindingEngine(TestBench):
+    """
+    Drop-in replacement for the pandapower based ThreeWindingTestBench, that solves the power flows of all operating
+    points as one batch of star equivalents with a jointly iterated Newton-Raphson method.
+    """
+    GRID_PARAMETERS = THREE_WINDING_TRANSFORMER
+
+    def __init__(self, setup_logging: bool = True):
+        super().__init__(setup_logging)
+
+    def calculate(self, tap_min: int = -10, tap_max: int = 10, s_nom_hv_mva: float = 300.0, s_nom_mv_mva: float = 300.0,
+                  s_nom_lv_mva: float = 100.0, p_step: int = 11, v_ref_kv: float = 380.0,
+                  s_ref_mva: float = 300.0, with_main_field_losses: bool = False, tap_at_star_point: bool = False,
+                  transformer_model: TransformerModel = TransformerModel.T, cross_check_samples: int = 5,
+                  cross_check_tolerance_pu: float = 1e-9) -> list:
+        """
+        Sweeps the same operating points as ThreeWindingTestBench.calculate and gives back the results in the same
+        form. Cf. calculate_columns for the parameters.
+        """
+        columns = self.calculate_columns(tap_min=tap_min, tap_max=tap_max, s_nom_hv_mva=s_nom_hv_mva,
+                                         s_nom_mv_mva=s_nom_mv_mva, s_nom_lv_mva=s_nom_lv_mva, p_step=p_step,
+                                         v_ref_kv=v_ref_kv, s_ref_mva=s_ref_mva,
+                                         with_main_field_losses=with_main_field_losses,
+                                         tap_at_star_point=tap_at_star_point, transformer_model=transformer_model,
+                                         cross_check_samples=cross_check_samples,
+                                         cross_check_tolerance_pu=cross_check_tolerance_pu)
+        return [{'tap_pos': int(columns['tap_pos'][idx]), 'p_mv': columns['p_mv'][idx].item(),
+                 'p_lv': columns['p_lv'][idx].item(),
+                 'result': GridResultThreeWinding(**{field: float(columns[field][idx]) for field in
+                                                     GridResultThreeWinding.FIELDS})} for idx in
+                range(len(columns['tap_pos']))]
+
+    def calculate_columns(self, tap_min: int = -10, tap_max: int = 10, s_nom_hv_mva: float = 300.0,
+                          s_nom_mv_mva: float = 300.0, s_nom_lv_mva: float = 100.0, p_step: int = 11,
+                          v_ref_kv: float = 380.0, s_ref_mva: float = 300.0, with_main_field_losses: bool = False,
+                          tap_at_star_point: bool = False, transformer_model: TransformerModel = TransformerModel.T,
+                          cross_check_samples: int = 5, cross_check_tolerance_pu: float = 1e-9) -> dict:
+        """
+        Sweep the operating points of the three winding test bench and give back the results column wise. Afterwards,
+        some of the operating points are cross-checked against pandapower.
+
+        Parameters:
+            tap_min (int): Minimum tap position of the transformer
+            tap_max (int): Maximum tap position of the transformer
+            s_nom_hv_mva (float): Nominal apparent power at the high voltage node
+            s_nom_mv_mva (float): Nominal apparent power at the medium voltage node
+            s_nom_lv_mva (float): Nominal apparent power at the low voltage node
+            p_step (float): Amount of ticks along each active power axis
+            v_ref_kv (float): Reference voltage of the calculation
+            s_ref_mva (float): Reference apparent power of the calculation
+            with_main_field_losses (bool): True, if the main field losses may be considered
+            tap_at_star_point (bool): True, if the tap changer is located at the transformers star point
+            transformer_model (TransformerModel): Type of model to use for the star branches
+            cross_check_samples (int): Amount of operating points to cross-check against pandapower
+            cross_check_tolerance_pu (float): Permissible deviation of the nodal voltages in p.u.
+
+        Returns:
+            dict: Mapping from 'tap_pos', 'p_mv', 'p_lv' and the field names of GridResultThreeWinding to arrays with
+            one entry per operating point
+        """
+        tap_range: range = range(tap_min, tap_max + 1)
+        p_mv_range_mw = [round(p_pu * s_nom_mv_mva) for p_pu in np.linspace(-1.0, 1.0, p_step)]  # Power range @ mv port
+        p_step_lv_mw = 2 * s_nom_lv_mva / (p_step - 1)  # Bin width at the lv side
+        self.logger.info(
+            ("Starting to calculate grid with NumPy. Parameters: tap = %i...%i, reference = %.2f MVA @ %.2f kV, " %
+             (tap_min, tap_max, s_ref_mva, v_ref_kv)) + "tap changer is" + (
+                " " if tap_at_star_point else " not ") + "at star point")
+        operating_points = TestHelper.operating_points_three_winding(tap_range, p_mv_range_mw, s_nom_hv_mva,
+                                                                     s_nom_lv_mva, p_step_lv_mw)
+        tap_pos = np.array([tap for tap, _, _ in operating_points], dtype=int)
+        p_mv_mw = np.array([p_mv for _, p_mv, _ in operating_points])
+        p_lv_mw = np.array([p_lv for _, _, p_lv in operating_points])
+
+        columns, iterations = self.solve(tap_pos, p_mv_mw, p_lv_mw, s_ref_mva, with_main_field_losses,
+                                         tap_at_star_point, transformer_model)
+        self.iterations = iterations.tolist()
+        self.logger.info("Performed %i power flow calculations with %i Newton-Raphson iterations in total." % (
+            len(tap_pos), sum(self.iterations)))
+
+        if cross_check_samples > 0:
+            deviation = self.cross_check(tap_pos, p_mv_mw, p_lv_mw, columns, s_ref_mva, with_main_field_losses,
+                                         tap_at_star_point, transformer_model, cross_check_samples)
+            self.logger.info("Cross-check against pandapower revealed a maximum deviation of %.3e p.u." % deviation)
+            if deviation > cross_check_tolerance_pu:
+                raise CrossCheckException(
+                    "Deviation of %.3e p.u. to pandapower exceeds the tolerance of %.3e p.u." % (
+                        deviation, cross_check_tolerance_pu))
+
+        return dict(tap_pos=tap_pos, p_mv=p_mv_mw, p_lv=p_lv_mw, **columns)
+
+    @staticmethod
+    def solve(tap_pos: ndarray, p_mv_mw: ndarray, p_lv_mw: ndarray, s_ref_mva: float = 300.0,
+              with_main_field_losses: bool = False, tap_at_star_point: bool = False,
+              transformer_model: TransformerModel = TransformerModel.T) -> (dict, ndarray):
+        """
+        Solve the power flow for a batch of operating points at once. The admittance matrices are only built once per
+        distinct tap position.
+
+        Parameters:
+            tap_pos (ndarray): Tap position per operating point
+            p_mv_mw (ndarray): Active power consumption at the medium voltage node per operating point
+            p_lv_mw (ndarray): Active power consumption at the low voltage node per operating point
+            s_ref_mva (float): Reference apparent power of the calculation
+            with_main_field_losses (bool): True, if the main field losses may be considered
+            tap_at_star_point (bool): True, if the tap changer is located at the transformers star point
+            transformer_model (TransformerModel): Type of model to use for the star branches
+
+        Returns:
+            tuple: Mapping from field name of GridResultThreeWinding to an array with one entry per operating point as
+            well as the Newton-Raphson iterations per operating point
+        """
+        distinct_taps, tap_index = np.unique(tap_pos, return_inverse=True)
+        branches = branch_admittances(distinct_taps, s_ref_mva, with_main_field_losses, tap_at_star_point,
+                                      transformer_model)
+        y_bus = admittance_matrices(branches)[tap_index]
+
+        s_spec = np.zeros((len(tap_index), 4), dtype=complex)
+        s_spec[:, MV] = -np.asarray(p_mv_mw, dtype=float) / s_ref_mva
+        s_spec[:, LV] = -np.asarray(p_lv_mw, dtype=float) / s_ref_mva
+        v, iterations = newton_raphson(y_bus, s_spec)
+
+        # Port powers (flowing into the transformer) and currents
+        y_hv_ff, y_hv_ft, _, _ = (y[tap_index] for y in branches['hv'])
+        s_mva = {'hv': v[:, HV] * np.conj(y_hv_ff * v[:, HV] + y_hv_ft * v[:, STAR]) * s_ref_mva}
+        for node, port in [(MV, 'mv'), (LV, 'lv')]:
+            _, _, y_tf, y_tt = branches[port]
+            s_mva[port] = v[:, node] * np.conj(y_tf * v[:, STAR] + y_tt * v[:, node]) * s_ref_mva
+
+        columns = {}
+        v_ang_degree = {'hv': np.zeros(len(v))}
+        for node, port in [(MV, 'mv'), (LV, 'lv')]:
+            v_ang_degree[port] = np.degrees(np.angle(v[:, node]))
+            columns['v_%s_pu' % port] = np.abs(v[:, node])
+            columns['v_ang_%s_degree' % port] = v_ang_degree[port]
+        for node, port in [(HV, 'hv'), (MV, 'mv'), (LV, 'lv')]:
+            p_kw, q_kvar = np.real(s_mva[port]) * 1000.0, np.imag(s_mva[port]) * 1000.0
+            vn_kv = THREE_WINDING_TRANSFORMER['vn_%s_kv' % port]
+            columns['p_%s_kw' % port] = p_kw
+            columns['q_%s_kvar' % port] = q_kvar
+            columns['s_%s_kva' % port] = np.sqrt(p_kw ** 2 + q_kvar ** 2)
+            columns['i_mag_%s_a' % port] = np.abs(s_mva[port]) / (np.abs(v[:, node]) * vn_kv * np.sqrt(3)) * 1000.0
+            columns['i_ang_%s_degree' % port] = calc_current_angles(p_kw, q_kvar, v_ang_degree[port])
+        return columns, iterations
+
+    @staticmethod
+    def cross_check(tap_pos: ndarray, p_mv_mw: ndarray, p_lv_mw: ndarray, columns: dict, s_ref_mva: float = 300.0,
+                    with_main_field_losses: bool = False, tap_at_star_point: bool = False,
+                    transformer_model: TransformerModel = TransformerModel.T, samples: int = 5) -> float:
+        """
+        Recalculate evenly distributed operating points with pandapower and compare the complex nodal voltages at the
+        medium and low voltage node.
+
+        Parameters:
+            tap_pos (ndarray): Tap position per operating point
+            p_mv_mw (ndarray): Active power consumption at the medium voltage node per operating point
+            p_lv_mw (ndarray): Active power consumption at the low voltage node per operating point
+            columns (dict): Results of the vectorized solution (cf. solve)
+            s_ref_mva (float): Reference apparent power of the calculation
+            with_main_field_losses (bool): True, if the main field losses may be considered
+            tap_at_star_point (bool): True, if the tap changer is located at the transformers star point
+            transformer_model (TransformerModel): Type of model to use for the star branches
+            samples (int): Amount of operating points to cross-check
+
+        Returns:
+            float: Maximum absolute deviation of the complex nodal voltages in p.u.
+        """
+        net = test_grid_three_winding(sn_mva=s_ref_mva, with_main_field_losses=with_main_field_losses,
+                                      tap_at_star_point=tap_at_star_point)
+        deviation = 0.0
+        for idx in np.unique(np.linspace(0, len(tap_pos) - 1, samples).astype(int)):
+            set_operating_point_three_winding(net, tap_pos=int(tap_pos[idx]), p_mv_mw=float(p_mv_mw[idx]),
+                                              p_lv_mw=float(p_lv_mw[idx]))
+            pp.runpp(net, trafo_model=transformer_model.value, tolerance_mva=1e-12)
+            for node, port in [(MV, 'mv'), (LV, 'lv')]:
+                v_expected = net.res_bus.vm_pu[node] * np.exp(1j * np.radians(net.res_bus.va_degree[node]))
+                v_actual = columns['v_%s_pu' % port][idx] * np.exp(
+                    1j * np.radians(columns['v_ang_%s_degree' % port][idx]))
+                deviation = max(deviation, abs(v_actual - v_expected))
+        return deviation
@@ -0,0 +1,161 @@
+import numpy as np
+import pandapower as pp
+from numpy import ndarray
+
+from tcv.calculation import TestHelper
+from tcv.calculation.pandapower.TestBench import TestBench, calc_current_angles
+from tcv.calculation.pandapower.TestGrid import TapSide, TransformerModel, TWO_WINDING_TRANSFORMER, \
+    test_grid_two_winding, set_operating_point_two_winding
+from tcv.calculation.result.GridResultTwoWinding import GridResultTwoWinding
+from tcv.calculation.vectorized.BranchAdmittance import tap_adjusted_voltages, two_port_admittances
+from tcv.exception.CrossCheckException import CrossCheckException
+
+
+class NumpyTwoWindingEngine(TestBench):
+    """
+    Drop-in replacement for the pandapower based TwoWindingTestBench, that solves the power flow of all operating
+    points at once. The test grid only consists of the slack node, the transformer and a node with a pure active power
+    load, which allows for a closed form solution of the power flow problem with NumPy's complex arithmetic.
+    """
+    GRID_PARAMETERS = TWO_WINDING_TRANSFORMER
+
+    def __init__(self, setup_logging: bool = True):
+        super().__init__(setup_logging)
+
+    def calculate(self, tap_min=-10, tap_max=10, p_min=-1.0, p_max=1.0, s_nom_mva: float = 0.63, p_step: int = 21,
+                  v_ref_kv=0.4, s_ref_mva=0.4, tap_side=TapSide.LV, transformer_model=TransformerModel.PI,
+                  cross_check_samples: int = 5, cross_check_tolerance_pu: float = 1e-9) -> list:
+        """
+        Sweeps the same operating points as TwoWindingTestBench.calculate and gives back the results in the same form.
+        Afterwards, some of the operating points are cross-checked against pandapower.
+
+        Parameters:
+            tap_min (int): Minimum permissible tap position
+            tap_max (int): Maximum permissible tap position
+            p_min (float): Minimum permissible active power (negative = infeed) in p.u.
+            p_max (float): Maximum permissible active power (negative = infeed) in p.u.
+            s_nom_mva (float): Nominal power of the load in MW
+            p_step (float): Amount of ticks along active power axis
+            v_ref_kv (float): Nominal voltage of the reference system in kV
+            s_ref_mva (float): Nominal apparent power of the reference system in MVA
+            tap_side (TapSide): Position of the tap changer
+            transformer_model (TapModel): Type of model to use for calculation
+            cross_check_samples (int): Amount of operating points to cross-check against pandapower
+            cross_check_tolerance_pu (float): Permissible deviation of the nodal voltage in p.u.
+        """
+        self.logger.info(
+            "Starting to calculate grid with NumPy. Parameters: tap = %i...%i, p = (%.2f...%.2f)*%.2f MW, "
+            "reference = %.2f MVA @ %.2f kV, tap side = %s" %
+            (tap_min, tap_max, p_min, p_max, s_nom_mva, s_ref_mva, v_ref_kv, tap_side))
+        tap_range = range(tap_min, tap_max + 1)
+        p_range = [round(p_pu * s_nom_mva * 1000) / 1000 for p_pu in np.linspace(-1.0, 1.0, p_step)]
+        operating_points = TestHelper.operating_points_two_winding(tap_range, p_range)
+        tap_pos = np.array([tap for tap, _ in operating_points], dtype=int)
+        p_mw = np.array([p for _, p in operating_points], dtype=float)
+
+        columns = self.solve(tap_pos, p_mw, s_ref_mva, tap_side, transformer_model)
+
+        if cross_check_samples > 0:
+            deviation = self.cross_check(tap_pos, p_mw, columns, s_ref_mva, tap_side, transformer_model,
+                                         cross_check_samples)
+            self.logger.info("Cross-check against pandapower revealed a maximum deviation of %.3e p.u." % deviation)
+            if deviation > cross_check_tolerance_pu:
+                raise CrossCheckException(
+                    "Deviation of %.3e p.u. to pandapower exceeds the tolerance of %.3e p.u." % (
+                        deviation, cross_check_tolerance_pu))
+
+        return [{'tap_pos': int(tap_pos[idx]), 'p_lv': operating_points[idx][1],
+                 'result': GridResultTwoWinding(**{field: float(columns[field][idx]) for field in
+                                                   GridResultTwoWinding.FIELDS})} for idx in
+                range(len(operating_points))]
+
+    @staticmethod
+    def solve(tap_pos: ndarray, p_mw: ndarray, s_ref_mva: float = 0.4, tap_side: TapSide = TapSide.LV,
+              transformer_model: TransformerModel = TransformerModel.PI) -> dict:
+        """
+        Solve the power flow for a batch of operating points at once. With the slack node voltage being fixed at
+        1 p.u., the power balance at the load node can be reformulated as a quadratic equation in the squared voltage
+        magnitude. Its larger root is the stable, high voltage solution, that Newton-Raphson converges to.
+
+        Parameters:
+            tap_pos (ndarray): Tap position per operating point
+            p_mw (ndarray): Active power consumption of the load per operating point
+            s_ref_mva (float): Nominal apparent power of the reference system in MVA
+            tap_side (TapSide): Position of the tap changer
+            transformer_model (TransformerModel): Type of model to use for calculation
+
+        Returns:
+            dict: Mapping from field name of GridResultTwoWinding to an array with one entry per operating point
+        """
+        trafo = TWO_WINDING_TRANSFORMER
+        vn_trafo_hv_kv, vn_trafo_lv_kv = tap_adjusted_voltages(tap_pos, trafo['tap_neutral'],
+                                                               trafo['tap_step_percent'], trafo['vn_hv_kv'],
+                                                               trafo['vn_lv_kv'], tap_side == TapSide.HV)
+        y_ff, y_ft, y_tf, y_tt = two_port_admittances(vn_trafo_hv_kv, vn_trafo_lv_kv, trafo['vn_hv_kv'],
+                                                      trafo['vn_lv_kv'], trafo['vn_hv_kv'], trafo['vn_lv_kv'],
+                                                      trafo['sn_mva'], trafo['vk_percent'], trafo['vkr_percent'],
+                                                      trafo['pfe_kw'], trafo['i0_percent'], s_ref_mva,
+                                                      transformer_model)
+
+        # Power balance at the load node: conj(s) = conj(v) * (y_tf * v_slack + y_tt * v) with v_slack = 1
+        s_conj = -np.asarray(p_mw, dtype=float) / s_ref_mva + 0j
+        b = np.square(np.abs(y_tf)) + 2 * np.real(s_conj * np.conj(y_tt))
+        a = np.square(np.abs(y_tt))
+        v_squared = (b + np.sqrt(b ** 2 - 4 * a * np.square(np.abs(s_conj)))) / (2 * a)
+        v_lv = np.conj((s_conj - y_tt * v_squared) / y_tf)
+        v_hv = np.ones_like(v_lv)
+
+        # Port powers and currents
+        s_hv_mva = v_hv * np.conj(y_ff * v_hv + y_ft * v_lv) * s_ref_mva
+        s_lv_mva = v_lv * np.conj(y_tf * v_hv + y_tt * v_lv) * s_ref_mva
+        vn_hv_kv, vn_lv_kv = trafo['vn_hv_kv'], trafo['vn_lv_kv']
+        i_hv_ka = np.abs(s_hv_mva) / (np.abs(v_hv) * vn_hv_kv * np.sqrt(3))
+        i_lv_ka = np.abs(s_lv_mva) / (np.abs(v_lv) * vn_lv_kv * np.sqrt(3))
+
+        v_ang_lv_degree = np.degrees(np.angle(v_lv))
+        p_hv_kw, q_hv_kvar = np.real(s_hv_mva) * 1000.0, np.imag(s_hv_mva) * 1000.0
+        p_lv_kw, q_lv_kvar = np.real(s_lv_mva) * 1000.0, np.imag(s_lv_mva) * 1000.0
+        return {
+            'v_lv_pu': np.abs(v_lv),
+            'v_ang_lv_degree': v_ang_lv_degree,
+            'p_hv_kw': p_hv_kw,
+            'q_hv_kvar': q_hv_kvar,
+            's_hv_kva': np.sqrt(p_hv_kw ** 2 + q_hv_kvar ** 2),
+            'i_mag_hv_a': i_hv_ka * 1000.0,
+            'i_ang_hv_degree': calc_current_angles(p_hv_kw, q_hv_kvar, 0.0),
+            'p_lv_kw': p_lv_kw,
+            'q_lv_kvar': q_lv_kvar,
+            's_lv_kva': np.sqrt(p_lv_kw ** 2 + q_lv_kvar ** 2),
+            'i_mag_lv_a': i_lv_ka * 1000.0,
+            'i_ang_lv_degree': calc_current_angles(p_lv_kw, q_lv_kvar, v_ang_lv_degree)
+        }
+
+    @staticmethod
+    def cross_check(tap_pos: ndarray, p_mw: ndarray, columns: dict, s_ref_mva: float = 0.4,
+                    tap_side: TapSide = TapSide.LV, transformer_model: TransformerModel = TransformerModel.PI,
+                    samples: int = 5) -> float:
+        """
+        Recalculate evenly distributed operating points with pandapower and compare the complex nodal voltage at the
+        low voltage node.
+
+        Parameters:
+            tap_pos (ndarray): Tap position per operating point
+            p_mw (ndarray): Active power consumption of the load per operating point
+            columns (dict): Results of the vectorized solution (cf. solve)
+            s_ref_mva (float): Nominal apparent power of the reference system in MVA
+            tap_side (TapSide): Position of the tap changer
+            transformer_model (TransformerModel): Type of model to use for calculation
+            samples (int): Amount of operating points to cross-check
+
+        Returns:
+            float: Maximum absolute deviation of the complex nodal voltage in p.u.
+        """
+        net = test_grid_two_winding(sn_mva=s_ref_mva, tap_side=tap_side)
+        deviation = 0.0
+        for idx in np.unique(np.linspace(0, len(tap_pos) - 1, samples).astype(int)):
+            set_operating_point_two_winding(net, tap_pos=int(tap_pos[idx]), p_mw=float(p_mw[idx]))
+            pp.runpp(net, trafo_model=transformer_model.value, tolerance_mva=1e-12)
+            v_expected = net.res_bus.vm_pu[1] * np.exp(1j * np.radians(net.res_bus.va_degree[1]))
+            v_actual = columns['v_lv_pu'][idx] * np.exp(1j * np.radians(columns['v_ang_lv_degree'][idx]))
+            deviation = max(deviation, abs(v_actual - v_expected))
+        return deviation
@@ -0,0 +1,102 @@
+import json
+from operator import itemgetter
+
+from tcv.calculation.result.GridResultTable import GridResultTableThreeWinding, GridResultTableTwoWinding
+from tcv.calculation.result.GridResultThreeWinding import GridResultThreeWinding
+from tcv.calculation.result.GridResultTwoWinding import GridResultTwoWinding
+
+# The three winding results hold all fields of the two winding results. Hence, they have to be probed first.
+RESULT_CLASSES = (GridResultThreeWinding, GridResultTwoWinding)
+TABLE_CLASSES = {
+    GridResultThreeWinding: GridResultTableThreeWinding,
+    GridResultTwoWinding: GridResultTableTwoWinding
+}
+
+
+def result_class_of(dct: dict) -> type:
+    """
+    Determine the class of a result from it's fields, the same way CustomDecoder does
+
+    :param dct: The result as plain dictionary
+    :return: The result class or None, if the dictionary isn't a result
+    """
+    return next((result_class for result_class in RESULT_CLASSES if
+                 all(field in dct for field in result_class.FIELDS)), None)
+
+
+def decode_records(records: list, result_class: type = None) -> list:
+    """
+    Turn the plain results of records into result objects. The schema is only determined once from the first
+    record. All further records have to follow it.
+
+    :param records: Dictionaries with the operating point and the 'result' as plain dictionary. They are altered in
+        place.
+    :param result_class: Class of the results. If not given, it's derived from the first record.
+    :return: The records with result objects
+    """
+    if len(records) == 0:
+        return records
+    if result_class is None:
+        result_class = result_class_of(records[0]['result'])
+        if result_class is None:
+            raise ValueError("The records don't hold two or three winding results.")
+    values_of = itemgetter(*result_class.FIELDS)
+    try:
+        for record in records:
+            # The constructor's arguments follow the order of the fields
+            record['result'] = result_class(*values_of(record['result']))
+    except (KeyError, TypeError) as error:
+        raise ValueError("A record doesn't follow the schema of %s: %s" % (result_class.__name__, error))
+    return records
+
+
+def decode_columns(records: list, result_class: type = None):
+    """
+    Turn the plain records into a columnar table without building any result object
+
+    :param records: Dictionaries with the operating point and the 'result' as plain dictionary
+    :param result_class: Class of the results. If not given, it's derived from the first record.
+    :return: The GridResultTable
+    """
+    if result_class is None:
+        result_class = result_class_of(records[0]['result']) if len(records) > 0 else GridResultTwoWinding
+        if result_class is None:
+            raise ValueError("The records don't hold two or three winding results.")
+    table_class = TABLE_CLASSES[result_class]
+    try:
+        columns = {name: [record[name] for record in records] for name in table_class.KEY_NAMES}
+        columns.update({field: [record['result'][field] for record in records] for field in result_class.FIELDS})
+    except KeyError as error:
+        raise ValueError("A record doesn't follow the schema of %s: %s" % (result_class.__name__, error))
+    return table_class(columns)
+
+
+def loads(json_string: str, result_class: type = None, columnar: bool = False):
+    """
+    Decode a result file's content. Opposed to CustomDecoder, the JSON is parsed into plain dictionaries first and the
+    results are built afterwards following the schema of the result file, instead of probing each object's keys.
+
+    :param json_string: JSON array of records, as written by the test benches
+    :param result_class: Class of the results. If not given, it's derived from the first record.
+    :param columnar: True, if a GridResultTable shall be handed back instead of a list of records
+    :return: The records or the table
+    """
+    records = json.loads(json_string)
+    if not isinstance(records, list):
+        raise ValueError("A result file has to hold a JSON array of records.")
+    if columnar:
+        return decode_columns(records, result_class)
+    return decode_records(records, result_class)
+
+
+def load(file_path: str, result_class: type = None, columnar: bool = False):
+    """
+    Read and decode a result file (cf. loads)
+
+    :param file_path: Path to the result file
+    :param result_class: Class of the results. If not given, it's derived from the first record.
+    :param columnar: True, if a GridResultTable shall be handed back instead of a list of records
+    :return: The records or the table
+    """
+    with open(file_path, "r") as file_to_read:
+        return loads(file_to_read.read(), result_class, columnar)
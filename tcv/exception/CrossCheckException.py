@@ -0,0 +1,6 @@
+class CrossCheckException(Exception):
+    message: str
+
+    def __init__(self, *args):
+        if len(args) > 0:
+            self.message = str(args[0])
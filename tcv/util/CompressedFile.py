@@ -0,0 +1,80 @@
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+
+# Mapping from file extension to the function, that opens such a compressed file
+COMPRESSIONS = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open
+}
+
+
+def find_file(file_path: str) -> str:
+    """
+    Find a file either uncompressed or compressed with one of the supported compressions (cf. COMPRESSIONS), e.g.
+    'node_res.csv' or 'node_res.csv.xz'. The uncompressed file takes precedence.
+
+    :param file_path: Path to the uncompressed file
+    :return: Path to the present file or None, if there is none
+    """
+    for candidate in [file_path] + [file_path + extension for extension in COMPRESSIONS]:
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def open_text(file_path: str, mode: str = 'r'):
+    """
+    Open a text file, that may be compressed. The compression is derived from the file's extension and the content is
+    decompressed on the fly while reading.
+
+    :param file_path: Path to the file
+    :param mode: 'r' to read or 'w' to write
+    :return: The file object
+    """
+    extension = os.path.splitext(file_path)[1]
+    if extension in COMPRESSIONS:
+        return COMPRESSIONS[extension](file_path, mode=mode + 't', newline='')
+    return open(file_path, mode=mode, newline='')
+
+
+def recompress(directory: str, compression: str = '.xz', keep: bool = False, suffix: str = '.csv') -> list:
+    """
+    Compress all files with the given suffix within a directory tree. Files, that are already compressed in another
+    way, are recompressed. Each file is written to a temporary file first and only replaces the original, when it's
+    complete. Hidden directories (e.g. the parsed tables of TimeSeriesResult) are skipped.
+
+    :param directory: Root of the directory tree
+    :param compression: Extension of the target compression (cf. COMPRESSIONS)
+    :param keep: True, if the original files shall be kept
+    :param suffix: Suffix of the uncompressed files
+    :return: Tuples of original path, compressed path, original size and compressed size
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError("Unsupported compression '%s'. Choose one of %s." % (compression, list(COMPRESSIONS)))
+    out = []
+    for root, directories, files in os.walk(directory):
+        directories[:] = sorted(name for name in directories if not name.startswith('.'))
+        for file_name in sorted(files):
+            source = os.path.join(root, file_name)
+            extension = os.path.splitext(file_name)[1]
+            if file_name.endswith(suffix):
+                target = source + compression
+            elif extension in COMPRESSIONS and extension != compression and file_name[:-len(extension)].endswith(
+                    suffix):
+                target = source[:-len(extension)] + compression
+            else:
+                continue
+            temporary = target + ".tmp"
+            source_open = COMPRESSIONS.get(extension, open)
+            with source_open(source, 'rb') as file_to_read:
+                with COMPRESSIONS[compression](temporary, 'wb') as file_to_write:
+                    shutil.copyfileobj(file_to_read, file_to_write, 1 << 20)
+            os.replace(temporary, target)
+            out.append((source, target, os.path.getsize(source), os.path.getsize(target)))
+            if not keep:
+                os.remove(source)
+    return out
@@ -1,11 +1,10 @@
 import csv
-import json
 import os
 import re
 
 import numpy as np
 
-from tcv.encoder import CustomDecoder
+from tcv.encoder import SchemaDecoder
 
 
 def write_three_winding_results(result_json_path: str, csv_file_path: str, p_nom_mv_mw: float, p_nom_lv_mw: float):
@@ -19,9 +18,7 @@ def write_three_winding_results(result_json_path: str, csv_file_path: str, p_nom
     """
     if os.path.exists(result_json_path):
         # The result file exists. Read it and use it
-        with open(result_json_path, "r") as file_to_read:
-            json_string = file_to_read.read()
-            results = json.loads(json_string, object_hook=CustomDecoder.custom_decode)
+        results = SchemaDecoder.load(result_json_path)
 
         # Go through the result dict and convert the dict
         csv_results = [_convert_dict(origin_dict, p_nom_mv_mw, p_nom_lv_mw) for origin_dict in results]
@@ -82,9 +79,7 @@ def write_for_pgf_surf_plot(p_mv_tick_num: int, p_mv_rated_mw: float, p_lv_tick_
     """
     if os.path.exists(result_json_path):
         # The result file exists. Read it and use it
-        with open(result_json_path, "r") as file_to_read:
-            json_string = file_to_read.read()
-            results = json.loads(json_string, object_hook=CustomDecoder.custom_decode)
+        results = SchemaDecoder.load(result_json_path)
 
         # Preparing the x and y axis with a meshed grid
         p_mv_range = np.linspace(-1.0, 1.0, p_mv_tick_num)
@@ -146,9 +141,7 @@ def write_for_pgf_line_plot(p_lv_tick_num: int, p_lv_rated_mw: float, tap_range:
     """
     if os.path.exists(result_json_path):
         # The result file exists. Read it and use it
-        with open(result_json_path, "r") as file_to_read:
-            json_string = file_to_read.read()
-            results = json.loads(json_string, object_hook=CustomDecoder.custom_decode)
+        results = SchemaDecoder.load(result_json_path)
 
         # Preparing the x and y axis with a meshed grid
         p_lv_range = np.linspace(-1.0, 1.0, p_lv_tick_num)
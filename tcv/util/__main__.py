@@ -0,0 +1,59 @@
+"""
+Command line interface to the utilities:
+
+    python -m tcv.util recompress <directory> [--compression .xz] [--keep]
+    python -m tcv.util archive <json file> <archive directory>
+    python -m tcv.util unarchive <archive directory> <json file>
+"""
+
+import argparse
+import sys
+
+from tcv.calculation.result.ResultArchive import archive_to_json, json_to_archive
+from tcv.util.CompressedFile import COMPRESSIONS, recompress
+
+
+def main(argv: list = None) -> int:
+    """
+    Entry point of the command line interface
+
+    Parameters:
+        argv (list): Command line arguments without the program's name
+
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(prog="python -m tcv.util", description="Utilities for result files")
+    commands = parser.add_subparsers(dest="command", required=True)
+    recompress_parser = commands.add_parser("recompress", help="Compress all csv files within a directory tree")
+    recompress_parser.add_argument("directory", help="Root of the directory tree, e.g. 'results'")
+    recompress_parser.add_argument("--compression", default=".xz", choices=list(COMPRESSIONS),
+                                   help="Target compression")
+    recompress_parser.add_argument("--keep", action="store_true", help="Keep the original files")
+    archive_parser = commands.add_parser("archive", help="Convert a JSON result file into a binary archive")
+    archive_parser.add_argument("json_path", help="JSON result file, e.g. 'results/simona_vs_pandapower.json'")
+    archive_parser.add_argument("directory", help="Directory of the archive")
+    unarchive_parser = commands.add_parser("unarchive", help="Convert a binary archive into a JSON result file")
+    unarchive_parser.add_argument("directory", help="Directory of the archive")
+    unarchive_parser.add_argument("json_path", help="JSON result file to write")
+    arguments = parser.parse_args(argv)
+
+    if arguments.command == "recompress":
+        recompressed = recompress(arguments.directory, compression=arguments.compression, keep=arguments.keep)
+        for source, target, source_size, target_size in recompressed:
+            print("%s -> %s (%i -> %i bytes)" % (source, target, source_size, target_size))
+        total_source = sum(entry[2] for entry in recompressed)
+        total_target = sum(entry[3] for entry in recompressed)
+        print("Recompressed %i files, %i -> %i bytes" % (len(recompressed), total_source, total_target))
+    elif arguments.command == "archive":
+        archive = json_to_archive(arguments.json_path, arguments.directory)
+        print("Archived %i results of %i tap positions into %s" % (len(archive), len(archive.tap_positions()),
+                                                                  arguments.directory))
+    elif arguments.command == "unarchive":
+        archive_to_json(arguments.directory, arguments.json_path)
+        print("Wrote %s" % arguments.json_path)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,52 @@
+from numpy.testing import assert_allclose
+
+from tcv.calculation.pandapower import AdmittanceCache as AdmittanceCacheModule
+from tcv.calculation.pandapower.AdmittanceCache import AdmittanceCache
+from tcv.calculation.pandapower import TestGrid
+from tcv.calculation.pandapower.TwoWindingTestBench import TwoWindingTestBench
+
+
+def test_cached_sweep_equals_ordinary_sweep():
+    """
+    Test, if a sweep with cached admittances yields the same results as the ordinary sweep and only misses the cache
+    once per tap position
+    """
+    expected = TwoWindingTestBench(setup_logging=False).calculate(tap_min=-1, tap_max=1, p_step=5)
+    bench = TwoWindingTestBench(setup_logging=False)
+    actual = bench.calculate(tap_min=-1, tap_max=1, p_step=5, cache_admittances=True)
+    assert bench.admittance_cache.misses == 3
+    assert bench.admittance_cache.hits == 12
+    for field in ['v_lv_pu', 'v_ang_lv_degree', 'p_hv_kw', 'q_hv_kvar', 'i_mag_hv_a', 'p_lv_kw', 'i_mag_lv_a']:
+        assert_allclose([getattr(entry['result'], field) for entry in actual],
+                        [getattr(entry['result'], field) for entry in expected], atol=1e-4)
+
+
+def test_least_recently_used_configuration_is_evicted():
+    """
+    Test, if the least recently used configuration is evicted, as soon as the cache is full
+    """
+    cache = AdmittanceCache(max_size=2)
+    net = TestGrid.test_grid_three_winding(sn_mva=300.0)
+    for tap_pos in [0, 1, 0, 2, 0, 1]:
+        TestGrid.set_operating_point_three_winding(net, tap_pos=tap_pos, p_mv_mw=50.0, p_lv_mw=10.0)
+        cache.runpp(net, key=(tap_pos,))
+    # 0 and 1 are missed, 0 is hit, 2 is missed and evicts 1, 0 is hit and 1 is missed again
+    assert cache.misses == 4
+    assert cache.hits == 2
+    assert len(cache) == 2
+
+
+def test_cache_is_disabled_without_pandapower_internals(monkeypatch):
+    """
+    Test, if every power flow is run by pandapower, if the installed version lacks the internals of the cache
+    """
+    monkeypatch.setattr(AdmittanceCacheModule, 'AVAILABLE', False)
+    cache = AdmittanceCache()
+    net = TestGrid.test_grid_three_winding(sn_mva=300.0)
+    for tap_pos in [0, 0]:
+        TestGrid.set_operating_point_three_winding(net, tap_pos=tap_pos, p_mv_mw=50.0, p_lv_mw=10.0)
+        cache.runpp(net, key=(tap_pos,))
+        assert net.converged
+    assert cache.misses == 2
+    assert cache.hits == 0
+    assert len(cache) == 0
@@ -0,0 +1,121 @@
+import os
+
+import pandapower as pp
+import pytest
+from numpy.testing import assert_allclose
+
+from tcv.calculation.pandapower.ThreeWindingTestBench import ThreeWindingTestBench
+from tcv.calculation.result.GridResultThreeWinding import GridResultThreeWinding
+from tcv.calculation.sink.Checkpoint import Checkpoint, parameter_hash
+
+
+def test_resume_only_calculates_missing_operating_points(tmp_path):
+    """
+    Test, if a resumed sweep only calculates the operating points, that are missing in the checkpoint, and still
+    yields the same results as a sweep in one go
+    """
+    reference = ThreeWindingTestBench(setup_logging=False)
+    expected = reference.calculate(tap_min=-1, tap_max=1, p_step=3)
+
+    # Abort the sweep after the first tap position has been finished
+    bench = ThreeWindingTestBench(setup_logging=False)
+    records = bench.iter_calculate(tap_min=-1, tap_max=1, p_step=3, checkpoint_directory=str(tmp_path))
+    first_tap_amount = sum(1 for entry in expected if entry['tap_pos'] == -1)
+    for _ in range(first_tap_amount):
+        next(records)
+    records.close()
+
+    bench = ThreeWindingTestBench(setup_logging=False)
+    actual = bench.calculate(tap_min=-1, tap_max=1, p_step=3, checkpoint_directory=str(tmp_path), resume=True)
+    assert [(entry['tap_pos'], entry['p_mv'], entry['p_lv']) for entry in actual] == \
+           [(entry['tap_pos'], entry['p_mv'], entry['p_lv']) for entry in expected]
+    assert bench.iterations[:first_tap_amount] == [0] * first_tap_amount
+    assert bench.iterations[first_tap_amount:] == reference.iterations[first_tap_amount:]
+    for field in GridResultThreeWinding.FIELDS:
+        assert_allclose([getattr(entry['result'], field) for entry in actual],
+                        [getattr(entry['result'], field) for entry in expected], atol=1e-9)
+
+
+def test_resume_within_tap_position(tmp_path, monkeypatch):
+    """
+    Test, if the operating points, that have been completed before a sweep crashes in the middle of a tap position,
+    are persisted and only the remaining ones are calculated when resuming
+    """
+    reference = ThreeWindingTestBench(setup_logging=False)
+    expected = reference.calculate(tap_min=0, tap_max=0, p_step=3, fast_extraction=True)
+    assert len(expected) > 5
+
+    runpp = pp.runpp
+    calls = []
+
+    def _crashing_runpp(net, **kwargs):
+        if len(calls) == 5:
+            raise RuntimeError("Power flow crashed")
+        calls.append(1)
+        runpp(net, **kwargs)
+
+    monkeypatch.setattr(pp, 'runpp', _crashing_runpp)
+    with pytest.raises(RuntimeError):
+        ThreeWindingTestBench(setup_logging=False).calculate(tap_min=0, tap_max=0, p_step=3, fast_extraction=True,
+                                                             checkpoint_directory=str(tmp_path), checkpoint_every=2)
+    monkeypatch.setattr(pp, 'runpp', runpp)
+
+    bench = ThreeWindingTestBench(setup_logging=False)
+    actual = bench.calculate(tap_min=0, tap_max=0, p_step=3, fast_extraction=True, checkpoint_directory=str(tmp_path),
+                             resume=True, checkpoint_every=2)
+    assert bench.iterations[:4] == [0] * 4
+    assert bench.iterations[4:] == reference.iterations[4:]
+    assert [(entry['tap_pos'], entry['p_mv'], entry['p_lv']) for entry in actual] == \
+           [(entry['tap_pos'], entry['p_mv'], entry['p_lv']) for entry in expected]
+    for field in GridResultThreeWinding.FIELDS:
+        assert_allclose([getattr(entry['result'], field) for entry in actual],
+                        [getattr(entry['result'], field) for entry in expected], atol=1e-9)
+
+
+def test_checkpoint_is_tied_to_parameters(tmp_path):
+    """
+    Test, if a checkpoint of a sweep with other parameters isn't picked up
+    """
+    reference = ThreeWindingTestBench(setup_logging=False)
+    reference.calculate(tap_min=0, tap_max=0, p_step=3, checkpoint_directory=str(tmp_path))
+    bench = ThreeWindingTestBench(setup_logging=False)
+    bench.calculate(tap_min=0, tap_max=0, p_step=3, with_main_field_losses=True, checkpoint_directory=str(tmp_path),
+                    resume=True)
+    assert sum(bench.iterations) > 0
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_checkpoint_ignores_incomplete_line(tmp_path):
+    """
+    Test, if a record, that has only partly been written, is ignored
+    """
+    checkpoint = Checkpoint(str(tmp_path), {'p_step': 3}, ('tap_pos', 'p_mv', 'p_lv'), GridResultThreeWinding)
+    record = {'tap_pos': 0, 'p_mv': 0, 'p_lv': 100.0, 'result': GridResultThreeWinding(v_mv_pu=1.0)}
+    checkpoint.store(0, [record])
+    with open(os.path.join(checkpoint.path, "tap_0.jsonl"), "a") as file_to_write:
+        file_to_write.write('{"tap_pos": 0, "p_mv": 0, "p_l')
+
+    completed = checkpoint.load(0)
+    assert list(completed.keys()) == [(0, 0, 100.0)]
+    assert completed[(0, 0, 100.0)]['result'].v_mv_pu == 1.0
+    assert checkpoint.key == parameter_hash({'p_step': 3})
+
+
+def test_store_after_incomplete_line(tmp_path):
+    """
+    Test, if records stored after a crash while storing start on a new line, so that the checkpoint stays readable
+    """
+    checkpoint = Checkpoint(str(tmp_path), {'p_step': 3}, ('tap_pos', 'p_mv', 'p_lv'), GridResultThreeWinding)
+    first = {'tap_pos': 0, 'p_mv': 0, 'p_lv': 100.0, 'result': GridResultThreeWinding(v_mv_pu=1.0)}
+    second = {'tap_pos': 0, 'p_mv': 0, 'p_lv': 200.0, 'result': GridResultThreeWinding(v_mv_pu=0.9)}
+    checkpoint.store(0, [first])
+    file_path = os.path.join(checkpoint.path, "tap_0.jsonl")
+    with open(file_path, "a") as file_to_write:
+        file_to_write.write('{"tap_pos": 0, "p_mv": 0, "p_l')
+    checkpoint.store(0, [second])
+    assert list(checkpoint.load(0).keys()) == [(0, 0, 100.0), (0, 0, 200.0)]
+
+    # A line, that has been merged with a partial one before, is ignored instead of failing every resume
+    with open(file_path, "a") as file_to_write:
+        file_to_write.write('{"tap_pos": 0, "p_mv": 0, "p_l{"tap_pos": 0}\n')
+    assert list(checkpoint.load(0).keys()) == [(0, 0, 100.0), (0, 0, 200.0)]
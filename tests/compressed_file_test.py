@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+from conftest import NODE_A, NODE_B, NODE_C, LOAD_MV, LOAD_LV
+from tcv.calculation.powersystemdatamodel import ResultCollector
+from tcv.util.CompressedFile import find_file, recompress
+from tcv.util.__main__ import main
+
+
+@pytest.mark.parametrize("compression", [".gz", ".bz2", ".xz"])
+def test_compressed_results_are_read_transparently(tmp_path, simona_output, compression):
+    """
+    Test, if compressed result files yield the same results as the uncompressed ones
+    """
+    plain, compressed = os.path.join(tmp_path, "plain"), os.path.join(tmp_path, "compressed")
+    for directory in (plain, compressed):
+        simona_output(directory, tap_pos=0, powers=[(0.0, 0.0), (1.0, -1.0)])
+    recompressed = recompress(compressed, compression=compression)
+    assert len(recompressed) == 3
+    assert find_file(os.path.join(compressed, "node_res.csv")) == os.path.join(compressed, "node_res.csv" +
+                                                                                compression)
+
+    arguments = (NODE_A, NODE_B, NODE_C, LOAD_MV, LOAD_LV, 380.0, 110.0, 30.0)
+    expected = ResultCollector.collect({0: plain}, *arguments)
+    for actual in (ResultCollector.collect({0: compressed}, *arguments),
+                   list(ResultCollector.stream_collect({0: compressed}, *arguments))):
+        assert [(entry['p_mv'], entry['p_lv'], vars(entry['result'])) for entry in actual] == \
+               [(entry['p_mv'], entry['p_lv'], vars(entry['result'])) for entry in expected]
+
+
+def test_recompress_command(tmp_path, simona_output, capsys):
+    """
+    Test, if a result tree is recompressed from the command line, also if it has already been compressed otherwise
+    """
+    simona_output(os.path.join(tmp_path, "examination_tap_0"), tap_pos=0, powers=[0.0, 1.0], three_winding=False)
+    assert main(["recompress", str(tmp_path), "--compression", ".gz"]) == 0
+    assert "Recompressed 3 files" in capsys.readouterr().out
+    assert main(["recompress", str(tmp_path)]) == 0
+    assert sorted(os.listdir(os.path.join(tmp_path, "examination_tap_0"))) == ["load_res.csv.xz", "node_res.csv.xz",
+                                                                               "transformer_2_w_res.csv.xz"]
+    results = ResultCollector.collect_two_winding(os.path.join(tmp_path, "examination_tap_*"), NODE_A, NODE_B,
+                                                  LOAD_LV, 110.0, 10.0)
+    assert [entry['p_lv'] for entry in results] == [0.0, 1.0]
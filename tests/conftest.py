@@ -0,0 +1,109 @@
+import os
+import uuid
+
+import pytest
+
+from tcv.calculation.result.GridResultThreeWinding import GridResultThreeWinding
+from tcv.calculation.result.GridResultTwoWinding import GridResultTwoWinding
+
+NODE_A = uuid.UUID("00000000-0000-0000-0000-00000000000a")
+NODE_B = uuid.UUID("00000000-0000-0000-0000-00000000000b")
+NODE_C = uuid.UUID("00000000-0000-0000-0000-00000000000c")
+LOAD_MV = uuid.UUID("00000000-0000-0000-0000-0000000000b1")
+LOAD_LV = uuid.UUID("00000000-0000-0000-0000-0000000000c1")
+TRANSFORMER = uuid.UUID("00000000-0000-0000-0000-0000000000f1")
+
+# Seconds between two operating points
+STEP_SECONDS = 3600
+
+
+def _time(seconds: int) -> str:
+    return "2020-01-01T%02i:%02i:%02iZ[UTC]" % (seconds // 3600, seconds // 60 % 60, seconds % 60)
+
+
+def _write(file_path: str, header: list, rows: list):
+    with open(file_path, "w") as file_to_write:
+        file_to_write.write(",".join(header) + "\n")
+        for row in rows:
+            file_to_write.write(",".join(str(value) for value in row) + "\n")
+
+
+def write_simona_output(directory: str, tap_pos: int, powers: list, three_winding: bool = True):
+    """
+    Write a small SIMONA output of the test bench. The loads' results are written at the full hour, the power flow
+    results one tick (second) later, as SIMONA does.
+
+    :param directory: Directory to write the files to
+    :param tap_pos: Position of the tap changer
+    :param powers: Operating points. Tuples of medium and low voltage active power for three winding transformers,
+        low voltage active power for two winding transformers.
+    :param three_winding: True, if the output of the three winding test bench shall be written
+    """
+    os.makedirs(directory, exist_ok=True)
+    nodes = (NODE_A, NODE_B, NODE_C) if three_winding else (NODE_A, NODE_B)
+    loads, node_rows, transformer_rows = [], [], []
+    for step, power in enumerate(powers):
+        load_time, pf_time = _time(step * STEP_SECONDS), _time(step * STEP_SECONDS + 1)
+        if three_winding:
+            loads.append([uuid.uuid4(), load_time, LOAD_MV, power[0], 0.0])
+            loads.append([uuid.uuid4(), load_time, LOAD_LV, power[1], 0.0])
+        else:
+            loads.append([uuid.uuid4(), load_time, LOAD_LV, power, 0.0])
+        for index, node in enumerate(nodes):
+            node_rows.append([uuid.uuid4(), pf_time, node, -float(index + step), 1.0 - 0.01 * (index + step)])
+        transformer_rows.append([uuid.uuid4(), pf_time, TRANSFORMER, 1.0 * step, 2.0 * step] +
+                                ([3.0 * step] if three_winding else []) + [10.0 + step, 5.0 + step] +
+                                ([7.5 + step] if three_winding else []) + [tap_pos])
+    _write(os.path.join(directory, "load_res.csv"), ["uuid", "time", "input_model", "p", "q"], loads)
+    _write(os.path.join(directory, "node_res.csv"), ["uuid", "time", "input_model", "v_ang", "v_mag"], node_rows)
+    if three_winding:
+        _write(os.path.join(directory, "transformer_3_w_res.csv"),
+               ["uuid", "time", "input_model", "i_a_ang", "i_b_ang", "i_c_ang", "i_a_mag", "i_b_mag", "i_c_mag",
+                "tap_pos"], transformer_rows)
+    else:
+        _write(os.path.join(directory, "transformer_2_w_res.csv"),
+               ["uuid", "time", "input_model", "i_a_ang", "i_b_ang", "i_a_mag", "i_b_mag", "tap_pos"],
+               transformer_rows)
+
+
+def grid_result_records(three_winding: bool = False, tap_positions: tuple = (-1, 0, 1),
+                        p_lv: tuple = (-0.5, 0.0, 0.5), p_mv: tuple = None, offset: float = 0.0) -> list:
+    """
+    Build the records of a small sweep, as the test benches hand them back. Each result field is
+    offset + idx * tap_pos + p_mv / 1000 + p_lv, with idx being the field's position, so that the fields differ from
+    each other and from one operating point to the next.
+
+    :param three_winding: True, if three winding results shall be built
+    :param tap_positions: Tap positions of the sweep
+    :param p_lv: Low voltage active powers of the sweep
+    :param p_mv: Medium voltage active powers of the sweep. If not given, the three winding records are built with
+        p_mv = -p_lv instead of all combinations.
+    :param offset: Value added to all result fields
+    :return: The records in the order of tap position, medium and low voltage active power
+    """
+    result_class = GridResultThreeWinding if three_winding else GridResultTwoWinding
+    if not three_winding:
+        operating_points = [(0.0, power) for power in p_lv]
+    elif p_mv is None:
+        operating_points = [(-power, power) for power in p_lv]
+    else:
+        operating_points = [(mv, lv) for mv in p_mv for lv in p_lv]
+    records = []
+    for tap_pos in tap_positions:
+        for mv, lv in operating_points:
+            record = {'tap_pos': tap_pos}
+            if three_winding:
+                record['p_mv'] = mv
+            record['p_lv'] = lv
+            record['result'] = result_class(*(offset + idx * tap_pos + mv / 1000 + lv for idx in
+                                              range(len(result_class.FIELDS))))
+            records.append(record)
+    return records
+
+
+@pytest.fixture
+def simona_output():
+    """
+    Factory to write SIMONA output of the test bench (cf. write_simona_output)
+    """
+    return write_simona_output
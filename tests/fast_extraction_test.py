@@ -0,0 +1,37 @@
+from numpy.testing import assert_allclose
+
+from tcv.calculation.pandapower.ThreeWindingTestBench import ThreeWindingTestBench
+from tcv.calculation.pandapower.TwoWindingTestBench import TwoWindingTestBench
+from tcv.calculation.result.GridResultThreeWinding import GridResultThreeWinding
+from tcv.calculation.result.GridResultTwoWinding import GridResultTwoWinding
+
+
+def assert_same_results(actual: list, expected: list, fields: tuple):
+    assert len(actual) == len(expected)
+    for field in fields:
+        assert_allclose([getattr(entry['result'], field) for entry in actual],
+                        [getattr(entry['result'], field) for entry in expected], atol=1e-9)
+
+
+def test_two_winding_fast_extraction():
+    """
+    Test, if reading the results from pandapower's internal arrays yields the same results as the result tables
+    """
+    expected = TwoWindingTestBench(setup_logging=False).calculate(tap_min=-1, tap_max=1, p_step=5)
+    actual = TwoWindingTestBench(setup_logging=False).calculate(tap_min=-1, tap_max=1, p_step=5,
+                                                                fast_extraction=True)
+    assert_same_results(actual, expected, GridResultTwoWinding.FIELDS)
+
+
+def test_three_winding_fast_extraction():
+    """
+    Test, if reading the results from pandapower's internal arrays yields the same results as the result tables, also
+    if the result tables aren't written at all due to cached admittances
+    """
+    expected = ThreeWindingTestBench(setup_logging=False).calculate(tap_min=-1, tap_max=1, p_step=3,
+                                                                    with_main_field_losses=True,
+                                                                    cache_admittances=True)
+    actual = ThreeWindingTestBench(setup_logging=False).calculate(tap_min=-1, tap_max=1, p_step=3,
+                                                                  with_main_field_losses=True,
+                                                                  cache_admittances=True, fast_extraction=True)
+    assert_same_results(actual, expected, GridResultThreeWinding.FIELDS)
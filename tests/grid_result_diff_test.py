@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from conftest import grid_result_records
+from tcv.calculation.result import GridResultThreeWinding as ThreeWindingModule
+from tcv.calculation.result.GridResultDiff import diff_results
+from tcv.calculation.result.GridResultTable import GridResultTableThreeWinding, table_from_records
+
+
+def _records(offset: float = 0.0, noise: float = 0.0) -> list:
+    records = grid_result_records(three_winding=True, p_mv=(-150.0, 0.0, 150.0), p_lv=(-50.0, 0.0, 50.0),
+                                  offset=offset)
+    for record in records:
+        record['p_mv'] += noise
+        record['p_lv'] -= noise
+    return records
+
+
+def test_diff_independent_of_order():
+    """
+    Test, if the differences equal the point wise subtraction, although the right hand side is ordered differently
+    and it's powers deviate slightly
+    """
+    lhs, rhs = _records(offset=0.5), _records(noise=1e-6)
+    shuffled = [rhs[idx] for idx in np.random.default_rng(4).permutation(len(rhs))]
+    diff = diff_results(lhs, shuffled)
+    assert diff.is_complete()
+    assert isinstance(diff.difference, GridResultTableThreeWinding)
+
+    expected = [ThreeWindingModule.subtract(left['result'], right['result']) for left, right in zip(lhs, rhs)]
+    actual = diff.difference.to_records()
+    assert [(entry['tap_pos'], entry['p_mv'], entry['p_lv']) for entry in actual] == \
+           [(entry['tap_pos'], entry['p_mv'], entry['p_lv']) for entry in lhs]
+    assert [vars(entry['result']) for entry in actual] == [vars(result) for result in expected]
+    assert [shuffled[idx]['p_mv'] for idx in diff.rhs_index] == [entry['p_mv'] for entry in rhs]
+
+
+def test_unmatched_rows_are_reported():
+    """
+    Test, if rows without partner are reported on both sides instead of raising an error
+    """
+    lhs, rhs = _records(), _records()
+    lhs_extra = dict(lhs[0], tap_pos=2)
+    rhs_extra = dict(rhs[0], p_lv=25.0)
+    diff = diff_results(table_from_records(lhs + [lhs_extra]), rhs[1:] + [rhs_extra])
+    assert not diff.is_complete()
+    assert len(diff.difference) == len(lhs) - 1
+    assert diff.lhs_unmatched.keys().tolist() == [[-1, -150.0, -50.0], [2, -150.0, -50.0]]
+    assert diff.rhs_unmatched.keys().tolist() == [[-1, -150.0, 25.0]]
+    assert np.all(diff.difference['v_lv_pu'] == 0.0)
+
+    empty = diff_results([], rhs)
+    assert len(empty.difference) == 0 and len(empty.rhs_unmatched) == len(rhs)
+
+
+def test_powers_within_tolerance_are_paired():
+    """
+    Test, if operating points are paired, as long as their powers differ by no more than the tolerance, also if they
+    lie on either side of a multiple of it
+    """
+    lhs, rhs = _records(), _records()
+    for entry in lhs:
+        entry['p_lv'] += 0.15 - 1e-9
+    for entry in rhs:
+        entry['p_lv'] += 0.15 + 1e-9
+    rhs[0]['p_lv'] += 0.11
+    diff = diff_results(lhs, rhs)
+    assert len(diff.difference) == len(lhs) - 1
+    assert diff.lhs_unmatched.keys().tolist() == [[lhs[0]['tap_pos'], lhs[0]['p_mv'], lhs[0]['p_lv']]]
+    assert diff.rhs_unmatched.keys().tolist() == [[rhs[0]['tap_pos'], rhs[0]['p_mv'], rhs[0]['p_lv']]]
+
+    # The closer one of two candidates is chosen
+    diff = diff_results(lhs[:1], [dict(lhs[0], p_lv=lhs[0]['p_lv'] + 0.08), dict(lhs[0], p_lv=lhs[0]['p_lv'] - 0.02)])
+    assert diff.rhs_index.tolist() == [1]
+
+
+def test_non_positive_tolerance_is_refused():
+    """
+    Test, if a tolerance, that isn't positive, is refused instead of bucketing by an infinite width
+    """
+    for tolerance in (0.0, -0.1, float('nan')):
+        with pytest.raises(ValueError):
+            diff_results(_records(), _records(), tolerance=tolerance)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from conftest import grid_result_records
+from tcv.calculation.result import GridResultThreeWinding as ThreeWindingModule
+from tcv.calculation.result import GridResultTwoWinding as TwoWindingModule
+from tcv.calculation.result.GridResultTable import table_from_records, GridResultTableTwoWinding, \
+    GridResultTableThreeWinding
+
+
+def test_round_trip():
+    """
+    Test, if records are turned into a table and back without alteration
+    """
+    for three_winding in (False, True):
+        records = grid_result_records(three_winding=three_winding)
+        table = table_from_records(records)
+        assert isinstance(table, GridResultTableThreeWinding if three_winding else GridResultTableTwoWinding)
+        assert len(table) == 9
+        assert table['tap_pos'].dtype == np.int64
+        actual = table.to_records()
+        assert [{key: value for key, value in entry.items() if key != 'result'} for entry in actual] == \
+               [{key: value for key, value in entry.items() if key != 'result'} for entry in records]
+        assert [vars(entry['result']) for entry in actual] == [vars(entry['result']) for entry in records]
+
+
+def test_subtract_equals_subtraction_of_objects():
+    """
+    Test, if the vectorized subtraction equals the subtraction of single results
+    """
+    for three_winding, module in ((False, TwoWindingModule), (True, ThreeWindingModule)):
+        lhs = grid_result_records(three_winding, offset=1.5)
+        rhs = grid_result_records(three_winding)
+        actual = table_from_records(lhs).subtract(table_from_records(rhs)).to_records()
+        expected = [module.subtract(left['result'], right['result']) for left, right in zip(lhs, rhs)]
+        assert [vars(entry['result']) for entry in actual] == [vars(result) for result in expected]
+
+    with pytest.raises(ValueError):
+        records = grid_result_records()
+        table_from_records(records).subtract(table_from_records(records)[1:])
+
+
+def test_grouping_and_selection():
+    """
+    Test, if the table is split by tap position and rows are selected by ranges of the operating point
+    """
+    table = table_from_records(grid_result_records(three_winding=True))
+    groups = table.group_by_tap()
+    assert list(groups.keys()) == [-1, 0, 1]
+    assert groups[1]['p_lv'].tolist() == [-0.5, 0.0, 0.5]
+
+    selected = table.select(tap_pos=(0, None), p_mv=(None, 0.0))
+    assert selected['tap_pos'].tolist() == [0, 0, 1, 1]
+    assert selected['p_lv'].tolist() == [0.0, 0.5, 0.0, 0.5]
+    with pytest.raises(ValueError):
+        table.select(v_lv_pu=(0.9, 1.1))
@@ -0,0 +1,32 @@
+from numpy.testing import assert_allclose
+
+from tcv.calculation.pandapower.ThreeWindingTestBench import ThreeWindingTestBench
+from tcv.calculation.vectorized.NumpyThreeWindingEngine import NumpyThreeWindingEngine
+
+
+def test_agrees_with_pandapower():
+    """
+    Test, if the batched Newton-Raphson yields the same nodal voltages as pandapower with and without main field
+    losses as well as with the tap changer at the terminal and at the star point
+    """
+    for with_main_field_losses in [False, True]:
+        for tap_at_star_point in [False, True]:
+            # The cross-check raises an exception, if any of the sampled operating points deviates
+            NumpyThreeWindingEngine(setup_logging=False).calculate_columns(
+                tap_min=-2, tap_max=2, p_step=5, with_main_field_losses=with_main_field_losses,
+                tap_at_star_point=tap_at_star_point, cross_check_samples=10)
+
+
+def test_same_operating_points_and_voltages():
+    """
+    Test, if the results are handed back in the same order and with the same nodal voltages as by the pandapower test
+    bench
+    """
+    expected = ThreeWindingTestBench(setup_logging=False).calculate(tap_min=-1, tap_max=1, p_step=3)
+    actual = NumpyThreeWindingEngine(setup_logging=False).calculate(tap_min=-1, tap_max=1, p_step=3,
+                                                                    cross_check_samples=0)
+    assert [(entry['tap_pos'], entry['p_mv'], entry['p_lv']) for entry in actual] == \
+           [(entry['tap_pos'], entry['p_mv'], entry['p_lv']) for entry in expected]
+    for field in ['v_mv_pu', 'v_ang_mv_degree', 'v_lv_pu', 'v_ang_lv_degree', 'p_hv_kw', 'p_mv_kw', 'p_lv_kw']:
+        assert_allclose([getattr(entry['result'], field) for entry in actual],
+                        [getattr(entry['result'], field) for entry in expected], atol=1e-2)
@@ -0,0 +1,33 @@
+from numpy.testing import assert_allclose
+
+from tcv.calculation.pandapower.TestGrid import TapSide, TransformerModel
+from tcv.calculation.pandapower.TwoWindingTestBench import TwoWindingTestBench
+from tcv.calculation.vectorized.NumpyTwoWindingEngine import NumpyTwoWindingEngine
+
+
+def test_agrees_with_pandapower():
+    """
+    Test, if the closed form solution yields the same nodal voltages as pandapower for every operating point and all
+    combinations of tap side and transformer model
+    """
+    for tap_side in TapSide:
+        for transformer_model in TransformerModel:
+            # The cross-check raises an exception, if any of the operating points deviates
+            NumpyTwoWindingEngine(setup_logging=False).calculate(tap_min=-2, tap_max=2, p_step=5, tap_side=tap_side,
+                                                                 transformer_model=transformer_model,
+                                                                 cross_check_samples=25)
+
+
+def test_same_operating_points_and_powers():
+    """
+    Test, if the results are handed back in the same order and with the same port powers as by the pandapower test
+    bench
+    """
+    expected = TwoWindingTestBench(setup_logging=False).calculate(tap_min=-1, tap_max=1, p_step=5)
+    actual = NumpyTwoWindingEngine(setup_logging=False).calculate(tap_min=-1, tap_max=1, p_step=5,
+                                                                  cross_check_samples=0)
+    assert [(entry['tap_pos'], entry['p_lv']) for entry in actual] == \
+           [(entry['tap_pos'], entry['p_lv']) for entry in expected]
+    for field in ['v_lv_pu', 'p_hv_kw', 'q_hv_kvar', 'p_lv_kw', 'i_mag_hv_a']:
+        assert_allclose([getattr(entry['result'], field) for entry in actual],
+                        [getattr(entry['result'], field) for entry in expected], atol=1e-5)
@@ -0,0 +1,63 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from conftest import grid_result_records
+from tcv.calculation.result.GridResultTable import GridResultTableThreeWinding
+from tcv.calculation.result.ResultArchive import ResultArchive, write_archive, json_to_archive, archive_to_json
+from tcv.encoder import SchemaDecoder
+from tcv.encoder.DictEncoder import DictEncoder
+
+
+def _records(three_winding: bool) -> list:
+    return grid_result_records(three_winding, tap_positions=(-2, 0, 3), p_lv=tuple(np.linspace(-1.0, 1.0, 5)))
+
+
+def test_json_round_trip(tmp_path):
+    """
+    Test, if a JSON result file is archived and converted back without alteration
+    """
+    for three_winding in (False, True):
+        json_path = os.path.join(tmp_path, "results.json")
+        with open(json_path, "w") as file_to_write:
+            json.dump(_records(three_winding), file_to_write, cls=DictEncoder, indent=2)
+        directory = os.path.join(tmp_path, "archive")
+        archive = json_to_archive(json_path, directory, metadata={'p_step': 5})
+        assert len(archive) == 15
+        assert archive.metadata == {'p_step': 5}
+
+        round_trip_path = os.path.join(tmp_path, "round_trip.json")
+        archive_to_json(directory, round_trip_path)
+        with open(json_path, "r") as expected, open(round_trip_path, "r") as actual:
+            assert json.load(actual) == json.load(expected)
+
+
+def test_access_by_tap_position(tmp_path):
+    """
+    Test, if the columns of one tap position are handed back as memory mapped ranges
+    """
+    records = _records(three_winding=True)
+    archive = write_archive(os.path.join(tmp_path, "archive"), reversed(records))
+    assert archive.tap_positions() == [-2, 0, 3]
+    column = archive.column('v_lv_pu', tap_pos=0)
+    assert isinstance(column, np.memmap)
+    assert column.tolist() == [entry['result'].v_lv_pu for entry in reversed(records) if entry['tap_pos'] == 0]
+    assert len(archive.column('v_lv_pu', tap_pos=1)) == 0
+
+    table = ResultArchive(os.path.join(tmp_path, "archive")).table(tap_pos=3)
+    assert isinstance(table, GridResultTableThreeWinding)
+    assert table['p_lv'].tolist() == [entry['p_lv'] for entry in reversed(records) if entry['tap_pos'] == 3]
+    with pytest.raises(ValueError):
+        archive.column('v_mv_kv')
+
+
+def test_archive_of_decoded_table(tmp_path):
+    """
+    Test, if a table decoded by SchemaDecoder is archived with all of it's columns
+    """
+    table = SchemaDecoder.loads(json.dumps(_records(three_winding=False), cls=DictEncoder), columnar=True)
+    archive = write_archive(os.path.join(tmp_path, "archive"), table)
+    for name in table.columns:
+        assert archive.column(name).tolist() == table[name].tolist()
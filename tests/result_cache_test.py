@@ -0,0 +1,97 @@
+import os
+
+from tcv.cache.ResultCache import ResultCache, simona_fingerprint, pandapower_fingerprint
+from tcv.cache.__main__ import main
+from tcv.calculation.pandapower.TestGrid import THREE_WINDING_TRANSFORMER
+from tcv.calculation.powersystemdatamodel.model.TimeSeriesResult import SIDECAR_DIRECTORY_NAME
+from tcv.calculation.result.GridResultThreeWinding import GridResultThreeWinding
+from tcv.calculation.vectorized.NumpyThreeWindingEngine import NumpyThreeWindingEngine
+
+
+def _records(tap_pos: int, amount: int = 3) -> list:
+    return [{'tap_pos': tap_pos, 'p_mv': float(idx), 'p_lv': -float(idx),
+             'result': GridResultThreeWinding(v_mv_pu=1.0 + idx, i_ang_lv_degree=-idx)} for idx in range(amount)]
+
+
+def test_records_round_trip(tmp_path):
+    """
+    Test, if cached records are handed back unaltered and only calculated once
+    """
+    cache = ResultCache(directory=str(tmp_path))
+    calculations = []
+
+    def _calculate():
+        calculations.append(1)
+        return _records(tap_pos=2)
+
+    sweep = {'p_step': 3}
+    first = cache.get_or_calculate(pandapower_fingerprint(), THREE_WINDING_TRANSFORMER, sweep, _calculate)
+    second = cache.get_or_calculate(pandapower_fingerprint(), THREE_WINDING_TRANSFORMER, sweep, _calculate)
+    assert len(calculations) == 1
+    assert [(entry['tap_pos'], entry['p_mv'], entry['p_lv']) for entry in second] == \
+           [(entry['tap_pos'], entry['p_mv'], entry['p_lv']) for entry in first]
+    assert [vars(entry['result']) for entry in second] == [vars(entry['result']) for entry in first]
+
+    cache.get_or_calculate(pandapower_fingerprint(), THREE_WINDING_TRANSFORMER, {'p_step': 5}, _calculate)
+    assert len(calculations) == 2
+
+
+def test_bench_results_are_cached(tmp_path):
+    """
+    Test, if a sweep of a test bench is addressed independently of solver options
+    """
+    cache = ResultCache(directory=str(tmp_path))
+    expected = cache.calculate(NumpyThreeWindingEngine(setup_logging=False), tap_min=0, tap_max=0, p_step=3)
+    actual = cache.calculate(NumpyThreeWindingEngine(setup_logging=False), tap_min=0, tap_max=0, p_step=3,
+                             warm_start=True)
+    assert len(cache.entries()) == 1
+    # Passing a default value explicitly addresses the same entry
+    cache.calculate(NumpyThreeWindingEngine(setup_logging=False), tap_min=0, tap_max=0, p_step=3, s_ref_mva=300.0)
+    assert len(cache.entries()) == 1
+    assert [entry['result'].v_lv_pu for entry in actual] == [entry['result'].v_lv_pu for entry in expected]
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    """
+    Test, if the least recently used entries are evicted, as soon as the size cap is exceeded
+    """
+    cache = ResultCache(directory=str(tmp_path))
+    first = cache.put("first", _records(tap_pos=0))
+    cache.put("second", _records(tap_pos=1))
+    cache.get("first")
+    cache.max_size_bytes = 2 * first['size_bytes']
+    cache.put("third", _records(tap_pos=2))
+    assert sorted(meta['key'] for meta in cache.entries()) == ["first", "third"]
+
+
+def test_simona_fingerprint_changes_with_content(tmp_path):
+    """
+    Test, if the fingerprint of a SIMONA output directory changes, when a file is rewritten
+    """
+    file_path = os.path.join(tmp_path, "NodeResult.csv")
+    with open(file_path, "w") as file_to_write:
+        file_to_write.write("uuid,v_mag\n")
+    before = simona_fingerprint(str(tmp_path))
+    with open(file_path, "a") as file_to_write:
+        file_to_write.write("a,1.0\n")
+    assert simona_fingerprint(str(tmp_path)) != before
+
+    # The parsed tables next to the result files don't belong to the output
+    after = simona_fingerprint(str(tmp_path))
+    os.makedirs(os.path.join(tmp_path, SIDECAR_DIRECTORY_NAME))
+    assert simona_fingerprint(str(tmp_path)) == after
+
+
+def test_command_line_interface(tmp_path, capsys):
+    """
+    Test, if entries can be listed, inspected and pruned from the command line
+    """
+    cache = ResultCache(directory=str(tmp_path))
+    cache.put("0123abcd", _records(tap_pos=0))
+
+    assert main(["--directory", str(tmp_path), "list"]) == 0
+    assert "0123abcd" in capsys.readouterr().out
+    assert main(["--directory", str(tmp_path), "inspect", "0123"]) == 0
+    assert '"records": 3' in capsys.readouterr().out
+    assert main(["--directory", str(tmp_path), "prune", "--all"]) == 0
+    assert cache.entries() == []
@@ -0,0 +1,95 @@
+import os
+
+import pytest
+
+from conftest import NODE_A, NODE_B, NODE_C, LOAD_MV, LOAD_LV
+from tcv.calculation.powersystemdatamodel import ResultCollector
+from tcv.exception.ResultCollectionException import ResultCollectionException
+
+
+def test_collect_three_winding(tmp_path, simona_output):
+    """
+    Test, if the power flow result one tick ahead is matched to the loads' powers of each time step
+    """
+    simona_output(os.path.join(tmp_path, "tap_0"), tap_pos=0, powers=[(0.0, 0.0), (1.0, -1.0)])
+    simona_output(os.path.join(tmp_path, "tap_1"), tap_pos=1, powers=[(0.5, 0.5)])
+    mapping = ResultCollector.tap_pos_to_base_directory(range(0, 2), os.path.join(tmp_path, "tap_%i"))
+
+    results = ResultCollector.collect(mapping, NODE_A, NODE_B, NODE_C, LOAD_MV, LOAD_LV, 380.0, 110.0, 30.0)
+    assert [(entry['tap_pos'], entry['p_mv'], entry['p_lv']) for entry in results] == [(0, 0.0, 0.0), (0, 1.0, -1.0),
+                                                                                        (1, 0.5, 0.5)]
+    assert [entry['result'].v_lv_pu for entry in results] == pytest.approx([0.98, 0.97, 0.98])
+    assert [entry['result'].v_mv_pu for entry in results] == pytest.approx([0.99, 0.98, 0.99])
+
+
+def test_collect_two_winding(tmp_path, simona_output):
+    """
+    Test, if the results of the two winding test bench are collected
+    """
+    simona_output(os.path.join(tmp_path, "tap_-1"), tap_pos=-1, powers=[0.0, -1.0], three_winding=False)
+    mapping = ResultCollector.tap_pos_to_base_directory(range(-1, 0), os.path.join(tmp_path, "tap_%i"))
+
+    results = ResultCollector.collect_two_winding(mapping, NODE_A, NODE_B, LOAD_LV, 110.0, 10.0)
+    assert [(entry['tap_pos'], entry['p_lv']) for entry in results] == [(-1, 0.0), (-1, -1.0)]
+    assert [entry['result'].v_lv_pu for entry in results] == pytest.approx([0.99, 0.98])
+
+
+def test_missing_node_result(tmp_path, simona_output):
+    """
+    Test, if a missing node result is reported
+    """
+    simona_output(str(tmp_path), tap_pos=0, powers=[0.0], three_winding=False)
+    with pytest.raises(ResultCollectionException):
+        ResultCollector.collect_two_winding({0: str(tmp_path)}, NODE_A, NODE_C, LOAD_LV, 110.0, 10.0)
+
+
+def test_discover_base_directories(tmp_path):
+    """
+    Test, if the base directories are discovered by tap position and unrelated directories are skipped
+    """
+    for name in ("examination_tap_-1", "examination_tap_10", "examination_tap_2", "examination_tap_x"):
+        os.makedirs(os.path.join(tmp_path, name))
+    mapping = ResultCollector.discover_base_directories(os.path.join(tmp_path, "examination_tap_*"))
+    assert mapping == {tap_pos: os.path.join(tmp_path, "examination_tap_%i" % tap_pos) for tap_pos in (-1, 2, 10)}
+    assert list(mapping.keys()) == [-1, 2, 10]
+    assert ResultCollector.discover_base_directories(os.path.join(tmp_path, "examination_tap_%i")) == mapping
+
+
+def test_parallel_collection_equals_serial_collection(tmp_path, simona_output):
+    """
+    Test, if the results of several worker processes are merged in ascending tap position
+    """
+    for tap_pos in (1, -2, 0):
+        simona_output(os.path.join(tmp_path, "examination_tap_%i" % tap_pos), tap_pos=tap_pos,
+                      powers=[(0.0, 0.0), (0.1 * tap_pos, 1.0)])
+    pattern = os.path.join(tmp_path, "examination_tap_*")
+
+    expected = ResultCollector.collect(pattern, NODE_A, NODE_B, NODE_C, LOAD_MV, LOAD_LV, 380.0, 110.0, 30.0)
+    actual = ResultCollector.collect(pattern, NODE_A, NODE_B, NODE_C, LOAD_MV, LOAD_LV, 380.0, 110.0, 30.0,
+                                     workers=2)
+    assert [entry['tap_pos'] for entry in actual] == [-2, -2, 0, 0, 1, 1]
+    assert [(entry['tap_pos'], entry['p_mv'], entry['p_lv'], vars(entry['result'])) for entry in actual] == \
+           [(entry['tap_pos'], entry['p_mv'], entry['p_lv'], vars(entry['result'])) for entry in expected]
+
+
+def test_streaming_collection_equals_collection(tmp_path, simona_output):
+    """
+    Test, if joining the result files in lockstep yields the same results as reading them as a whole
+    """
+    for tap_pos in (0, 1):
+        simona_output(os.path.join(tmp_path, "examination_tap_%i" % tap_pos), tap_pos=tap_pos,
+                      powers=[(0.0, 0.0), (1.0, -1.0), (0.5, 0.25)])
+        simona_output(os.path.join(tmp_path, "two_winding_tap_%i" % tap_pos), tap_pos=tap_pos,
+                      powers=[0.0, -1.0, 0.5], three_winding=False)
+
+    pattern = os.path.join(tmp_path, "examination_tap_*")
+    expected = ResultCollector.collect(pattern, NODE_A, NODE_B, NODE_C, LOAD_MV, LOAD_LV, 380.0, 110.0, 30.0)
+    actual = ResultCollector.stream_collect(pattern, NODE_A, NODE_B, NODE_C, LOAD_MV, LOAD_LV, 380.0, 110.0, 30.0)
+    assert [(entry['tap_pos'], entry['p_mv'], entry['p_lv'], vars(entry['result'])) for entry in actual] == \
+           [(entry['tap_pos'], entry['p_mv'], entry['p_lv'], vars(entry['result'])) for entry in expected]
+
+    pattern = os.path.join(tmp_path, "two_winding_tap_*")
+    expected = ResultCollector.collect_two_winding(pattern, NODE_A, NODE_B, LOAD_LV, 110.0, 10.0)
+    actual = ResultCollector.stream_collect_two_winding(pattern, NODE_A, NODE_B, LOAD_LV, 110.0, 10.0)
+    assert [(entry['tap_pos'], entry['p_lv'], vars(entry['result'])) for entry in actual] == \
+           [(entry['tap_pos'], entry['p_lv'], vars(entry['result'])) for entry in expected]
@@ -0,0 +1,58 @@
+import pickle
+
+import dateutil.parser
+
+from tcv.calculation.powersystemdatamodel.model import NodeResult, LoadResult, ParseCache
+from tcv.calculation.powersystemdatamodel.model.Transformer3WResult import Transformer3WResult
+
+
+def _load_dict(uuid: str) -> dict:
+    return {'uuid': uuid, 'time': '2020-01-01T00:00:00Z[UTC]', 'input_model': '00000000-0000-0000-0000-0000000000b1',
+            'p': '0.5', 'q': '0.0'}
+
+
+def test_results_are_slotted():
+    """
+    Test, if the results don't carry a dictionary, but still compare and print like data classes
+    """
+    result = NodeResult.NodeResult(v_mag_pu=1.0, v_ang_degree=15.0)
+    assert not hasattr(result, '__dict__')
+    assert result == NodeResult.NodeResult(uuid=result.uuid, time=result.time, input_model=result.input_model,
+                                           v_ang_degree=15.0, v_mag_pu=1.0)
+    assert result != NodeResult.NodeResult(uuid=result.uuid, time=result.time, input_model=result.input_model,
+                                           v_ang_degree=15.0, v_mag_pu=1.01)
+    assert repr(result).startswith("NodeResult(uuid=")
+    assert "v_mag_pu=1.0" in repr(result)
+    assert pickle.loads(pickle.dumps(result)) == result
+    assert Transformer3WResult(tap_pos=2).tap_pos == 2
+
+
+def test_time_stamps_and_input_models_are_interned():
+    """
+    Test, if equal time stamps and input models of different results are the same objects
+    """
+    first = LoadResult.from_dict(_load_dict('00000000-0000-0000-0000-000000000001'))
+    second = LoadResult.from_dict(_load_dict('00000000-0000-0000-0000-000000000002'))
+    assert first.time is second.time
+    assert first.input_model is second.input_model
+    assert first.uuid != second.uuid
+    assert second.p_mw == 0.5
+
+
+def test_memoized_parsing():
+    """
+    Test, if the fast path yields the same time stamps as dateutil, unusual strings are handed to dateutil and the
+    statistics count hits and misses
+    """
+    ParseCache.clear()
+    for time_string in ("2020-01-01T00:00:00Z[UTC]", "2021-12-31T23:59:59Z"):
+        assert ParseCache.parse_time(time_string) == dateutil.parser.isoparse(time_string.replace("[UTC]", ""))
+    assert ParseCache.parse_time("2020-01-01T01:00:00+01:00") == ParseCache.parse_time("2020-01-01T00:00:00Z[UTC]")
+
+    for index in range(4):
+        LoadResult.from_dict(_load_dict('00000000-0000-0000-0000-00000000000%i' % index))
+    statistics = ParseCache.statistics()
+    assert statistics['time']['misses'] == 3
+    assert statistics['time']['hits'] == 5
+    assert statistics['uuid'] == {'hits': 3, 'misses': 1, 'size': 1, 'max_size': ParseCache.MAX_UUIDS,
+                                  'hit_rate': 0.75}
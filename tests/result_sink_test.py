@@ -0,0 +1,137 @@
+import json
+import logging
+import os
+
+from numpy.testing import assert_allclose
+
+from tcv.calculation.pandapower.ResultWriter import ResultWriter
+from tcv.calculation.pandapower.ThreeWindingTestBench import ThreeWindingTestBench
+from tcv.calculation.pandapower.TwoWindingTestBench import TwoWindingTestBench
+from tcv.calculation.result.GridResultThreeWinding import GridResultThreeWinding
+from tcv.calculation.result.GridResultTwoWinding import GridResultTwoWinding
+from tcv.calculation.sink.ColumnarSink import ColumnarSink, read_columnar
+from tcv.calculation.sink.JsonLinesSink import JsonLinesSink, read_json_lines, json_lines_to_json, read_results, \
+    write_json_lines, json_to_json_lines
+from tcv.calculation.sink.ResultSink import consume
+
+
+def test_iter_calculate_equals_calculate():
+    """
+    Test, if the streamed sweep yields the same records in the same order as the ordinary one, also if the operating
+    points are walked as a serpentine chunk by chunk
+    """
+    bench = ThreeWindingTestBench(setup_logging=False)
+    expected = bench.calculate(tap_min=-1, tap_max=1, p_step=3, warm_start=True)
+    expected_iterations = bench.iterations
+    actual = list(bench.iter_calculate(tap_min=-1, tap_max=1, p_step=3, warm_start=True))
+
+    assert [(entry['tap_pos'], entry['p_mv'], entry['p_lv']) for entry in actual] == \
+           [(entry['tap_pos'], entry['p_mv'], entry['p_lv']) for entry in expected]
+    assert bench.iterations == expected_iterations
+    for field in GridResultThreeWinding.FIELDS:
+        assert_allclose([getattr(entry['result'], field) for entry in actual],
+                        [getattr(entry['result'], field) for entry in expected], atol=1e-9)
+
+
+def test_sinks_consume_stream(tmp_path):
+    """
+    Test, if all sinks write the streamed records of a two winding sweep, so that they can be read back
+    """
+    records = list(TwoWindingTestBench(setup_logging=False).iter_calculate(tap_min=0, tap_max=1, p_step=3))
+    json_lines_path = os.path.join(tmp_path, "results.jsonl")
+    columnar_directory = os.path.join(tmp_path, "columnar")
+    amount = consume(iter(records), JsonLinesSink(json_lines_path),
+                     ColumnarSink(columnar_directory, chunk_size=4),
+                     ResultWriter(rel_path=str(tmp_path) + os.sep, file_name="results.csv", p_nom_mw=0.63))
+    assert amount == len(records)
+
+    read_back = list(read_json_lines(json_lines_path))
+    assert [(entry['tap_pos'], entry['p_lv']) for entry in read_back] == \
+           [(entry['tap_pos'], entry['p_lv']) for entry in records]
+    json_path = os.path.join(tmp_path, "results.json")
+    json_lines_to_json(json_lines_path, json_path)
+    with open(json_path, "r") as file_to_read:
+        assert len(json.load(file_to_read)) == len(records)
+
+    columns = read_columnar(columnar_directory)
+    assert columns['tap_pos'].tolist() == [entry['tap_pos'] for entry in records]
+    for field in GridResultTwoWinding.FIELDS:
+        assert_allclose(columns[field], [getattr(entry['result'], field) for entry in records])
+
+    with open(os.path.join(tmp_path, "results.csv"), "r") as file_to_read:
+        assert len(file_to_read.readlines()) == len(records) + 1
+
+
+def test_aborted_sweep_keeps_written_records(tmp_path):
+    """
+    Test, if everything written before a failure of the sweep is kept
+    """
+    records = TwoWindingTestBench(setup_logging=False).iter_calculate(tap_min=0, tap_max=1, p_step=3)
+
+    def _aborting():
+        for idx, record in enumerate(records):
+            if idx == 4:
+                raise RuntimeError("Sweep aborted")
+            yield record
+
+    json_lines_path = os.path.join(tmp_path, "results.jsonl")
+    columnar_directory = os.path.join(tmp_path, "columnar")
+    try:
+        consume(_aborting(), JsonLinesSink(json_lines_path), ColumnarSink(columnar_directory))
+    except RuntimeError:
+        pass
+
+    assert len(list(read_json_lines(json_lines_path))) == 4
+    assert len(read_columnar(columnar_directory)['p_lv']) == 4
+
+
+def test_read_by_tap_position(tmp_path):
+    """
+    Test, if JSON Lines files are filtered by tap position and JSON files are read through the same interface
+    """
+    records = list(ThreeWindingTestBench(setup_logging=False).iter_calculate(tap_min=-1, tap_max=1, p_step=3))
+    json_lines_path = os.path.join(tmp_path, "results.jsonl")
+    assert write_json_lines(iter(records), json_lines_path) == len(records)
+
+    expected = [entry for entry in records if entry['tap_pos'] in (-1, 1)]
+    actual = list(read_json_lines(json_lines_path, tap_pos=(-1, 1)))
+    assert [(entry['tap_pos'], entry['p_mv'], entry['p_lv']) for entry in actual] == \
+           [(entry['tap_pos'], entry['p_mv'], entry['p_lv']) for entry in expected]
+    assert all(isinstance(entry['result'], GridResultThreeWinding) for entry in actual)
+    assert [vars(entry['result']) for entry in actual] == [vars(entry['result']) for entry in expected]
+
+    json_path = os.path.join(tmp_path, "results.json")
+    json_lines_to_json(json_lines_path, json_path)
+    from_json = list(read_results(json_path, tap_pos=0))
+    assert [vars(entry['result']) for entry in from_json] == \
+           [vars(entry['result']) for entry in records if entry['tap_pos'] == 0]
+
+    converted_path = os.path.join(tmp_path, "converted.jsonl")
+    json_to_json_lines(json_path, converted_path)
+    assert [vars(entry['result']) for entry in read_results(converted_path)] == \
+           [vars(entry['result']) for entry in records]
+
+
+def test_last_line_without_line_break(tmp_path, caplog):
+    """
+    Test, if a complete last line without line break is read and an incomplete one is skipped with a warning
+    """
+    records = list(TwoWindingTestBench(setup_logging=False).iter_calculate(tap_min=0, tap_max=0, p_step=3))
+    json_lines_path = os.path.join(tmp_path, "results.jsonl")
+    write_json_lines(iter(records), json_lines_path)
+    with open(json_lines_path, "r") as file_to_read:
+        content = file_to_read.read()
+
+    with open(json_lines_path, "w") as file_to_write:
+        file_to_write.write(content.rstrip("\n"))
+    assert len(list(read_json_lines(json_lines_path))) == len(records)
+    json_path = os.path.join(tmp_path, "results.json")
+    json_lines_to_json(json_lines_path, json_path)
+    with open(json_path, "r") as file_to_read:
+        assert len(json.load(file_to_read)) == len(records)
+
+    with open(json_lines_path, "w") as file_to_write:
+        file_to_write.write(content.rstrip("\n")[:-10])
+    with caplog.at_level(logging.WARNING):
+        assert len(list(read_json_lines(json_lines_path))) == len(records) - 1
+    assert "incomplete last line" in caplog.text
@@ -0,0 +1,60 @@
+import json
+import os
+
+import pytest
+
+from conftest import grid_result_records
+from tcv.calculation.result.GridResultTable import GridResultTableThreeWinding, GridResultTableTwoWinding
+from tcv.calculation.result.GridResultThreeWinding import GridResultThreeWinding
+from tcv.calculation.result.GridResultTwoWinding import GridResultTwoWinding
+from tcv.encoder import CustomDecoder, SchemaDecoder
+from tcv.encoder.DictEncoder import DictEncoder
+
+
+def _json_string(three_winding: bool) -> str:
+    return json.dumps(grid_result_records(three_winding), cls=DictEncoder, indent=2)
+
+
+def test_decoding_equals_custom_decoder():
+    """
+    Test, if the schema driven decoding hands back the same records as CustomDecoder
+    """
+    for three_winding, result_class in ((False, GridResultTwoWinding), (True, GridResultThreeWinding)):
+        json_string = _json_string(three_winding)
+        expected = json.loads(json_string, object_hook=CustomDecoder.custom_decode)
+        actual = SchemaDecoder.loads(json_string)
+        assert all(type(record['result']) is result_class for record in expected)
+        assert all(type(record['result']) is result_class for record in actual)
+        assert [{key: value for key, value in record.items() if key != 'result'} for record in actual] == \
+               [{key: value for key, value in record.items() if key != 'result'} for record in expected]
+        assert [vars(record['result']) for record in actual] == [vars(record['result']) for record in expected]
+
+
+def test_columnar_decoding(tmp_path):
+    """
+    Test, if a result file is decoded into the suitable table
+    """
+    for three_winding, table_class in ((False, GridResultTableTwoWinding), (True, GridResultTableThreeWinding)):
+        json_string = _json_string(three_winding)
+        file_path = os.path.join(tmp_path, "results.json")
+        with open(file_path, "w") as file_to_write:
+            file_to_write.write(json_string)
+        table = SchemaDecoder.load(file_path, columnar=True)
+        assert isinstance(table, table_class)
+        expected = json.loads(json_string, object_hook=CustomDecoder.custom_decode)
+        assert [vars(record['result']) for record in table.to_records()] == \
+               [vars(record['result']) for record in expected]
+
+
+def test_schema_violations():
+    """
+    Test, if records, that don't follow the schema, are refused
+    """
+    records = json.loads(_json_string(three_winding=True))
+    del records[-1]['result']['p_mv_kw']
+    with pytest.raises(ValueError):
+        SchemaDecoder.decode_records(records)
+    with pytest.raises(ValueError):
+        SchemaDecoder.loads(json.dumps({'tap_pos': 0}))
+    with pytest.raises(ValueError):
+        SchemaDecoder.loads(json.dumps([{'tap_pos': 0, 'result': {'p_hv_kw': 1.0}}]))
@@ -1,7 +1,9 @@
+import numpy as np
 import pytest
 
 from tcv.calculation.powersystemdatamodel import ResultConverter
 from tcv.calculation.powersystemdatamodel.model.NodeResult import NodeResult
+from tcv.calculation.powersystemdatamodel.model.Transformer2WResult import Transformer2WResult
 from tcv.calculation.powersystemdatamodel.model.Transformer3WResult import Transformer3WResult
 
 
@@ -62,3 +64,37 @@ def test_correct_conversion():
     assert actual.i_ang_hv_degree == pytest.approx(transformer_result.i_a_ang_degree, 1e-5)
     assert actual.i_ang_mv_degree == pytest.approx(transformer_result.i_b_ang_degree, 1e-5)
     assert actual.i_ang_lv_degree == pytest.approx(transformer_result.i_c_ang_degree, 1e-5)
+
+
+def test_array_conversion_equals_scalar_conversion():
+    """
+    Tests, if the conversion of columns yields the same results as the conversion of single result models
+    """
+    rng = np.random.default_rng(42)
+    v_mag = rng.uniform(0.9, 1.1, size=(3, 10))
+    v_ang = rng.uniform(-30.0, 30.0, size=(3, 10))
+    i_mag = rng.uniform(0.0, 100.0, size=(3, 10))
+    i_ang = rng.uniform(-180.0, 180.0, size=(3, 10))
+
+    actual = ResultConverter.to_three_winding_columns(v_mag[0], v_ang[0], v_mag[1], v_ang[1], v_mag[2], v_ang[2],
+                                                      i_mag[0], i_ang[0], i_mag[1], i_ang[1], i_mag[2], i_ang[2],
+                                                      v_rated_hv=380.0, v_rated_mv=110.0, v_rated_lv=30.0)
+    actual_two_winding = ResultConverter.to_two_winding_columns(v_mag[0], v_ang[0], v_mag[2], v_ang[2], i_mag[0],
+                                                                i_ang[0], i_mag[2], i_ang[2], v_rated_hv=110.0,
+                                                                v_rated_lv=10.0)
+    for idx in range(10):
+        nodes = [NodeResult(v_mag_pu=v_mag[port, idx], v_ang_degree=v_ang[port, idx]) for port in range(3)]
+        expected = ResultConverter.to_three_winding_result(
+            *nodes, transformer_result=Transformer3WResult(
+                i_a_mag_ampere=i_mag[0, idx], i_a_ang_degree=i_ang[0, idx], i_b_mag_ampere=i_mag[1, idx],
+                i_b_ang_degree=i_ang[1, idx], i_c_mag_ampere=i_mag[2, idx], i_c_ang_degree=i_ang[2, idx]),
+            v_rated_hv=380.0, v_rated_mv=110.0, v_rated_lv=30.0)
+        for field, value in vars(expected).items():
+            assert actual[field][idx] == pytest.approx(value, rel=1e-12, abs=1e-9)
+
+        expected = ResultConverter.to_two_winding_result(
+            nodes[0], nodes[2], transformer_result=Transformer2WResult(
+                i_a_mag_ampere=i_mag[0, idx], i_a_ang_degree=i_ang[0, idx], i_b_mag_ampere=i_mag[2, idx],
+                i_b_ang_degree=i_ang[2, idx]), v_rated_hv=110.0, v_rated_lv=10.0)
+        for field, value in vars(expected).items():
+            assert actual_two_winding[field][idx] == pytest.approx(value, rel=1e-12, abs=1e-9)
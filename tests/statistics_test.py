@@ -0,0 +1,69 @@
+import numpy as np
+from numpy.testing import assert_allclose
+
+from tcv.analysis.statistics import summarize, StreamingStatistics
+from tcv.calculation.result.GridResultTable import GridResultTableThreeWinding
+from tcv.calculation.result.GridResultThreeWinding import GridResultThreeWinding
+
+
+def _table(amount: int = 2000) -> GridResultTableThreeWinding:
+    generator = np.random.default_rng(7)
+    columns = {
+        'tap_pos': generator.integers(-2, 3, amount),
+        'p_mv': generator.uniform(-300.0, 300.0, amount),
+        'p_lv': generator.uniform(-100.0, 100.0, amount)
+    }
+    columns.update({field: generator.normal(idx * 1e-3, 1e-2, amount) for idx, field in
+                    enumerate(GridResultThreeWinding.FIELDS)})
+    return GridResultTableThreeWinding(columns)
+
+
+def test_summary_equals_plain_computation():
+    """
+    Test, if the grouped reductions equal the measures computed group by group with plain NumPy
+    """
+    table = _table()
+    summary = summarize(table, by=('tap_pos',), percentiles=(0.0, 25.0, 95.0))
+    assert list(summary.keys()) == [-2, -1, 0, 1, 2]
+    for tap_pos, fields in summary.items():
+        rows = table[np.flatnonzero(table['tap_pos'] == tap_pos)]
+        for field, measures in fields.items():
+            values = rows[field]
+            assert measures['count'] == len(values)
+            assert measures['max'] == values.max() and measures['min'] == values.min()
+            assert_allclose(measures['mean'], values.mean(), rtol=1e-12)
+            assert_allclose(measures['std'], values.std(), rtol=1e-10)
+            assert_allclose(measures['rmse'], np.sqrt(np.mean(values ** 2)), rtol=1e-12)
+            assert_allclose([measures['percentiles'][q] for q in (0.0, 25.0, 95.0)],
+                            np.percentile(values, [0.0, 25.0, 95.0]), rtol=1e-12)
+            largest = np.argmax(np.abs(values))
+            assert measures['max_abs'] == abs(values[largest])
+            assert measures['argmax'] == {'tap_pos': tap_pos, 'p_mv': rows['p_mv'][largest],
+                                          'p_lv': rows['p_lv'][largest]}
+
+
+def test_bands():
+    """
+    Test, if the rows are grouped by bands of a key
+    """
+    summary = summarize(_table(), fields=('v_mv_pu',), by=('tap_pos', 'p_mv'), bands={'p_mv': 150.0})
+    assert sorted({label[1] for label in summary}) == [-300.0, -150.0, 0.0, 150.0]
+    assert sum(fields['v_mv_pu']['count'] for fields in summary.values()) == 2000
+
+
+def test_streaming_equals_in_memory():
+    """
+    Test, if the chunk wise update yields the same measures as the computation on all rows at once
+    """
+    table = _table()
+    expected = summarize(table, by=('p_mv',), bands={'p_mv': 200.0})
+    streaming = StreamingStatistics(by=('p_mv',), bands={'p_mv': 200.0})
+    assert streaming.consume(table.to_records(), chunk_size=300) == len(table)
+    actual = streaming.result()
+    assert list(actual.keys()) == list(expected.keys())
+    for label, fields in expected.items():
+        for field, measures in fields.items():
+            for name in ('count', 'max', 'min', 'max_abs', 'argmax'):
+                assert actual[label][field][name] == measures[name]
+            for name in ('mean', 'std', 'rmse'):
+                assert_allclose(actual[label][field][name], measures[name], rtol=1e-10)
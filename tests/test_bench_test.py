@@ -0,0 +1,86 @@
+import logging
+import os
+
+import pandapower as pp
+from numpy.testing import assert_allclose
+
+from tcv.calculation.pandapower import TestBench as TestBenchModule
+from tcv.calculation.pandapower import TestGrid
+from tcv.calculation.pandapower import ThreeWindingTestBench as ThreeWindingModule
+from tcv.calculation.pandapower import TwoWindingTestBench as TwoWindingModule
+from tcv.calculation.pandapower.ThreeWindingTestBench import ThreeWindingTestBench
+from tcv.calculation.pandapower.TwoWindingTestBench import TwoWindingTestBench
+from tcv.calculation.pandapower.TestGrid import TapSide, TransformerModel
+
+
+def _assert_results_equal(actual, expected):
+    for field in type(expected).FIELDS:
+        assert_allclose(getattr(actual, field), getattr(expected, field), atol=1e-9)
+
+
+def test_reused_net_equals_fresh_net():
+    """
+    Test, if moving the operating point of one net during the sweep yields the same results as building a new net per
+    operating point
+    """
+    records = TwoWindingTestBench(setup_logging=False).calculate(tap_min=-2, tap_max=2, p_step=3)
+    for record in records[::4]:
+        net = TestGrid.test_grid_two_winding(tap_pos=record['tap_pos'], p_mw=record['p_lv'], sn_mva=0.4,
+                                             tap_side=TapSide.LV)
+        pp.runpp(net, trafo_model=TransformerModel.PI.value)
+        _assert_results_equal(record['result'], TwoWindingModule.extract_results(net))
+
+    records = ThreeWindingTestBench(setup_logging=False).calculate(tap_min=-2, tap_max=2, p_step=3)
+    for record in records[::4]:
+        net = TestGrid.test_grid_three_winding(tap_pos=record['tap_pos'], p_mv_mw=record['p_mv'],
+                                               p_lv_mw=record['p_lv'], sn_mva=300.0)
+        pp.runpp(net)
+        _assert_results_equal(record['result'], ThreeWindingModule.extract_results(net))
+
+
+def test_parallel_sweep_equals_serial_sweep(tmp_path, monkeypatch):
+    """
+    Test, if distributing the tap positions among worker processes yields the same records in the same order as a
+    serial sweep
+    """
+    # The workers' log files are written to '../../../log'
+    working_directory = os.path.join(tmp_path, "a", "b", "c")
+    os.makedirs(working_directory)
+    monkeypatch.chdir(working_directory)
+    for bench_class, key_names in ((TwoWindingTestBench, ('tap_pos', 'p_lv')),
+                                   (ThreeWindingTestBench, ('tap_pos', 'p_mv', 'p_lv'))):
+        expected = bench_class(setup_logging=False).calculate(tap_min=-1, tap_max=1, p_step=3)
+        bench = bench_class(setup_logging=False)
+        actual = bench.calculate(tap_min=-1, tap_max=1, p_step=3, workers=2)
+        assert [tuple(entry[name] for name in key_names) for entry in actual] == \
+               [tuple(entry[name] for name in key_names) for entry in expected]
+        assert len(bench.iterations) == len(expected)
+        for field in type(expected[0]['result']).FIELDS:
+            assert_allclose([getattr(entry['result'], field) for entry in actual],
+                            [getattr(entry['result'], field) for entry in expected], atol=1e-9)
+
+
+def test_worker_logger_replaces_inherited_handlers(tmp_path, monkeypatch):
+    """
+    Test, if a worker only logs to it's own file instead of the handlers inherited from the parent process
+    """
+    working_directory = os.path.join(tmp_path, "a", "b", "c")
+    os.makedirs(working_directory)
+    monkeypatch.chdir(working_directory)
+    root = logging.getLogger()
+    inherited = logging.StreamHandler()
+    root.addHandler(inherited)
+    handlers = list(root.handlers)
+    try:
+        TestBenchModule._setup_worker_logger()
+        assert inherited not in root.handlers
+        assert [type(handler) for handler in root.handlers] == [logging.FileHandler]
+        assert root.handlers[0].baseFilename == os.path.join(
+            str(tmp_path), "log", "test_bench_worker_%i.log" % os.getpid())
+    finally:
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+            handler.close()
+        for handler in handlers:
+            if handler is not inherited:
+                root.addHandler(handler)
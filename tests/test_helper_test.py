@@ -0,0 +1,52 @@
+from tcv.calculation import TestHelper
+
+
+def test_operating_points_three_winding_canonical_order():
+    """
+    Test, if the operating points of a three winding sweep are given in canonical order with truncated low voltage
+    ranges
+    """
+    actual = TestHelper.operating_points_three_winding(tap_range=range(0, 1), p_mv_range_mw=[-300.0, 0.0, 300.0],
+                                                       s_nom_hv_mva=300.0, s_nom_lv_mva=100.0, p_step_lv_mw=100.0)
+    expected = [(0, -300.0, 0.0), (0, -300.0, 100.0), (0, 0.0, -100.0), (0, 0.0, 0.0), (0, 0.0, 100.0),
+                (0, 300.0, -100.0), (0, 300.0, 0.0)]
+    assert actual == expected
+
+
+def test_serpentine_order_two_levels():
+    """
+    Test, if the power sweep is reversed for every second tap position
+    """
+    operating_points = TestHelper.operating_points_two_winding(tap_range=range(-1, 2), p_range_mw=[-1.0, 0.0, 1.0])
+    actual = [operating_points[idx] for idx in TestHelper.serpentine_order(operating_points)]
+    expected = [(-1, -1.0), (-1, 0.0), (-1, 1.0), (0, 1.0), (0, 0.0), (0, -1.0), (1, -1.0), (1, 0.0), (1, 1.0)]
+    assert actual == expected
+
+
+def test_serpentine_order_three_levels():
+    """
+    Test, if consecutive operating points of a three dimensional serpentine only differ in one dimension
+    """
+    operating_points = [(tap_pos, p_mv, p_lv) for tap_pos in range(2) for p_mv in range(3) for p_lv in range(4)]
+    order = TestHelper.serpentine_order(operating_points)
+
+    assert sorted(order) == list(range(len(operating_points)))
+    for previous, current in zip(order, order[1:]):
+        changes = sum(1 for lhs, rhs in zip(operating_points[previous], operating_points[current]) if lhs != rhs)
+        assert changes == 1
+
+
+def test_serpentine_order_in_chunks():
+    """
+    Test, if walking a sweep tap position by tap position with shared directions yields the same serpentine as
+    walking the whole sweep at once
+    """
+    operating_points = [(tap_pos, p_mv, p_lv) for tap_pos in range(3) for p_mv in range(3) for p_lv in range(4)]
+    expected = [operating_points[idx] for idx in TestHelper.serpentine_order(operating_points)]
+
+    directions = [True, True, True]
+    actual = []
+    for tap_pos in range(3):
+        chunk = [point for point in operating_points if point[0] == tap_pos]
+        actual.extend(chunk[idx] for idx in TestHelper.serpentine_order(chunk, directions))
+    assert actual == expected
@@ -0,0 +1,86 @@
+import csv
+import os
+
+import numpy as np
+
+from conftest import NODE_A, NODE_B, NODE_C, LOAD_MV
+from tcv.calculation.powersystemdatamodel.model import NodeResult, LoadResult, Transformer3WResult
+from tcv.calculation.powersystemdatamodel.model.ColumnarResult import parse_times
+from tcv.calculation.powersystemdatamodel.model.TimeSeriesResult import TimeSeriesResult, SIDECAR_DIRECTORY_NAME, \
+    FINGERPRINT_FILE_NAME
+
+
+def test_columns_are_parsed_in_bulk(tmp_path, simona_output):
+    """
+    Test, if time stamps become seconds since epoch and input models categorical codes
+    """
+    simona_output(str(tmp_path), tap_pos=3, powers=[(0.0, 0.0), (1.0, -1.0)])
+    result = TimeSeriesResult(str(tmp_path))
+
+    assert result.node_table.time.dtype == np.int64
+    assert result.node_table.time.tolist() == [1577836801] * 3 + [1577840401] * 3
+    assert sorted(result.node_table.input_models) == [NODE_A, NODE_B, NODE_C]
+    assert result.node_table.columns['v_mag_pu'][result.node_table.input_model == result.node_table.code_of(
+        NODE_C)].tolist() == [0.98, 0.97]
+    assert result.load_table.columns['p_mw'][result.load_table.input_model == result.load_table.code_of(
+        LOAD_MV)].tolist() == [0.0, 1.0]
+    assert result.transformer_3w_table.columns['tap_pos'].tolist() == [3, 3]
+    assert result.transformer_2w_table is None
+    assert result.transformer_2w_results == {}
+
+
+def test_rows_equal_the_row_wise_parser(tmp_path, simona_output):
+    """
+    Test, if the lazily built row objects equal, what the row wise parsers hand back
+    """
+    simona_output(str(tmp_path), tap_pos=0, powers=[(0.5, 0.25), (1.0, -1.0), (-1.0, 1.0)])
+    result = TimeSeriesResult(str(tmp_path))
+
+    for file_name, module, actual in (("node_res.csv", NodeResult, result.node_results),
+                                      ("load_res.csv", LoadResult, result.load_results),
+                                      ("transformer_3_w_res.csv", Transformer3WResult,
+                                       result.transformer_3w_results)):
+        with open(os.path.join(tmp_path, file_name), "r") as file_to_read:
+            expected = [module.from_dict(dct) for dct in csv.DictReader(file_to_read)]
+        assert [row for rows in actual.values() for row in rows] == expected
+
+
+def test_time_stamps_with_offset():
+    """
+    Test, if time stamps, that Python's own ISO parser doesn't understand, are parsed anyway
+    """
+    assert parse_times(["2020-01-01T01:00:00+01:00", "2020-01-01T00:00:00Z[UTC]", "20200101T000000Z"]).tolist() == [
+        1577836800] * 3
+
+
+def test_parsed_tables_are_reused_until_a_file_changes(tmp_path, simona_output):
+    """
+    Test, if the parsed tables are mapped into memory from the sidecar directory and parsed again, as soon as a result
+    file changes
+    """
+    simona_output(str(tmp_path), tap_pos=0, powers=[(0.0, 0.0), (1.0, -1.0)])
+    parsed = TimeSeriesResult(str(tmp_path))
+    assert os.path.exists(os.path.join(tmp_path, SIDECAR_DIRECTORY_NAME, FINGERPRINT_FILE_NAME))
+    assert not isinstance(parsed.node_table.time, np.memmap)
+
+    reloaded = TimeSeriesResult(str(tmp_path))
+    assert isinstance(reloaded.node_table.time, np.memmap)
+    assert reloaded.transformer_2w_table is None
+    assert [row for rows in reloaded.node_results.values() for row in rows] == \
+           [row for rows in parsed.node_results.values() for row in rows]
+    assert [row for rows in reloaded.transformer_3w_results.values() for row in rows] == \
+           [row for rows in parsed.transformer_3w_results.values() for row in rows]
+
+    simona_output(str(tmp_path), tap_pos=5, powers=[(0.0, 0.0), (1.0, -1.0), (0.5, 0.5)])
+    changed = TimeSeriesResult(str(tmp_path))
+    assert not isinstance(changed.node_table.time, np.memmap)
+    assert changed.transformer_3w_table.columns['tap_pos'].tolist() == [5, 5, 5]
+
+
+def test_sidecar_is_optional(tmp_path, simona_output):
+    """
+    Test, if the sidecar directory is neither written nor read, if caching is disabled
+    """
+    simona_output(str(tmp_path), tap_pos=0, powers=[(0.0, 0.0)])
+    TimeSeriesResult(str(tmp_path), cache=False)
+    assert not os.path.exists(os.path.join(tmp_path, SIDECAR_DIRECTORY_NAME))